@@ -1,18 +1,34 @@
 """Build Environment used for isolation during sdist building
 """
 
+import hashlib
+import json
 import logging
 import os
 import pathlib
+import shutil
 import site
 import sys
+import tempfile
 import textwrap
 from collections import OrderedDict
 from types import TracebackType
-from typing import TYPE_CHECKING, Iterable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pip._vendor.certifi import where
 from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.tags import interpreter_name, interpreter_version
+from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import Version
 
 from pip import __file__ as pip_location
@@ -27,6 +43,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+BUILD_ENV_JSON_NAME = "build-env.json"
+
 
 def _dedup(a: str, b: str) -> Union[Tuple[str], Tuple[str, str]]:
     return (a, b) if a != b else (a,)
@@ -57,6 +75,12 @@ def get_runnable_pip() -> str:
     return os.fsdecode(source / "__pip-runner__.py")
 
 
+def _normalize_requirement(req_str: str) -> str:
+    req = Requirement(req_str)
+    req.name = canonicalize_name(req.name)
+    return str(req)
+
+
 def _get_system_sitepackages() -> Set[str]:
     """Get system site packages
 
@@ -78,30 +102,40 @@ def _get_system_sitepackages() -> Set[str]:
 
 
 class BuildEnvironment:
-    """Creates and manages an isolated environment to install build deps"""
+    """Creates and manages an isolated environment to install build deps
 
-    def __init__(self) -> None:
+    :param cache_dir: The root of the cache. If given, build dependencies are
+        installed into environments kept in the cache, which are shared by all
+        builds that install the same requirements.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
         temp_dir = TempDirectory(kind=tempdir_kinds.BUILD_ENV, globally_managed=True)
 
+        self._cache_dir = cache_dir or None
         self._prefixes = OrderedDict(
             (name, _Prefix(os.path.join(temp_dir.path, name)))
             for name in ("normal", "overlay")
         )
 
-        self._bin_dirs: List[str] = []
-        self._lib_dirs: List[str] = []
-        for prefix in reversed(list(self._prefixes.values())):
-            self._bin_dirs.append(prefix.bin_dir)
-            self._lib_dirs.extend(prefix.lib_dirs)
-
         # Customize site to:
         # - ensure .pth files are honored
         # - prevent access to system site packages
-        system_sites = _get_system_sitepackages()
+        self._system_sites = _get_system_sitepackages()
 
         self._site_dir = os.path.join(temp_dir.path, "site")
         if not os.path.exists(self._site_dir):
             os.mkdir(self._site_dir)
+        self._update_paths()
+
+    def _update_paths(self) -> None:
+        """Point the environment at the current location of its prefixes."""
+        self._bin_dirs: List[str] = []
+        self._lib_dirs: List[str] = []
+        for prefix in reversed(list(self._prefixes.values())):
+            self._bin_dirs.append(prefix.bin_dir)
+            self._lib_dirs.extend(prefix.lib_dirs)
+
         with open(
             os.path.join(self._site_dir, "sitecustomize.py"), "w", encoding="utf-8"
         ) as fp:
@@ -131,29 +165,35 @@ class BuildEnvironment:
                     assert not path in sys.path
                     site.addsitedir(path)
                 """
-                ).format(system_sites=system_sites, lib_dirs=self._lib_dirs)
+                ).format(system_sites=self._system_sites, lib_dirs=self._lib_dirs)
             )
 
-    def __enter__(self) -> None:
-        self._save_env = {
-            name: os.environ.get(name, None)
-            for name in ("PATH", "PYTHONNOUSERSITE", "PYTHONPATH")
-        }
+    def get_environ(self) -> Dict[str, str]:
+        """Return the environment variables that activate this environment.
 
+        These are the changes __enter__() makes to os.environ. They can also
+        be applied to subprocesses only, with subprocess_environ().
+        """
         path = self._bin_dirs[:]
-        old_path = self._save_env["PATH"]
+        old_path = os.environ.get("PATH")
         if old_path:
             path.extend(old_path.split(os.pathsep))
 
         pythonpath = [self._site_dir]
 
-        os.environ.update(
-            {
-                "PATH": os.pathsep.join(path),
-                "PYTHONNOUSERSITE": "1",
-                "PYTHONPATH": os.pathsep.join(pythonpath),
-            }
-        )
+        return {
+            "PATH": os.pathsep.join(path),
+            "PYTHONNOUSERSITE": "1",
+            "PYTHONPATH": os.pathsep.join(pythonpath),
+        }
+
+    def __enter__(self) -> None:
+        self._save_env = {
+            name: os.environ.get(name, None)
+            for name in ("PATH", "PYTHONNOUSERSITE", "PYTHONPATH")
+        }
+
+        os.environ.update(self.get_environ())
 
     def __exit__(
         self,
@@ -214,6 +254,14 @@ class BuildEnvironment:
         prefix.setup = True
         if not requirements:
             return
+        # Requirements on URLs are not cached, as their target may change.
+        if self._cache_dir is not None and not any(
+            Requirement(req_str).url for req_str in requirements
+        ):
+            self._install_shared_requirements(
+                finder, requirements, prefix_as_string, kind=kind
+            )
+            return
         self._install_requirements(
             get_runnable_pip(),
             finder,
@@ -222,27 +270,73 @@ class BuildEnvironment:
             kind=kind,
         )
 
-    @staticmethod
-    def _install_requirements(
-        pip_runnable: str,
+    def _install_shared_requirements(
+        self,
         finder: "PackageFinder",
         requirements: Iterable[str],
-        prefix: _Prefix,
+        prefix_as_string: str,
         *,
         kind: str,
     ) -> None:
-        args: List[str] = [
-            sys.executable,
-            pip_runnable,
-            "install",
-            "--ignore-installed",
-            "--no-user",
-            "--prefix",
-            prefix.path,
-            "--no-warn-script-location",
-        ]
-        if logger.getEffectiveLevel() <= logging.DEBUG:
-            args.append("-v")
+        """Use a prefix from the cache that has the requirements installed.
+
+        The prefix is installed into the cache first if no earlier build
+        installed the same requirements with the same interpreter and index
+        options. Prefixes in the cache are never modified once they exist.
+        """
+        assert self._cache_dir is not None
+        normalized = sorted({_normalize_requirement(r) for r in requirements})
+        key_parts = {
+            "interpreter_name": interpreter_name(),
+            "interpreter_version": interpreter_version(),
+            "executable": sys.executable,
+            "finder_options": self._get_finder_args(finder),
+            "requirements": normalized,
+        }
+        key = hashlib.sha224(
+            json.dumps(key_parts, sort_keys=True, ensure_ascii=True).encode("ascii")
+        ).hexdigest()
+        root = os.path.join(self._cache_dir, "build-envs")
+        path = os.path.join(root, key)
+
+        if os.path.isdir(path):
+            logger.info("Using cached %s", kind)
+        else:
+            os.makedirs(root, exist_ok=True)
+            # Install next to the final location, and move the prefix there
+            # only once it is complete, so that no build can see it half-done.
+            temp_path = tempfile.mkdtemp(prefix=".tmp-", dir=root)
+            try:
+                self._install_requirements(
+                    get_runnable_pip(),
+                    finder,
+                    normalized,
+                    _Prefix(temp_path),
+                    kind=kind,
+                )
+                with open(
+                    os.path.join(temp_path, BUILD_ENV_JSON_NAME), "w", encoding="utf-8"
+                ) as f:
+                    json.dump({"requirements": normalized}, f)
+                try:
+                    os.rename(temp_path, path)
+                except OSError:
+                    # Another pip process installed the same requirements
+                    # concurrently; use theirs.
+                    if not os.path.isdir(path):
+                        raise
+            finally:
+                shutil.rmtree(temp_path, ignore_errors=True)
+
+        prefix = _Prefix(path)
+        prefix.setup = True
+        self._prefixes[prefix_as_string] = prefix
+        self._update_paths()
+
+    @staticmethod
+    def _get_finder_args(finder: "PackageFinder") -> List[str]:
+        """Get the pip options that make a subprocess find what finder does."""
+        args: List[str] = []
         for format_control in ("no_binary", "only_binary"):
             formats = getattr(finder.format_control, format_control)
             args.extend(
@@ -268,6 +362,30 @@ class BuildEnvironment:
             args.append("--pre")
         if finder.prefer_binary:
             args.append("--prefer-binary")
+        return args
+
+    @staticmethod
+    def _install_requirements(
+        pip_runnable: str,
+        finder: "PackageFinder",
+        requirements: Iterable[str],
+        prefix: _Prefix,
+        *,
+        kind: str,
+    ) -> None:
+        args: List[str] = [
+            sys.executable,
+            pip_runnable,
+            "install",
+            "--ignore-installed",
+            "--no-user",
+            "--prefix",
+            prefix.path,
+            "--no-warn-script-location",
+        ]
+        if logger.getEffectiveLevel() <= logging.DEBUG:
+            args.append("-v")
+        args.extend(BuildEnvironment._get_finder_args(finder))
         args.append("--")
         args.extend(requirements)
         extra_environ = {"_PIP_STANDALONE_CERT": where()}
@@ -286,6 +404,9 @@ class NoOpBuildEnvironment(BuildEnvironment):
     def __init__(self) -> None:
         pass
 
+    def get_environ(self) -> Dict[str, str]:
+        return {}
+
     def __enter__(self) -> None:
         pass
 
@@ -5,6 +5,7 @@ import hashlib
 import json
 import logging
 import os
+import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -15,6 +16,9 @@ from pip._internal.exceptions import InvalidWheelFilename
 from pip._internal.models.direct_url import DirectUrl
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.hashes import FAVORITE_HASH, Hashes
+from pip._internal.utils.misc import ensure_dir
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 from pip._internal.utils.urls import path_to_url
 
@@ -290,3 +294,111 @@ class WheelCache(Cache):
                         download_info.url,
                     )
         origin_path.write_text(download_info.to_json(), encoding="utf-8")
+
+
+class MetadataCache:
+    """A cache of the core metadata of distributions, so that dependencies
+    can be resolved without fetching the metadata again.
+
+    Entries are keyed by the URL and hash of a link, so that the metadata of
+    links without a hash is never cached.
+
+    :param cache_dir: The root of the cache.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        super().__init__()
+        assert not cache_dir or os.path.isabs(cache_dir)
+        self.cache_dir = cache_dir or None
+
+    def get_path_for_link(self, link: Link) -> Optional[str]:
+        """Return the file to store the metadata of link in, if cacheable."""
+        if not self.cache_dir or link.hash_name is None or link.hash is None:
+            return None
+        hashed = _hash_dict(
+            {"url": link.url_without_fragment, link.hash_name: link.hash}
+        )
+        parts = [hashed[:2], hashed[2:4], hashed[4:6], hashed[6:]]
+        return os.path.join(self.cache_dir, "metadata", *parts)
+
+    def get(self, link: Link) -> Optional[bytes]:
+        """Return the cached contents of the METADATA file of link, if any."""
+        path = self.get_path_for_link(link)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def save(self, link: Link, metadata_contents: bytes) -> None:
+        """Store the contents of the METADATA file of link."""
+        path = self.get_path_for_link(link)
+        # The hash in the key pins the contents, so entries never change.
+        if path is None or os.path.exists(path):
+            return
+        try:
+            ensure_dir(os.path.dirname(path))
+            with adjacent_tmp_file(path) as f:
+                f.write(metadata_contents)
+            replace(f.name, path)
+        except OSError as e:
+            logger.debug("Could not cache metadata of %s: %s", link, e)
+
+
+class ArtifactCache:
+    """A store of downloaded archives, keyed by their sha256 digest.
+
+    An archive is found again by its digest wherever it is linked from, so a
+    file fetched through one index or mirror is not fetched again through
+    another. Only archives that were checked against a known-good digest are
+    stored.
+
+    :param cache_dir: The root of the cache.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        super().__init__()
+        assert not cache_dir or os.path.isabs(cache_dir)
+        self.cache_dir = cache_dir or None
+
+    def get_path_for_digest(self, digest: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        parts = [digest[:2], digest[2:4], digest[4:6], digest[6:]]
+        return os.path.join(self.cache_dir, "artifacts", *parts)
+
+    def get(self, hashes: Hashes) -> Optional[str]:
+        """Return the stored archive matching one of hashes, if any."""
+        for digest in hashes.digests(FAVORITE_HASH):
+            path = self.get_path_for_digest(digest)
+            if path is not None and os.path.isfile(path):
+                return path
+        return None
+
+    def save(self, path: str, digest: str) -> None:
+        """Store the archive at path, whose sha256 digest has been checked."""
+        dest = self.get_path_for_digest(digest)
+        # The digest pins the contents, so entries never change.
+        if dest is None or os.path.exists(dest):
+            return
+        try:
+            ensure_dir(os.path.dirname(dest))
+            try:
+                # A link appears at once, with the complete contents.
+                os.link(path, dest)
+            except FileExistsError:
+                pass
+            except OSError:
+                with open(path, "rb") as src, adjacent_tmp_file(dest) as f:
+                    shutil.copyfileobj(src, f)
+                replace(f.name, dest)
+        except OSError as e:
+            logger.debug("Could not store %s in the artifact cache: %s", path, e)
+
+    def remove(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -10,8 +10,6 @@ import traceback
 from optparse import Values
 from typing import Any, Callable, List, Optional, Tuple
 
-from pip._vendor.rich import traceback as rich_traceback
-
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.command_context import CommandContextMixIn
 from pip._internal.cli.parser import ConfigOptionParser, UpdatingDefaultsHelpFormatter
@@ -229,6 +227,8 @@ class Command(CommandContextMixIn):
             if not options.debug_mode:
                 run = intercepts_unhandled_exc(self.run)
             else:
+                from pip._vendor.rich import traceback as rich_traceback
+
                 run = self.run
                 rich_traceback.install(show_locals=True)
             return run(options, args)
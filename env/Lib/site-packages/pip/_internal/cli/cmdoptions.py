@@ -15,7 +15,14 @@ import logging
 import os
 import textwrap
 from functools import partial
-from optparse import SUPPRESS_HELP, Option, OptionGroup, OptionParser, Values
+from optparse import (
+    SUPPRESS_HELP,
+    Option,
+    OptionGroup,
+    OptionParser,
+    OptionValueError,
+    Values,
+)
 from textwrap import dedent
 from typing import Any, Callable, Dict, Optional, Tuple
 
@@ -107,11 +114,22 @@ def _package_name_option_check(option: Option, opt: str, value: str) -> str:
     return canonicalize_name(value)
 
 
+def _positive_int_option_check(option: Option, opt: str, value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise OptionValueError(f"option {opt}: invalid integer value: {value!r}")
+    if number < 1:
+        raise OptionValueError(f"option {opt}: must be at least 1, got {number}")
+    return number
+
+
 class PipOption(Option):
-    TYPES = Option.TYPES + ("path", "package_name")
+    TYPES = Option.TYPES + ("path", "package_name", "positive_int")
     TYPE_CHECKER = Option.TYPE_CHECKER.copy()
     TYPE_CHECKER["package_name"] = _package_name_option_check
     TYPE_CHECKER["path"] = _path_option_check
+    TYPE_CHECKER["positive_int"] = _positive_int_option_check
 
 
 ###########
@@ -231,6 +249,17 @@ progress_bar: Callable[..., Option] = partial(
     help="Specify whether the progress bar should be used [on, off] (default: on)",
 )
 
+download_workers: Callable[..., Option] = partial(
+    PipOption,
+    "--download-workers",
+    dest="download_workers",
+    metavar="n",
+    type="positive_int",
+    default=1,
+    help="Maximum number of distribution files to download in parallel "
+    "(default %default).",
+)
+
 log: Callable[..., Option] = partial(
     PipOption,
     "--log",
@@ -351,6 +380,31 @@ index_url: Callable[..., Option] = partial(
 )
 
 
+index_workers: Callable[..., Option] = partial(
+    PipOption,
+    "--index-workers",
+    dest="index_workers",
+    metavar="n",
+    type="positive_int",
+    default=1,
+    help="Number of threads used to fetch index pages in parallel, ahead of "
+    "the resolver or to look up the latest versions of installed packages "
+    "(default %default, which fetches them one by one).",
+)
+
+
+race_indexes: Callable[..., Option] = partial(
+    Option,
+    "--race-indexes",
+    dest="race_indexes",
+    action="store_true",
+    default=False,
+    help="Fetch the page of a project from all package indexes at once. "
+    "How fast and reliable each index host is gets remembered in the cache "
+    "directory, and hosts that keep failing are skipped for a while.",
+)
+
+
 def extra_index_url() -> Option:
     return Option(
         "--extra-index-url",
@@ -752,6 +806,17 @@ no_build_isolation: Callable[..., Option] = partial(
     "if this option is used.",
 )
 
+reuse_build_env: Callable[..., Option] = partial(
+    Option,
+    "--reuse-build-env",
+    dest="reuse_build_env",
+    action="store_true",
+    default=False,
+    help="Keep isolated build environments in the cache directory, and reuse "
+    "them for builds with the same build dependencies. Build dependencies "
+    "that are not pinned are not upgraded until the cache is purged.",
+)
+
 check_build_deps: Callable[..., Option] = partial(
     Option,
     "--check-build-dependencies",
@@ -870,6 +935,51 @@ global_options: Callable[..., Option] = partial(
     "call before the install or bdist_wheel command.",
 )
 
+compile_workers: Callable[..., Option] = partial(
+    PipOption,
+    "--compile-workers",
+    dest="compile_workers",
+    metavar="n",
+    type="positive_int",
+    default=1,
+    help="Maximum number of processes used to compile Python source files "
+    "to bytecode (default %default, which compiles in-process).",
+)
+
+install_workers: Callable[..., Option] = partial(
+    PipOption,
+    "--install-workers",
+    dest="install_workers",
+    metavar="n",
+    type="positive_int",
+    default=1,
+    help="Maximum number of wheels to install in parallel (default %default). "
+    "Only wheels that do not depend on each other and do not write the same "
+    "files are installed at the same time.",
+)
+
+build_jobs: Callable[..., Option] = partial(
+    PipOption,
+    "--build-jobs",
+    dest="build_jobs",
+    metavar="n",
+    type="positive_int",
+    default=1,
+    help="Maximum number of wheels to build in parallel (default %default). "
+    "The output of each build is shown once it finishes.",
+)
+
+installed_index: Callable[..., Option] = partial(
+    Option,
+    "--installed-index",
+    dest="installed_index",
+    action="store_true",
+    default=False,
+    help="Create an index of the distributions in the installation directory, "
+    "which makes listing them faster. An index that already exists is kept "
+    "up to date by every install and uninstall.",
+)
+
 no_clean: Callable[..., Option] = partial(
     Option,
     "--no-clean",
@@ -1070,5 +1180,7 @@ index_group: Dict[str, Any] = {
         extra_index_url,
         no_index,
         find_links,
+        index_workers,
+        race_indexes,
     ],
 }
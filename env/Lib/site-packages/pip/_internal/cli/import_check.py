@@ -0,0 +1,101 @@
+"""Check that pip's lightweight commands do not import heavy modules.
+
+Commands such as ``pip --version`` and ``pip list`` start quickly because the
+modules needed to talk to an index, or to build or install something, are only
+imported where they are used. A single module-level import can undo that, so
+run ``python -m pip._internal.cli.import_check`` after moving imports around.
+It runs each of those commands in a fresh interpreter, reports how long it
+took, and exits with a non-zero status if it imported any deferred module.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+# Commands that only look at the local environment and configuration.
+LIGHTWEIGHT_COMMANDS = [
+    ["--version"],
+    ["list"],
+    ["freeze"],
+    ["config", "list"],
+]
+
+# Modules (and their submodules) those commands must not import. This leaves
+# out rich.traceback, which is imported by the rich logging handler that pip
+# logs through.
+DEFERRED_MODULES = [
+    "pip._vendor.distlib",
+    "pip._vendor.pkg_resources",
+    "pip._vendor.requests",
+    "pip._vendor.tenacity",
+]
+
+# Run pip from the given directory, and write the names of the modules it
+# imported to the given file on exit.
+_CHILD_SCRIPT = """
+import atexit, json, sys
+sys.path.insert(0, sys.argv[1])
+def dump():
+    with open(sys.argv[2], "w") as f:
+        json.dump(sorted(sys.modules), f)
+atexit.register(dump)
+from pip._internal.cli.main import main
+sys.exit(main(sys.argv[3:]))
+"""
+
+
+def get_deferred_modules() -> List[str]:
+    from pip._internal.metadata import _should_use_importlib_metadata
+
+    if _should_use_importlib_metadata():
+        return DEFERRED_MODULES
+    # The pkg_resources backend needs it to list distributions.
+    return [m for m in DEFERRED_MODULES if m != "pip._vendor.pkg_resources"]
+
+
+def find_imported(args: List[str], deferred: List[str]) -> List[str]:
+    """Run pip with args, and return the deferred modules it imported."""
+    pip_parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    fd, modules_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        subprocess.run(
+            [sys.executable, "-c", _CHILD_SCRIPT, pip_parent_dir, modules_path]
+            + args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        with open(modules_path, encoding="utf-8") as f:
+            modules = json.load(f)
+    finally:
+        os.unlink(modules_path)
+    return [
+        d
+        for d in deferred
+        if any(module == d or module.startswith(d + ".") for module in modules)
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    commands = [argv] if argv else LIGHTWEIGHT_COMMANDS
+    deferred = get_deferred_modules()
+    status = 0
+    for args in commands:
+        start = time.perf_counter()
+        imported = find_imported(args, deferred)
+        elapsed = time.perf_counter() - start
+        print(f"pip {' '.join(args)}: {elapsed:.2f}s")
+        for module in imported:
+            print(f"  imports {module}")
+        if imported:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
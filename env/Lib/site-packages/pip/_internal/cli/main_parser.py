@@ -6,7 +6,6 @@ import subprocess
 import sys
 from typing import List, Optional, Tuple
 
-from pip._internal.build_env import get_runnable_pip
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.parser import ConfigOptionParser, UpdatingDefaultsHelpFormatter
 from pip._internal.commands import commands_dict, get_similar_commands
@@ -87,6 +86,9 @@ def parse_command(args: List[str]) -> Tuple[str, List[str]]:
                 f"Could not locate Python interpreter {general_options.python}"
             )
 
+        # The build environment machinery is only needed here.
+        from pip._internal.build_env import get_runnable_pip
+
         pip_cmd = [
             interpreter,
             get_runnable_pip(),
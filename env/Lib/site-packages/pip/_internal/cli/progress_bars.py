@@ -1,5 +1,15 @@
+import contextlib
 import functools
-from typing import Callable, Generator, Iterable, Iterator, Optional, Tuple
+import threading
+from typing import (
+    Callable,
+    ContextManager,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
 
 from pip._vendor.rich.progress import (
     BarColumn,
@@ -17,6 +27,9 @@ from pip._vendor.rich.progress import (
 from pip._internal.utils.logging import get_indentation
 
 DownloadProgressRenderer = Callable[[Iterable[bytes]], Iterator[bytes]]
+BatchDownloadProgressRenderer = Callable[
+    [Iterable[bytes], Optional[int]], Iterator[bytes]
+]
 
 
 def _rich_progress_bar(
@@ -66,3 +79,63 @@ def get_download_progress_renderer(
         return functools.partial(_rich_progress_bar, bar_type=bar_type, size=size)
     else:
         return iter  # no-op, when passed an iterator
+
+
+@contextlib.contextmanager
+def _rich_batch_progress_bar(
+    *,
+    bar_type: str,
+    count: int,
+) -> Generator[BatchDownloadProgressRenderer, None, None]:
+    assert bar_type == "on", "This should only be used in the default mode."
+
+    columns = (
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TextColumn("eta"),
+        TimeRemainingColumn(),
+    )
+    progress = Progress(*columns, refresh_per_second=30)
+    description = " " * (get_indentation() + 2) + f"{count} files"
+    task_id = progress.add_task(description, total=0)
+
+    # Sizes are only known once each response arrives, so the total grows as
+    # downloads start; the lock keeps concurrent updates from racing.
+    lock = threading.Lock()
+    total = 0
+
+    def renderer(iterable: Iterable[bytes], size: Optional[int]) -> Iterator[bytes]:
+        nonlocal total
+        if size:
+            with lock:
+                total += size
+                progress.update(task_id, total=total)
+        for chunk in iterable:
+            yield chunk
+            progress.update(task_id, advance=len(chunk))
+
+    with progress:
+        yield renderer
+
+
+def _no_batch_progress(
+    iterable: Iterable[bytes], size: Optional[int]
+) -> Iterator[bytes]:
+    return iter(iterable)
+
+
+def get_batch_download_progress_renderer(
+    *, bar_type: str, count: int
+) -> ContextManager[BatchDownloadProgressRenderer]:
+    """Get a context manager rendering one aggregated progress display for
+    several concurrent downloads.
+
+    The context manager yields a callable that wraps each download's chunk
+    iterable, given the expected size of that download (if known).
+    """
+    if bar_type == "on":
+        return _rich_batch_progress_bar(bar_type=bar_type, count=count)
+    else:
+        return contextlib.nullcontext(_no_batch_progress)
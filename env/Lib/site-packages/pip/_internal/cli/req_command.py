@@ -12,38 +12,26 @@ from functools import partial
 from optparse import Values
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
-from pip._internal.cache import WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.command_context import CommandContextMixIn
 from pip._internal.exceptions import CommandError, PreviousBuildDirError
-from pip._internal.index.collector import LinkCollector
-from pip._internal.index.package_finder import PackageFinder
-from pip._internal.models.selection_prefs import SelectionPreferences
-from pip._internal.models.target_python import TargetPython
-from pip._internal.network.session import PipSession
-from pip._internal.operations.build.build_tracker import BuildTracker
-from pip._internal.operations.prepare import RequirementPreparer
-from pip._internal.req.constructors import (
-    install_req_from_editable,
-    install_req_from_line,
-    install_req_from_parsed_requirement,
-    install_req_from_req_string,
-)
-from pip._internal.req.req_file import parse_requirements
-from pip._internal.req.req_install import InstallRequirement
-from pip._internal.resolution.base import BaseResolver
-from pip._internal.self_outdated_check import pip_self_version_check
-from pip._internal.utils.temp_dir import (
-    TempDirectory,
-    TempDirectoryTypeRegistry,
-    tempdir_kinds,
-)
+from pip._internal.utils.temp_dir import tempdir_kinds
 from pip._internal.utils.virtualenv import running_under_virtualenv
 
 if TYPE_CHECKING:
     from ssl import SSLContext
 
+    from pip._internal.cache import WheelCache
+    from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.models.target_python import TargetPython
+    from pip._internal.network.session import PipSession
+    from pip._internal.operations.build.build_tracker import BuildTracker
+    from pip._internal.operations.prepare import RequirementPreparer
+    from pip._internal.req.req_install import InstallRequirement
+    from pip._internal.resolution.base import BaseResolver
+    from pip._internal.utils.temp_dir import TempDirectory, TempDirectoryTypeRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,7 +64,7 @@ class SessionCommandMixin(CommandContextMixIn):
 
     def __init__(self) -> None:
         super().__init__()
-        self._session: Optional[PipSession] = None
+        self._session: Optional["PipSession"] = None
 
     @classmethod
     def _get_index_urls(cls, options: Values) -> Optional[List[str]]:
@@ -92,7 +80,7 @@ class SessionCommandMixin(CommandContextMixIn):
         # Return None rather than an empty list
         return index_urls or None
 
-    def get_default_session(self, options: Values) -> PipSession:
+    def get_default_session(self, options: Values) -> "PipSession":
         """Get a default-managed session."""
         if self._session is None:
             self._session = self.enter_context(self._build_session(options))
@@ -108,7 +96,12 @@ class SessionCommandMixin(CommandContextMixIn):
         retries: Optional[int] = None,
         timeout: Optional[int] = None,
         fallback_to_certifi: bool = False,
-    ) -> PipSession:
+    ) -> "PipSession":
+        # The network stack is heavy to import, and only loaded when used.
+        from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
+
+        from pip._internal.network.session import PipSession
+
         cache_dir = options.cache_dir
         assert not cache_dir or os.path.isabs(cache_dir)
 
@@ -128,6 +121,12 @@ class SessionCommandMixin(CommandContextMixIn):
             trusted_hosts=options.trusted_hosts,
             index_urls=self._get_index_urls(options),
             ssl_context=ssl_context,
+            # Keep a connection alive for every thread sharing the session.
+            pool_maxsize=max(
+                DEFAULT_POOLSIZE,
+                getattr(options, "download_workers", 1),
+                getattr(options, "index_workers", 1),
+            ),
         )
 
         # Handle custom ca-bundles from the user
@@ -176,19 +175,10 @@ class IndexGroupCommand(Command, SessionCommandMixin):
         if options.disable_pip_version_check or options.no_index:
             return
 
+        from pip._internal.self_outdated_check import pip_self_version_check
+
         # Otherwise, check if we're using the latest version of pip available.
-        session = self._build_session(
-            options,
-            retries=0,
-            timeout=min(5, options.timeout),
-            # This is set to ensure the function does not fail when truststore is
-            # specified in use-feature but cannot be loaded. This usually raises a
-            # CommandError and shows a nice user-facing error, but this function is not
-            # called in that try-except block.
-            fallback_to_certifi=True,
-        )
-        with session:
-            pip_self_version_check(session, options)
+        pip_self_version_check(options)
 
 
 KEEPABLE_TEMPDIR_TYPES = [
@@ -233,7 +223,7 @@ def with_cleanup(func: Any) -> Any:
     directories.
     """
 
-    def configure_tempdir_registry(registry: TempDirectoryTypeRegistry) -> None:
+    def configure_tempdir_registry(registry: "TempDirectoryTypeRegistry") -> None:
         for t in KEEPABLE_TEMPDIR_TYPES:
             registry.set_delete(t, False)
 
@@ -273,18 +263,21 @@ class RequirementCommand(IndexGroupCommand):
     @classmethod
     def make_requirement_preparer(
         cls,
-        temp_build_dir: TempDirectory,
+        temp_build_dir: "TempDirectory",
         options: Values,
-        build_tracker: BuildTracker,
-        session: PipSession,
-        finder: PackageFinder,
+        build_tracker: "BuildTracker",
+        session: "PipSession",
+        finder: "PackageFinder",
         use_user_site: bool,
         download_dir: Optional[str] = None,
         verbosity: int = 0,
-    ) -> RequirementPreparer:
+    ) -> "RequirementPreparer":
         """
         Create a RequirementPreparer instance for the given parameters.
         """
+        from pip._internal.cache import ArtifactCache, MetadataCache
+        from pip._internal.operations.prepare import RequirementPreparer
+
         temp_build_dir_path = temp_build_dir.path
         assert temp_build_dir_path is not None
         legacy_resolver = False
@@ -314,9 +307,13 @@ class RequirementCommand(IndexGroupCommand):
             download_dir=download_dir,
             build_isolation=options.build_isolation,
             check_build_deps=options.check_build_deps,
+            build_env_cache_dir=options.cache_dir if options.reuse_build_env else None,
+            metadata_cache=MetadataCache(options.cache_dir),
+            artifact_cache=ArtifactCache(options.cache_dir),
             build_tracker=build_tracker,
             session=session,
             progress_bar=options.progress_bar,
+            download_workers=options.download_workers,
             finder=finder,
             require_hashes=options.require_hashes,
             use_user_site=use_user_site,
@@ -328,10 +325,10 @@ class RequirementCommand(IndexGroupCommand):
     @classmethod
     def make_resolver(
         cls,
-        preparer: RequirementPreparer,
-        finder: PackageFinder,
+        preparer: "RequirementPreparer",
+        finder: "PackageFinder",
         options: Values,
-        wheel_cache: Optional[WheelCache] = None,
+        wheel_cache: Optional["WheelCache"] = None,
         use_user_site: bool = False,
         ignore_installed: bool = True,
         ignore_requires_python: bool = False,
@@ -339,10 +336,12 @@ class RequirementCommand(IndexGroupCommand):
         upgrade_strategy: str = "to-satisfy-only",
         use_pep517: Optional[bool] = None,
         py_version_info: Optional[Tuple[int, ...]] = None,
-    ) -> BaseResolver:
+    ) -> "BaseResolver":
         """
         Create a Resolver instance for the given parameters.
         """
+        from pip._internal.req.constructors import install_req_from_req_string
+
         make_install_req = partial(
             install_req_from_req_string,
             isolated=options.isolated_mode,
@@ -388,13 +387,20 @@ class RequirementCommand(IndexGroupCommand):
         self,
         args: List[str],
         options: Values,
-        finder: PackageFinder,
-        session: PipSession,
-    ) -> List[InstallRequirement]:
+        finder: "PackageFinder",
+        session: "PipSession",
+    ) -> List["InstallRequirement"]:
         """
         Parse command-line arguments into the corresponding requirements.
         """
-        requirements: List[InstallRequirement] = []
+        from pip._internal.req.constructors import (
+            install_req_from_editable,
+            install_req_from_line,
+            install_req_from_parsed_requirement,
+        )
+        from pip._internal.req.req_file import parse_requirements
+
+        requirements: List["InstallRequirement"] = []
         for filename in options.constraints:
             for parsed_req in parse_requirements(
                 filename,
@@ -469,7 +475,7 @@ class RequirementCommand(IndexGroupCommand):
         return requirements
 
     @staticmethod
-    def trace_basic_info(finder: PackageFinder) -> None:
+    def trace_basic_info(finder: "PackageFinder") -> None:
         """
         Trace basic information about the provided objects.
         """
@@ -482,16 +488,20 @@ class RequirementCommand(IndexGroupCommand):
     def _build_package_finder(
         self,
         options: Values,
-        session: PipSession,
-        target_python: Optional[TargetPython] = None,
+        session: "PipSession",
+        target_python: Optional["TargetPython"] = None,
         ignore_requires_python: Optional[bool] = None,
-    ) -> PackageFinder:
+    ) -> "PackageFinder":
         """
         Create a package finder appropriate to this requirement command.
 
         :param ignore_requires_python: Whether to ignore incompatible
             "Requires-Python" values in links. Defaults to False.
         """
+        from pip._internal.index.collector import LinkCollector
+        from pip._internal.index.package_finder import PackageFinder
+        from pip._internal.models.selection_prefs import SelectionPreferences
+
         link_collector = LinkCollector.create(session, options=options)
         selection_prefs = SelectionPreferences(
             allow_yanked=True,
@@ -6,7 +6,7 @@ import time
 from typing import IO, Generator, Optional
 
 from pip._internal.utils.compat import WINDOWS
-from pip._internal.utils.logging import get_indentation
+from pip._internal.utils.logging import get_indentation, is_capturing_logs
 
 logger = logging.getLogger(__name__)
 
@@ -118,8 +118,13 @@ def open_spinner(message: str) -> Generator[SpinnerInterface, None, None]:
     # through the logging system, but it acts like it has level INFO,
     # i.e. it's only displayed if we're at level INFO or better.
     # Non-interactive spinner goes through the logging system, so it is always
-    # in sync with logging configuration.
-    if sys.stdout.isatty() and logger.getEffectiveLevel() <= logging.INFO:
+    # in sync with logging configuration. It is also used while logs are being
+    # captured, since the captured output will only be shown later on.
+    if (
+        sys.stdout.isatty()
+        and logger.getEffectiveLevel() <= logging.INFO
+        and not is_capturing_logs()
+    ):
         spinner: SpinnerInterface = InteractiveSpinner(message)
     else:
         spinner = NonInteractiveSpinner(message)
@@ -151,6 +156,9 @@ def hidden_cursor(file: IO[str]) -> Generator[None, None, None]:
     # See https://github.com/pypa/pip/issues/3418
     elif not file.isatty() or logger.getEffectiveLevel() > logging.INFO:
         yield
+    # Nor if the output goes to logs captured for later.
+    elif is_capturing_logs():
+        yield
     else:
         file.write(HIDE_CURSOR)
         try:
@@ -4,9 +4,10 @@ Package containing all pip commands
 
 import importlib
 from collections import namedtuple
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from pip._internal.cli.base_command import Command
+if TYPE_CHECKING:
+    from pip._internal.cli.base_command import Command
 
 CommandInfo = namedtuple("CommandInfo", "module_path, class_name, summary")
 
@@ -106,7 +107,7 @@ commands_dict: Dict[str, CommandInfo] = {
 }
 
 
-def create_command(name: str, **kwargs: Any) -> Command:
+def create_command(name: str, **kwargs: Any) -> "Command":
     """
     Create an instance of the Command class with the given name.
     """
@@ -7,7 +7,9 @@ import pip._internal.utils.filesystem as filesystem
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.exceptions import CommandError, PipError
+from pip._internal.index.health import INDEX_HEALTH_FILE_NAME
 from pip._internal.utils.logging import getLogger
+from pip._internal.utils.misc import rmtree
 
 logger = getLogger(__name__)
 
@@ -91,12 +93,23 @@ class CacheCommand(Command):
             raise CommandError("Too many arguments")
 
         num_http_files = len(self._find_http_files(options))
+        num_index_page_files = len(self._find_index_page_files(options))
+        num_metadata_files = len(self._find_metadata_files(options))
+        num_artifact_files = len(self._find_artifact_files(options))
         num_packages = len(self._find_wheels(options, "*"))
 
         http_cache_location = self._cache_dir(options, "http")
         wheels_cache_location = self._cache_dir(options, "wheels")
+        index_pages_location = self._cache_dir(options, "index-pages")
+        metadata_cache_location = self._cache_dir(options, "metadata")
+        artifacts_location = self._cache_dir(options, "artifacts")
+        build_envs_location = self._cache_dir(options, "build-envs")
         http_cache_size = filesystem.format_directory_size(http_cache_location)
         wheels_cache_size = filesystem.format_directory_size(wheels_cache_location)
+        index_pages_size = filesystem.format_directory_size(index_pages_location)
+        metadata_cache_size = filesystem.format_directory_size(metadata_cache_location)
+        artifacts_size = filesystem.format_directory_size(artifacts_location)
+        build_envs_size = filesystem.format_directory_size(build_envs_location)
 
         message = (
             textwrap.dedent(
@@ -104,18 +117,40 @@ class CacheCommand(Command):
                     Package index page cache location: {http_cache_location}
                     Package index page cache size: {http_cache_size}
                     Number of HTTP files: {num_http_files}
+                    Parsed index page cache location: {index_pages_location}
+                    Parsed index page cache size: {index_pages_size}
+                    Number of parsed index pages: {num_index_page_files}
                     Locally built wheels location: {wheels_cache_location}
                     Locally built wheels size: {wheels_cache_size}
                     Number of locally built wheels: {package_count}
+                    Dependency metadata cache location: {metadata_cache_location}
+                    Dependency metadata cache size: {metadata_cache_size}
+                    Number of cached metadata files: {num_metadata_files}
+                    Downloaded artifacts location: {artifacts_location}
+                    Downloaded artifacts size: {artifacts_size}
+                    Number of downloaded artifacts: {num_artifact_files}
+                    Build environments location: {build_envs_location}
+                    Build environments size: {build_envs_size}
                 """
             )
             .format(
                 http_cache_location=http_cache_location,
                 http_cache_size=http_cache_size,
                 num_http_files=num_http_files,
+                index_pages_location=index_pages_location,
+                index_pages_size=index_pages_size,
+                num_index_page_files=num_index_page_files,
                 wheels_cache_location=wheels_cache_location,
                 package_count=num_packages,
                 wheels_cache_size=wheels_cache_size,
+                metadata_cache_location=metadata_cache_location,
+                metadata_cache_size=metadata_cache_size,
+                num_metadata_files=num_metadata_files,
+                artifacts_location=artifacts_location,
+                artifacts_size=artifacts_size,
+                num_artifact_files=num_artifact_files,
+                build_envs_location=build_envs_location,
+                build_envs_size=build_envs_size,
             )
             .strip()
         )
@@ -171,8 +206,12 @@ class CacheCommand(Command):
 
         no_matching_msg = "No matching packages"
         if args[0] == "*":
-            # Only fetch http files if no specific pattern given
+            # Only fetch http, metadata and artifact files if no specific
+            # pattern given
             files += self._find_http_files(options)
+            files += self._find_index_page_files(options)
+            files += self._find_metadata_files(options)
+            files += self._find_artifact_files(options)
         else:
             # Add the pattern to the log message
             no_matching_msg += ' for pattern "{}"'.format(args[0])
@@ -189,6 +228,16 @@ class CacheCommand(Command):
         if args:
             raise CommandError("Too many arguments")
 
+        build_envs_dir = self._cache_dir(options, "build-envs")
+        if os.path.isdir(build_envs_dir):
+            rmtree(build_envs_dir)
+            logger.verbose("Removed %s", build_envs_dir)
+
+        index_health_file = self._cache_dir(options, INDEX_HEALTH_FILE_NAME)
+        if os.path.isfile(index_health_file):
+            os.unlink(index_health_file)
+            logger.verbose("Removed %s", index_health_file)
+
         return self.remove_cache_items(options, ["*"])
 
     def _cache_dir(self, options: Values, subdir: str) -> str:
@@ -198,6 +247,18 @@ class CacheCommand(Command):
         http_dir = self._cache_dir(options, "http")
         return filesystem.find_files(http_dir, "*")
 
+    def _find_index_page_files(self, options: Values) -> List[str]:
+        index_pages_dir = self._cache_dir(options, "index-pages")
+        return filesystem.find_files(index_pages_dir, "*")
+
+    def _find_metadata_files(self, options: Values) -> List[str]:
+        metadata_dir = self._cache_dir(options, "metadata")
+        return filesystem.find_files(metadata_dir, "*")
+
+    def _find_artifact_files(self, options: Values) -> List[str]:
+        artifacts_dir = self._cache_dir(options, "artifacts")
+        return filesystem.find_files(artifacts_dir, "*")
+
     def _find_wheels(self, options: Values, pattern: str) -> List[str]:
         wheel_dir = self._cache_dir(options, "wheels")
 
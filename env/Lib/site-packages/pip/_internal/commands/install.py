@@ -194,6 +194,7 @@ class InstallCommand(RequirementCommand):
 
         self.cmd_opts.add_option(cmdoptions.ignore_requires_python())
         self.cmd_opts.add_option(cmdoptions.no_build_isolation())
+        self.cmd_opts.add_option(cmdoptions.reuse_build_env())
         self.cmd_opts.add_option(cmdoptions.use_pep517())
         self.cmd_opts.add_option(cmdoptions.no_use_pep517())
         self.cmd_opts.add_option(cmdoptions.check_build_deps())
@@ -216,6 +217,10 @@ class InstallCommand(RequirementCommand):
             dest="compile",
             help="Do not compile Python source files to bytecode",
         )
+        self.cmd_opts.add_option(cmdoptions.compile_workers())
+        self.cmd_opts.add_option(cmdoptions.install_workers())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
+        self.cmd_opts.add_option(cmdoptions.installed_index())
 
         self.cmd_opts.add_option(
             "--no-warn-script-location",
@@ -236,6 +241,7 @@ class InstallCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.prefer_binary())
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_workers())
         self.cmd_opts.add_option(cmdoptions.root_user_action())
 
         index_opts = cmdoptions.make_option_group(
@@ -266,6 +272,10 @@ class InstallCommand(RequirementCommand):
     def run(self, options: Values, args: List[str]) -> int:
         if options.use_user_site and options.target_dir is not None:
             raise CommandError("Can not combine '--user' and '--target'")
+        if options.installed_index and options.target_dir is not None:
+            # Files are installed into a temporary directory and moved into
+            # the target one by one, which would clash with an index there.
+            raise CommandError("Can not combine '--installed-index' and '--target'")
 
         # Check whether the environment we're installing into is externally
         # managed, as specified in PEP 668. Specifying --root, --target, or
@@ -423,6 +433,7 @@ class InstallCommand(RequirementCommand):
                 verify=True,
                 build_options=[],
                 global_options=global_options,
+                build_jobs=options.build_jobs,
             )
 
             if build_failures:
@@ -433,7 +444,14 @@ class InstallCommand(RequirementCommand):
                     )
                 )
 
-            to_install = resolver.get_installation_order(requirement_set)
+            if options.install_workers > 1:
+                install_groups: Optional[
+                    List[List[InstallRequirement]]
+                ] = resolver.get_installation_groups(requirement_set)
+                to_install = [req for group in install_groups for req in group]
+            else:
+                install_groups = None
+                to_install = resolver.get_installation_order(requirement_set)
 
             # Check for conflicts in the package set we're installing.
             conflicts: Optional[ConflictDetails] = None
@@ -458,6 +476,10 @@ class InstallCommand(RequirementCommand):
                 warn_script_location=warn_script_location,
                 use_user_site=options.use_user_site,
                 pycompile=options.compile,
+                compile_workers=options.compile_workers,
+                install_groups=install_groups,
+                install_workers=options.install_workers,
+                create_installed_index=options.installed_index,
             )
 
             lib_locations = get_lib_location_guesses(
@@ -1,7 +1,20 @@
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from optparse import Values
-from typing import TYPE_CHECKING, Generator, List, Optional, Sequence, Tuple, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 from pip._vendor.packaging.utils import canonicalize_name
 
@@ -9,16 +22,14 @@ from pip._internal.cli import cmdoptions
 from pip._internal.cli.req_command import IndexGroupCommand
 from pip._internal.cli.status_codes import SUCCESS
 from pip._internal.exceptions import CommandError
-from pip._internal.index.collector import LinkCollector
-from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import BaseDistribution, get_environment
-from pip._internal.models.selection_prefs import SelectionPreferences
-from pip._internal.network.session import PipSession
 from pip._internal.utils.compat import stdlib_pkgs
 from pip._internal.utils.misc import tabulate, write_output
 
 if TYPE_CHECKING:
+    from pip._internal.index.package_finder import PackageFinder
     from pip._internal.metadata.base import DistributionVersion
+    from pip._internal.network.session import PipSession
 
     class _DistWithLatestInfo(BaseDistribution):
         """Give the distribution object a couple of extra fields.
@@ -136,11 +147,16 @@ class ListCommand(IndexGroupCommand):
         self.parser.insert_option_group(0, self.cmd_opts)
 
     def _build_package_finder(
-        self, options: Values, session: PipSession
-    ) -> PackageFinder:
+        self, options: Values, session: "PipSession"
+    ) -> "PackageFinder":
         """
         Create a package finder appropriate to this list command.
         """
+        # Only --outdated and --uptodate need to look at the index.
+        from pip._internal.index.collector import LinkCollector
+        from pip._internal.index.package_finder import PackageFinder
+        from pip._internal.models.selection_prefs import SelectionPreferences
+
         link_collector = LinkCollector.create(session, options=options)
 
         # Pass allow_yanked=False to ignore yanked versions.
@@ -187,10 +203,18 @@ class ListCommand(IndexGroupCommand):
         if options.not_required:
             packages = self.get_not_required(packages, options)
 
-        if options.outdated:
-            packages = self.get_outdated(packages, options)
-        elif options.uptodate:
-            packages = self.get_uptodate(packages, options)
+        if options.outdated or options.uptodate:
+            # Look packages up in the order they are listed in, so that each
+            # can be output as soon as it has been looked up.
+            packages = sorted(packages, key=lambda dist: dist.canonical_name)
+            if options.outdated:
+                found = self.iter_outdated(packages, options)
+            else:
+                found = self.iter_uptodate(packages, options)
+            if options.list_format == "json":
+                self.stream_package_listing_json(found, options)
+                return SUCCESS
+            packages = list(found)
 
         self.output_package_listing(packages, options)
         return SUCCESS
@@ -198,20 +222,30 @@ class ListCommand(IndexGroupCommand):
     def get_outdated(
         self, packages: "_ProcessedDists", options: Values
     ) -> "_ProcessedDists":
-        return [
+        return list(self.iter_outdated(packages, options))
+
+    def iter_outdated(
+        self, packages: "_ProcessedDists", options: Values
+    ) -> Iterator["_DistWithLatestInfo"]:
+        return (
             dist
             for dist in self.iter_packages_latest_infos(packages, options)
             if dist.latest_version > dist.version
-        ]
+        )
 
     def get_uptodate(
         self, packages: "_ProcessedDists", options: Values
     ) -> "_ProcessedDists":
-        return [
+        return list(self.iter_uptodate(packages, options))
+
+    def iter_uptodate(
+        self, packages: "_ProcessedDists", options: Values
+    ) -> Iterator["_DistWithLatestInfo"]:
+        return (
             dist
             for dist in self.iter_packages_latest_infos(packages, options)
             if dist.latest_version == dist.version
-        ]
+        )
 
     def get_not_required(
         self, packages: "_ProcessedDists", options: Values
@@ -230,6 +264,10 @@ class ListCommand(IndexGroupCommand):
     def iter_packages_latest_infos(
         self, packages: "_ProcessedDists", options: Values
     ) -> Generator["_DistWithLatestInfo", None, None]:
+        """Look up the latest versions of packages, yielding them in order.
+
+        With --index-workers, packages are looked up on a thread pool.
+        """
         with self._build_session(options) as session:
             finder = self._build_package_finder(options, session)
 
@@ -253,7 +291,7 @@ class ListCommand(IndexGroupCommand):
                     return None
 
                 remote_version = best_candidate.version
-                if best_candidate.link.is_wheel:
+                if best_candidate.is_wheel:
                     typ = "wheel"
                 else:
                     typ = "sdist"
@@ -261,9 +299,19 @@ class ListCommand(IndexGroupCommand):
                 dist.latest_filetype = typ
                 return dist
 
-            for dist in map(latest_info, packages):
-                if dist is not None:
-                    yield dist
+            workers = min(getattr(options, "index_workers", 1), len(packages))
+            if workers <= 1:
+                for dist in map(latest_info, packages):
+                    if dist is not None:
+                        yield dist
+                return
+
+            with ThreadPoolExecutor(
+                workers, thread_name_prefix="pip-list"
+            ) as executor:
+                for dist in executor.map(latest_info, packages):
+                    if dist is not None:
+                        yield dist
 
     def output_package_listing(
         self, packages: "_ProcessedDists", options: Values
@@ -286,6 +334,25 @@ class ListCommand(IndexGroupCommand):
         elif options.list_format == "json":
             write_output(format_for_json(packages, options))
 
+    def stream_package_listing_json(
+        self, packages: Iterable["_DistWithLatestInfo"], options: Values
+    ) -> None:
+        """Output packages as a JSON list with a package on each line, writing
+        each line as soon as it is known.
+
+        The packages must already be sorted.
+        """
+        rows = (json.dumps(format_info_for_json(dist, options)) for dist in packages)
+        line = next(rows, None)
+        if line is None:
+            write_output("[]")
+            return
+        line = "[" + line
+        for row in rows:
+            write_output("%s,", line)
+            line = row
+        write_output("%s]", line)
+
     def output_package_listing_columns(
         self, data: List[List[str]], header: List[str]
     ) -> None:
@@ -348,21 +415,25 @@ def format_for_columns(
     return data, header
 
 
+def format_info_for_json(
+    dist: "_DistWithLatestInfo", options: Values
+) -> Dict[str, Any]:
+    info = {
+        "name": dist.raw_name,
+        "version": str(dist.version),
+    }
+    if options.verbose >= 1:
+        info["location"] = dist.location or ""
+        info["installer"] = dist.installer
+    if options.outdated:
+        info["latest_version"] = str(dist.latest_version)
+        info["latest_filetype"] = dist.latest_filetype
+    editable_project_location = dist.editable_project_location
+    if editable_project_location:
+        info["editable_project_location"] = editable_project_location
+    return info
+
+
 def format_for_json(packages: "_ProcessedDists", options: Values) -> str:
-    data = []
-    for dist in packages:
-        info = {
-            "name": dist.raw_name,
-            "version": str(dist.version),
-        }
-        if options.verbose >= 1:
-            info["location"] = dist.location or ""
-            info["installer"] = dist.installer
-        if options.outdated:
-            info["latest_version"] = str(dist.latest_version)
-            info["latest_filetype"] = dist.latest_filetype
-        editable_project_location = dist.editable_project_location
-        if editable_project_location:
-            info["editable_project_location"] = editable_project_location
-        data.append(info)
+    data = [format_info_for_json(dist, options) for dist in packages]
     return json.dumps(data)
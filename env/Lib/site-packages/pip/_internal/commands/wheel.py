@@ -57,6 +57,7 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.only_binary())
         self.cmd_opts.add_option(cmdoptions.prefer_binary())
         self.cmd_opts.add_option(cmdoptions.no_build_isolation())
+        self.cmd_opts.add_option(cmdoptions.reuse_build_env())
         self.cmd_opts.add_option(cmdoptions.use_pep517())
         self.cmd_opts.add_option(cmdoptions.no_use_pep517())
         self.cmd_opts.add_option(cmdoptions.check_build_deps())
@@ -67,6 +68,8 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.ignore_requires_python())
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_workers())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
 
         self.cmd_opts.add_option(
             "--no-verify",
@@ -163,6 +166,7 @@ class WheelCommand(RequirementCommand):
             verify=(not options.no_verify),
             build_options=options.build_options or [],
             global_options=options.global_options or [],
+            build_jobs=options.build_jobs,
         )
         for req in build_successes:
             assert req.link and req.link.is_wheel
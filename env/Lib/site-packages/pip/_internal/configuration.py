@@ -23,7 +23,7 @@ from pip._internal.exceptions import (
 )
 from pip._internal.utils import appdirs
 from pip._internal.utils.compat import WINDOWS
-from pip._internal.utils.logging import getLogger
+from pip._internal.utils._log import getLogger
 from pip._internal.utils.misc import ensure_dir, enum
 
 RawConfigParser = configparser.RawConfigParser  # Shorthand
@@ -1,4 +1,5 @@
 import abc
+from typing import Optional
 
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata.base import BaseDistribution
@@ -35,5 +36,6 @@ class AbstractDistribution(metaclass=abc.ABCMeta):
         finder: PackageFinder,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache_dir: Optional[str],
     ) -> None:
         raise NotImplementedError()
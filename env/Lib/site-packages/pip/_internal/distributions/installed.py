@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import BaseDistribution
@@ -19,5 +21,6 @@ class InstalledDistribution(AbstractDistribution):
         finder: PackageFinder,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache_dir: Optional[str],
     ) -> None:
         pass
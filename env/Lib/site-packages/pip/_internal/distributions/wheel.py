@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pip._vendor.packaging.utils import canonicalize_name
 
 from pip._internal.distributions.base import AbstractDistribution
@@ -30,5 +32,6 @@ class WheelDistribution(AbstractDistribution):
         finder: PackageFinder,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache_dir: Optional[str],
     ) -> None:
         pass
@@ -15,8 +15,6 @@ import sys
 from itertools import chain, groupby, repeat
 from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
 
-from pip._vendor.requests.models import Request, Response
-from pip._vendor.rich.console import Console, ConsoleOptions, RenderResult
 from pip._vendor.rich.markup import escape
 from pip._vendor.rich.text import Text
 
@@ -24,6 +22,9 @@ if TYPE_CHECKING:
     from hashlib import _Hash
     from typing import Literal
 
+    from pip._vendor.requests.models import Request, Response
+    from pip._vendor.rich.console import Console, ConsoleOptions, RenderResult
+
     from pip._internal.metadata import BaseDistribution
     from pip._internal.req.req_install import InstallRequirement
 
@@ -39,7 +40,7 @@ def _is_kebab_case(s: str) -> bool:
 
 def _prefix_with_indent(
     s: Union[Text, str],
-    console: Console,
+    console: "Console",
     *,
     prefix: str,
     indent: str,
@@ -114,9 +115,9 @@ class DiagnosticPipError(PipError):
 
     def __rich_console__(
         self,
-        console: Console,
-        options: ConsoleOptions,
-    ) -> RenderResult:
+        console: "Console",
+        options: "ConsoleOptions",
+    ) -> "RenderResult":
         colour = "red" if self.kind == "error" else "yellow"
 
         yield f"[{colour} bold]{self.kind}[/]: [bold]{self.reference}[/]"
@@ -297,8 +298,8 @@ class NetworkConnectionError(PipError):
     def __init__(
         self,
         error_msg: str,
-        response: Optional[Response] = None,
-        request: Optional[Request] = None,
+        response: Optional["Response"] = None,
+        request: Optional["Request"] = None,
     ) -> None:
         """
         Initialize NetworkConnectionError with  `request` and `response`
@@ -5,16 +5,22 @@ The main purpose of this module is to expose LinkCollector.collect_sources().
 import collections
 import email.message
 import functools
+import hashlib
 import itertools
 import json
 import logging
 import os
+import posixpath
+import threading
+import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from html.parser import HTMLParser
 from optparse import Values
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
     Iterable,
@@ -23,6 +29,7 @@ from typing import (
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -32,12 +39,14 @@ from pip._vendor.requests import Response
 from pip._vendor.requests.exceptions import RetryError, SSLError
 
 from pip._internal.exceptions import NetworkConnectionError
+from pip._internal.index.health import IndexHealth
 from pip._internal.models.link import Link
 from pip._internal.models.search_scope import SearchScope
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import raise_for_status
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
 from pip._internal.utils.filetypes import is_archive_file
-from pip._internal.utils.misc import redact_auth_from_url
+from pip._internal.utils.misc import ensure_dir, redact_auth_from_url
 from pip._internal.vcs import vcs
 
 from .sources import CandidatesFromPage, LinkSource, build_source
@@ -50,6 +59,9 @@ else:
 logger = logging.getLogger(__name__)
 
 ResponseHeaders = MutableMapping[str, str]
+# Decides from the filename of a file on a page, and whether the file is
+# yanked, whether the file may be a candidate.
+FileFilter = Callable[[str, bool], bool]
 
 
 def _match_vcs_scheme(url: str) -> Optional[str]:
@@ -114,7 +126,11 @@ def _ensure_api_response(url: str, session: PipSession) -> None:
     _ensure_api_header(resp)
 
 
-def _get_simple_response(url: str, session: PipSession) -> Response:
+def _get_simple_response(
+    url: str,
+    session: PipSession,
+    conditional_headers: Optional[Dict[str, str]] = None,
+) -> Response:
     """Access an Simple API response with GET, and return the response.
 
     This consists of three parts:
@@ -126,39 +142,55 @@ def _get_simple_response(url: str, session: PipSession) -> Response:
     2. Actually perform the request. Raise HTTP exceptions on network failures.
     3. Check the Content-Type header to make sure we got a Simple API response,
        and raise `_NotAPIContent` otherwise.
+
+    If conditional_headers is given, the response is cached by an
+    IndexPageCache instead of the HTTP cache, and the headers are sent to
+    revalidate the page cached there. A "304 Not Modified" response is
+    returned as is.
     """
     if is_archive_file(Link(url).filename):
         _ensure_api_response(url, session=session)
 
     logger.debug("Getting page %s", redact_auth_from_url(url))
 
-    resp = session.get(
-        url,
-        headers={
-            "Accept": ", ".join(
-                [
-                    "application/vnd.pypi.simple.v1+json",
-                    "application/vnd.pypi.simple.v1+html; q=0.1",
-                    "text/html; q=0.01",
-                ]
-            ),
-            # We don't want to blindly returned cached data for
-            # /simple/, because authors generally expecting that
-            # twine upload && pip install will function, but if
-            # they've done a pip install in the last ~10 minutes
-            # it won't. Thus by setting this to zero we will not
-            # blindly use any cached data, however the benefit of
-            # using max-age=0 instead of no-cache, is that we will
-            # still support conditional requests, so we will still
-            # minimize traffic sent in cases where the page hasn't
-            # changed at all, we will just always incur the round
-            # trip for the conditional GET now instead of only
-            # once per 10 minutes.
-            # For more information, please see pypa/pip#5670.
-            "Cache-Control": "max-age=0",
-        },
-    )
+    headers = {
+        "Accept": ", ".join(
+            [
+                "application/vnd.pypi.simple.v1+json",
+                "application/vnd.pypi.simple.v1+html; q=0.1",
+                "text/html; q=0.01",
+            ]
+        ),
+        # We don't want to blindly returned cached data for
+        # /simple/, because authors generally expecting that
+        # twine upload && pip install will function, but if
+        # they've done a pip install in the last ~10 minutes
+        # it won't. Thus by setting this to zero we will not
+        # blindly use any cached data, however the benefit of
+        # using max-age=0 instead of no-cache, is that we will
+        # still support conditional requests, so we will still
+        # minimize traffic sent in cases where the page hasn't
+        # changed at all, we will just always incur the round
+        # trip for the conditional GET now instead of only
+        # once per 10 minutes.
+        # For more information, please see pypa/pip#5670.
+        "Cache-Control": "max-age=0",
+    }
+    if conditional_headers is not None:
+        # Keep the page out of the HTTP cache, as it is kept already parsed
+        # in an IndexPageCache. This is done even on the first fetch, when
+        # there are no validators yet: a page without any is of no use to
+        # the HTTP cache under max-age=0 either, and a page with them would
+        # make the HTTP cache send its own validators on later fetches, then
+        # turn the "304 Not Modified" meant for the IndexPageCache into its
+        # full cached copy, to be parsed again.
+        headers["Cache-Control"] = "max-age=0, no-store"
+        headers.update(conditional_headers)
+    resp = session.get(url, headers=headers)
     raise_for_status(resp)
+    if resp.status_code == 304:
+        logger.debug("Page %s has not been modified", redact_auth_from_url(url))
+        return resp
 
     # The check for archives above only works if the url ends with
     # something that looks like an archive. However that is not a
@@ -201,7 +233,9 @@ class CacheablePageContent:
 
 
 class ParseLinks(Protocol):
-    def __call__(self, page: "IndexContent") -> Iterable[Link]:
+    def __call__(
+        self, page: "IndexContent", file_filter: Optional[FileFilter] = None
+    ) -> Iterable[Link]:
         ...
 
 
@@ -210,6 +244,8 @@ def with_cached_index_content(fn: ParseLinks) -> ParseLinks:
     Given a function that parses an Iterable[Link] from an IndexContent, cache the
     function's result (keyed by CacheablePageContent), unless the IndexContent
     `page` has `page.cache_link_parsing == False`.
+
+    As the cached result is shared, cached pages are parsed without a filter.
     """
 
     @functools.lru_cache(maxsize=None)
@@ -217,37 +253,115 @@ def with_cached_index_content(fn: ParseLinks) -> ParseLinks:
         return list(fn(cacheable_page.page))
 
     @functools.wraps(fn)
-    def wrapper_wrapper(page: "IndexContent") -> List[Link]:
+    def wrapper_wrapper(
+        page: "IndexContent", file_filter: Optional[FileFilter] = None
+    ) -> List[Link]:
         if page.cache_link_parsing:
             return wrapper(CacheablePageContent(page))
-        return list(fn(page))
+        return list(fn(page, file_filter))
 
     return wrapper_wrapper
 
 
+def _is_filtered_out(url: str, yanked: bool, file_filter: FileFilter) -> bool:
+    """Check whether file_filter rejects the file at url, before a Link is made."""
+    parsed = urllib.parse.urlsplit(url)
+    if "egg=" in parsed.fragment:
+        # The egg fragment overrides the filename, leave it to the evaluator.
+        return False
+    filename = urllib.parse.unquote(posixpath.basename(parsed.path))
+    return not file_filter(filename, yanked)
+
+
+def _make_json_file_hook(
+    file_filter: FileFilter,
+) -> Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Make an object_hook for json.loads(), which drops the files of a JSON
+    response that file_filter rejects as soon as they are decoded.
+    """
+
+    def hook(obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        url = obj.get("url")
+        if not isinstance(url, str) or "filename" not in obj:
+            # Not a file.
+            return obj
+        if _is_filtered_out(url, bool(obj.get("yanked")), file_filter):
+            return None
+        return obj
+
+    return hook
+
+
+def _is_json_content_type(content_type: str) -> bool:
+    return content_type.lower().startswith("application/vnd.pypi.simple.v1+json")
+
+
+def _decode_files(page: "IndexContent") -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Decode the files of a page, without making Links for them.
+
+    Return the file dicts of a JSON response, or the attributes of the anchor
+    elements and the base URL of an HTML one.
+    """
+    if _is_json_content_type(page.content_type):
+        return json.loads(page.content).get("files", []), None
+    parser = HTMLLinkParser(page.url)
+    encoding = page.encoding or "utf-8"
+    parser.feed(page.content.decode(encoding))
+    return parser.anchors, parser.base_url
+
+
 @with_cached_index_content
-def parse_links(page: "IndexContent") -> Iterable[Link]:
+def parse_links(
+    page: "IndexContent", file_filter: Optional[FileFilter] = None
+) -> Iterable[Link]:
     """
     Parse a Simple API's Index Content, and yield its anchor elements as Link objects.
+
+    If file_filter is given, files it rejects are skipped before Link objects
+    are made for them. Files of a JSON response are even dropped while it is
+    being decoded.
     """
 
-    content_type_l = page.content_type.lower()
-    if content_type_l.startswith("application/vnd.pypi.simple.v1+json"):
-        data = json.loads(page.content)
-        for file in data.get("files", []):
+    if _is_json_content_type(page.content_type):
+        if file_filter is None:
+            object_hook = None
+        else:
+            object_hook = _make_json_file_hook(file_filter)
+        if page.files is None:
+            files = json.loads(page.content, object_hook=object_hook).get("files", [])
+        elif object_hook is None:
+            files = page.files
+        else:
+            # Filter decoded files just as if they were being decoded now.
+            files = [object_hook(file) for file in page.files]
+        for file in files:
+            if file is None:
+                # Rejected by file_filter.
+                continue
             link = Link.from_json(file, page.url)
             if link is None:
                 continue
             yield link
         return
 
-    parser = HTMLLinkParser(page.url)
-    encoding = page.encoding or "utf-8"
-    parser.feed(page.content.decode(encoding))
+    if page.files is not None:
+        anchors = page.files
+        base_url = page.base_url
+    else:
+        anchors, base_url = _decode_files(page)
 
     url = page.url
-    base_url = parser.base_url or url
-    for anchor in parser.anchors:
+    base_url = base_url or url
+    for anchor in anchors:
+        href = anchor.get("href")
+        if (
+            file_filter is not None
+            and href
+            and _is_filtered_out(
+                href, anchor.get("data-yanked") is not None, file_filter
+            )
+        ):
+            continue
         link = Link.from_element(anchor, page_url=url, base_url=base_url)
         if link is None:
             continue
@@ -264,6 +378,8 @@ class IndexContent:
         encoding: Optional[str],
         url: str,
         cache_link_parsing: bool = True,
+        files: Optional[List[Dict[str, Any]]] = None,
+        base_url: Optional[str] = None,
     ) -> None:
         """
         :param encoding: the encoding to decode the given content.
@@ -271,12 +387,17 @@ class IndexContent:
         :param cache_link_parsing: whether links parsed from this page's url
                                    should be cached. PyPI index urls should
                                    have this set to False, for example.
+        :param files: the files of the page, if it has been decoded already,
+                      as returned by _decode_files(). content is not used then.
+        :param base_url: the base URL of a decoded HTML page, if it has one.
         """
         self.content = content
         self.content_type = content_type
         self.encoding = encoding
         self.url = url
         self.cache_link_parsing = cache_link_parsing
+        self.files = files
+        self.base_url = base_url
 
     def __str__(self) -> str:
         return redact_auth_from_url(self.url)
@@ -333,7 +454,174 @@ def _make_index_content(
     )
 
 
-def _get_index_content(link: Link, *, session: PipSession) -> Optional["IndexContent"]:
+# Bumped whenever the format of the entries of an IndexPageCache changes.
+_PAGE_CACHE_VERSION = 2
+
+
+def _is_cached_file(file: Any, is_json: bool) -> bool:
+    """Whether a cached file has a shape that parse_links() can handle.
+
+    The files of JSON pages are kept as the index sent them, those of HTML
+    pages as the attributes of their anchor elements.
+    """
+    if not isinstance(file, dict):
+        return False
+    if not is_json:
+        return all(
+            isinstance(key, str) and (value is None or isinstance(value, str))
+            for key, value in file.items()
+        )
+    if not isinstance(file.get("url", ""), str):
+        return False
+    hashes = file.get("hashes", {})
+    if not isinstance(hashes, dict) or not all(
+        isinstance(value, str) for value in hashes.values()
+    ):
+        return False
+    for key in ("core-metadata", "dist-info-metadata"):
+        if not isinstance(file.get(key, False), (bool, dict, type(None))):
+            return False
+    return isinstance(file.get("requires-python", ""), (str, type(None)))
+
+
+class _CachedPage(NamedTuple):
+    url: str
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    base_url: Optional[str]
+    files: List[Dict[str, Any]]
+
+
+class IndexPageCache:
+    """A cache of decoded index pages, along with the validators to revalidate
+    them with.
+
+    Unlike in the HTTP cache, a page that has not been modified since it was
+    cached is neither downloaded nor decoded again. Its files are kept as plain
+    dicts, so that parse_links() can filter them before making Links.
+
+    :param cache_dir: The root of the cache.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        assert os.path.isabs(cache_dir)
+        self.cache_dir = cache_dir
+
+    def _get_cache_path(self, url: str) -> str:
+        hashed = hashlib.sha224(url.encode()).hexdigest()
+        parts = [hashed[:2], hashed[2:4], hashed[4:6], hashed[6:]]
+        return os.path.join(self.cache_dir, "index-pages", *parts)
+
+    def _load(self, url: str) -> Optional[_CachedPage]:
+        """Load the cached page of url.
+
+        Anything that is not a complete entry of the current format, e.g. one
+        written by another version of pip or truncated, is treated as a miss.
+        """
+        path = self._get_cache_path(url)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != _PAGE_CACHE_VERSION:
+            return None
+        page_url = entry.get("url")
+        content_type = entry.get("content_type")
+        validators = (entry.get("etag"), entry.get("last_modified"))
+        base_url = entry.get("base_url")
+        files = entry.get("files")
+        if (
+            not isinstance(page_url, str)
+            or not isinstance(content_type, str)
+            or not any(validators)
+            or not all(v is None or isinstance(v, str) for v in validators)
+            or not (base_url is None or isinstance(base_url, str))
+            or not isinstance(files, list)
+        ):
+            logger.debug("Ignoring malformed cached page %s", path)
+            return None
+        is_json = _is_json_content_type(content_type)
+        if not all(_is_cached_file(file, is_json) for file in files):
+            logger.debug("Ignoring malformed cached page %s", path)
+            return None
+        return _CachedPage(
+            url=page_url,
+            content_type=content_type,
+            etag=validators[0],
+            last_modified=validators[1],
+            base_url=base_url,
+            files=files,
+        )
+
+    def _save(self, url: str, entry: Dict[str, Any]) -> None:
+        path = self._get_cache_path(url)
+        try:
+            ensure_dir(os.path.dirname(path))
+            with adjacent_tmp_file(path) as f:
+                f.write(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+            replace(f.name, path)
+        except OSError as e:
+            logger.debug("Could not cache page %s: %s", redact_auth_from_url(url), e)
+
+    def get_index_content(
+        self, url: str, *, session: PipSession, cache_link_parsing: bool
+    ) -> IndexContent:
+        """Fetch the page at url, unless the cached page is still valid."""
+        entry = self._load(url)
+        conditional_headers = {}
+        if entry is not None:
+            if entry.etag:
+                conditional_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional_headers["If-Modified-Since"] = entry.last_modified
+
+        resp = _get_simple_response(
+            url, session=session, conditional_headers=conditional_headers
+        )
+        if resp.status_code == 304 and entry is not None:
+            return IndexContent(
+                b"",
+                entry.content_type,
+                encoding=None,
+                url=entry.url,
+                cache_link_parsing=cache_link_parsing,
+                files=entry.files,
+                base_url=entry.base_url,
+            )
+
+        page = _make_index_content(resp, cache_link_parsing=cache_link_parsing)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            # Every file is kept, so decode the page without a filter; Links
+            # are only made for the files the caller keeps.
+            files, base_url = _decode_files(page)
+            self._save(
+                url,
+                {
+                    "version": _PAGE_CACHE_VERSION,
+                    "url": page.url,
+                    "content_type": page.content_type,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "base_url": base_url,
+                    "files": files,
+                },
+            )
+            page.files, page.base_url = files, base_url
+            page.content = b""
+        return page
+
+
+def _get_index_content(
+    link: Link,
+    *,
+    session: PipSession,
+    page_cache: Optional[IndexPageCache] = None,
+    health: Optional[IndexHealth] = None,
+) -> Optional["IndexContent"]:
     url = link.url.split("#", 1)[0]
 
     # Check for VCS schemes that do not support lookup as web pages.
@@ -360,8 +648,19 @@ def _get_index_content(link: Link, *, session: PipSession) -> Optional["IndexCon
         url = urllib.parse.urljoin(url, "index.html")
         logger.debug(" file: URL is directory, getting %s", url)
 
+    if scheme not in {"http", "https"}:
+        health = None
+    start = time.monotonic()
     try:
-        resp = _get_simple_response(url, session=session)
+        if page_cache is not None and scheme in {"http", "https"}:
+            page = page_cache.get_index_content(
+                url, session=session, cache_link_parsing=link.cache_link_parsing
+            )
+        else:
+            resp = _get_simple_response(url, session=session)
+            page = _make_index_content(
+                resp, cache_link_parsing=link.cache_link_parsing
+            )
     except _NotHTTP:
         logger.warning(
             "Skipping page %s because it looks like an archive, and cannot "
@@ -378,19 +677,36 @@ def _get_index_content(link: Link, *, session: PipSession) -> Optional["IndexCon
             exc.content_type,
         )
     except NetworkConnectionError as exc:
+        if health is not None:
+            # Error pages, like those of missing projects, come from a host
+            # that works; server errors do not.
+            if exc.response is not None and exc.response.status_code < 500:
+                health.record_success(url, time.monotonic() - start)
+            else:
+                health.record_failure(url)
         _handle_get_simple_fail(link, exc)
     except RetryError as exc:
+        if health is not None:
+            health.record_failure(url)
         _handle_get_simple_fail(link, exc)
     except SSLError as exc:
+        if health is not None:
+            health.record_failure(url)
         reason = "There was a problem confirming the ssl certificate: "
         reason += str(exc)
         _handle_get_simple_fail(link, reason, meth=logger.info)
     except requests.ConnectionError as exc:
+        if health is not None:
+            health.record_failure(url)
         _handle_get_simple_fail(link, f"connection error: {exc}")
     except requests.Timeout:
+        if health is not None:
+            health.record_failure(url)
         _handle_get_simple_fail(link, "timed out")
     else:
-        return _make_index_content(resp, cache_link_parsing=link.cache_link_parsing)
+        if health is not None:
+            health.record_success(url, time.monotonic() - start)
+        return page
     return None
 
 
@@ -412,9 +728,35 @@ class LinkCollector:
         self,
         session: PipSession,
         search_scope: SearchScope,
+        prefetch_workers: int = 1,
+        page_cache: Optional[IndexPageCache] = None,
+        race_indexes: bool = False,
+        health: Optional[IndexHealth] = None,
     ) -> None:
+        """
+        :param prefetch_workers: The number of threads used to fetch index
+            pages ahead of time, see prefetch(). Prefetching is disabled
+            unless this is greater than one.
+        :param page_cache: The cache to keep parsed index pages in, if any.
+        :param race_indexes: Whether to fetch the pages of a project from all
+            indexes at once, see collect_sources().
+        :param health: The health of index hosts, used to skip the hosts that
+            keep failing and to fetch from the fastest ones first.
+        """
         self.search_scope = search_scope
         self.session = session
+        self.page_cache = page_cache
+        self.health = health
+
+        self._race_indexes = race_indexes
+
+        self._prefetch_workers = prefetch_workers
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = threading.Lock()
+        # Index page URLs that have been requested so far, and the pending
+        # background fetches of those which were requested by prefetch().
+        self._requested_urls: Set[str] = set()
+        self._prefetched: Dict[str, "Future[Optional[IndexContent]]"] = {}
 
     @classmethod
     def create(
@@ -444,9 +786,15 @@ class LinkCollector:
             index_urls=index_urls,
             no_index=options.no_index,
         )
+        cache_dir = getattr(options, "cache_dir", None)
+        race_indexes = getattr(options, "race_indexes", False)
         link_collector = LinkCollector(
             session=session,
             search_scope=search_scope,
+            prefetch_workers=getattr(options, "index_workers", 1),
+            page_cache=IndexPageCache(cache_dir) if cache_dir else None,
+            race_indexes=race_indexes,
+            health=IndexHealth.load(cache_dir) if race_indexes else None,
         )
         return link_collector
 
@@ -457,14 +805,102 @@ class LinkCollector:
     def fetch_response(self, location: Link) -> Optional[IndexContent]:
         """
         Fetch an HTML page containing package links.
+
+        If the page is being prefetched, wait for that fetch to finish instead
+        of issuing another request. A prefetch that has not started yet is
+        cancelled and the page is fetched right away.
+        """
+        url = location.url
+        with self._prefetch_lock:
+            self._requested_urls.add(url)
+            future = self._prefetched.pop(url, None)
+        if future is not None and not future.cancel():
+            return future.result()
+        if self.health is not None and self.health.should_skip(url):
+            return None
+        return _get_index_content(
+            location,
+            session=self.session,
+            page_cache=self.page_cache,
+            health=self.health,
+        )
+
+    def prefetch(self, project_names: Iterable[str]) -> None:
         """
-        return _get_index_content(location, session=self.session)
+        Start fetching the index pages of the given projects in the
+        background, so that a later fetch_response() for the same page does
+        not have to wait for the network round-trip.
+
+        Only remote index URLs are prefetched; pages that have already been
+        requested are skipped. This does nothing if prefetching is disabled.
+        """
+        if self._prefetch_workers <= 1:
+            return
+        for project_name in project_names:
+            urls = self.search_scope.get_index_urls_locations(project_name)
+            self._start_fetches(urls)
+
+    def _start_fetches(self, urls: List[str]) -> None:
+        """Fetch index pages in the background, fastest hosts first."""
+        if self.health is not None:
+            health = self.health
+            urls = [url for url in urls if not health.should_skip(url)]
+            urls.sort(key=health.latency)
+        with self._prefetch_lock:
+            for url in urls:
+                if url in self._requested_urls:
+                    continue
+                if urllib.parse.urlsplit(url).scheme not in {"http", "https"}:
+                    continue
+                if self._prefetch_executor is None:
+                    workers = self._prefetch_workers
+                    if self._race_indexes:
+                        workers = max(workers, len(self.search_scope.index_urls))
+                    self._prefetch_executor = ThreadPoolExecutor(
+                        workers,
+                        thread_name_prefix="pip-index-prefetch",
+                    )
+                self._requested_urls.add(url)
+                self._prefetched[url] = self._prefetch_executor.submit(
+                    _get_index_content,
+                    Link(url, cache_link_parsing=False),
+                    session=self.session,
+                    page_cache=self.page_cache,
+                    health=self.health,
+                )
+
+    def cancel_prefetch(self) -> None:
+        """
+        Cancel all prefetches that have not started yet, and release the
+        worker threads once the running ones finish.
+        """
+        with self._prefetch_lock:
+            for future in self._prefetched.values():
+                future.cancel()
+            self._prefetched.clear()
+            # Allow cancelled pages to be fetched again on demand.
+            self._requested_urls.clear()
+            if self._prefetch_executor is not None:
+                self._prefetch_executor.shutdown(wait=False)
+                self._prefetch_executor = None
+        if self.health is not None:
+            self.health.save()
 
     def collect_sources(
         self,
         project_name: str,
         candidates_from_page: CandidatesFromPage,
     ) -> CollectedSources:
+        """
+        Collect the sources to look for the files of project_name in.
+
+        When racing indexes, the project's pages are requested from all
+        indexes at once. They are still gone through in the order of the
+        indexes, so the result does not depend on which responds first.
+        """
+        index_locations = self.search_scope.get_index_urls_locations(project_name)
+        if self._race_indexes and len(index_locations) > 1:
+            self._start_fetches(index_locations)
         # The OrderedDict calls deduplicate sources by URL.
         index_url_sources = collections.OrderedDict(
             build_source(
@@ -474,7 +910,7 @@ class LinkCollector:
                 expand_dir=False,
                 cache_link_parsing=False,
             )
-            for loc in self.search_scope.get_index_urls_locations(project_name)
+            for loc in index_locations
         ).values()
         find_links_sources = collections.OrderedDict(
             build_source(
@@ -0,0 +1,152 @@
+"""Track how fast and reliable the hosts of package indexes are.
+
+A host that cannot be reached costs the full timeout, times the number of
+retries, for every project looked up on it. The health of each host is kept
+across runs, so that one which keeps failing is skipped for a while instead.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from typing import Dict, Optional, Set
+
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.misc import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+INDEX_HEALTH_FILE_NAME = "index-health.json"
+
+# A host is skipped after failing this many times in a row...
+FAILURE_THRESHOLD = 3
+# ...for this many seconds, after which it is tried again.
+COOLDOWN = 300.0
+# The weight of the latest request in the moving average of latencies.
+_LATENCY_WEIGHT = 0.3
+
+# Hosts that were reported as skipped, to only warn about each one once.
+_warned_hosts: Set[str] = set()
+
+
+def _get_host(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc
+
+
+class IndexHealth:
+    """The latency and failures of requests to each index host.
+
+    For each host, this keeps a moving average of the time taken by its
+    responses, how many requests and errors it has seen, and how many times
+    in a row it failed. Once that reaches FAILURE_THRESHOLD, the host is
+    skipped until COOLDOWN seconds after its last failure. A success resets
+    the count, while a failure after the cooldown skips the host again.
+
+    :param path: The file to keep the health in across runs, if any.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def load(cls, cache_dir: Optional[str]) -> "IndexHealth":
+        if not cache_dir:
+            return cls()
+        health = cls(os.path.join(cache_dir, INDEX_HEALTH_FILE_NAME))
+        try:
+            with open(health.path, encoding="utf-8") as f:
+                data = json.load(f)
+            for host, stats in data.items():
+                health._hosts[host] = {
+                    "latency": float(stats["latency"]),
+                    "requests": int(stats["requests"]),
+                    "errors": int(stats["errors"]),
+                    "failures": int(stats["failures"]),
+                    "last_failure": float(stats["last_failure"]),
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("Ignoring index health %s: %s", health.path, e)
+            health._hosts.clear()
+        return health
+
+    def _get_stats(self, host: str) -> Dict[str, float]:
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = {
+                "latency": 0.0,
+                "requests": 0,
+                "errors": 0,
+                "failures": 0,
+                "last_failure": 0.0,
+            }
+        return stats
+
+    def latency(self, url: str) -> float:
+        """The average latency of the host of url, 0 if it is not known."""
+        with self._lock:
+            stats = self._hosts.get(_get_host(url))
+            return stats["latency"] if stats is not None else 0.0
+
+    def should_skip(self, url: str) -> bool:
+        """Whether the host of url keeps failing, and should not be tried."""
+        host = _get_host(url)
+        with self._lock:
+            stats = self._hosts.get(host)
+            if stats is None or stats["failures"] < FAILURE_THRESHOLD:
+                return False
+            remaining = stats["last_failure"] + COOLDOWN - time.time()
+            if remaining <= 0:
+                return False
+            if host not in _warned_hosts:
+                _warned_hosts.add(host)
+                logger.warning(
+                    "Skipping index host %s for %d seconds, after it failed "
+                    "%d times in a row.",
+                    host,
+                    remaining,
+                    stats["failures"],
+                )
+            return True
+
+    def record_success(self, url: str, elapsed: float) -> None:
+        with self._lock:
+            stats = self._get_stats(_get_host(url))
+            if stats["requests"]:
+                stats["latency"] += _LATENCY_WEIGHT * (elapsed - stats["latency"])
+            else:
+                stats["latency"] = elapsed
+            stats["requests"] += 1
+            recovered = stats["failures"] >= FAILURE_THRESHOLD
+            stats["failures"] = 0
+        if recovered:
+            self.save()
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            stats = self._get_stats(_get_host(url))
+            stats["requests"] += 1
+            stats["errors"] += 1
+            stats["failures"] += 1
+            stats["last_failure"] = time.time()
+            broken = stats["failures"] >= FAILURE_THRESHOLD
+        if broken:
+            self.save()
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            data = json.dumps(self._hosts, sort_keys=True)
+        try:
+            ensure_dir(os.path.dirname(self.path))
+            with adjacent_tmp_file(self.path) as f:
+                f.write(data.encode("utf-8"))
+            replace(f.name, self.path)
+        except OSError as e:
+            logger.debug("Could not save index health %s: %s", self.path, e)
@@ -5,7 +5,17 @@ import functools
 import itertools
 import logging
 import re
-from typing import TYPE_CHECKING, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from pip._vendor.packaging import specifiers
 from pip._vendor.packaging.tags import Tag
@@ -19,7 +29,7 @@ from pip._internal.exceptions import (
     InvalidWheelFilename,
     UnsupportedWheel,
 )
-from pip._internal.index.collector import LinkCollector, parse_links
+from pip._internal.index.collector import FileFilter, LinkCollector, parse_links
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
@@ -27,6 +37,7 @@ from pip._internal.models.search_scope import SearchScope
 from pip._internal.models.selection_prefs import SelectionPreferences
 from pip._internal.models.target_python import TargetPython
 from pip._internal.models.wheel import Wheel
+from pip._internal.network.session import PipSession
 from pip._internal.req import InstallRequirement
 from pip._internal.utils._log import getLogger
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
@@ -154,6 +165,27 @@ class LinkEvaluator:
 
         self.project_name = project_name
 
+    def may_be_candidate(self, filename: str, yanked: bool) -> bool:
+        """
+        Cheaply determine from its filename whether a file may be a candidate
+        for installation, before a Link is made for it.
+
+        This returns False only for files that evaluate_link() rejects.
+        """
+        if yanked and not self._allow_yanked:
+            return False
+        if not filename.endswith(WHEEL_EXTENSION):
+            return "source" in self._formats
+        if "binary" not in self._formats:
+            return False
+        try:
+            wheel = Wheel(filename)
+        except InvalidWheelFilename:
+            return False
+        if canonicalize_name(wheel.name) != self._canonical_name:
+            return False
+        return wheel.supported(self._target_python.get_tag_priorities())
+
     def evaluate_link(self, link: Link) -> Tuple[LinkType, str]:
         """
         Determine whether a link is a candidate for installation.
@@ -198,7 +230,7 @@ class LinkEvaluator:
                     reason = f"wrong project name (not {self.project_name})"
                     return (LinkType.different_project, reason)
 
-                supported_tags = self._target_python.get_tags()
+                supported_tags = self._target_python.get_tag_priorities()
                 if not wheel.supported(supported_tags):
                     # Include the wheel's tags in the reason string to
                     # simplify troubleshooting compatibility issues.
@@ -284,10 +316,9 @@ def filter_unallowed_hashes(
     non_matches = []
     match_count = 0
     for candidate in candidates:
-        link = candidate.link
-        if not link.has_hash:
+        if not candidate.has_hash:
             pass
-        elif link.is_hash_allowed(hashes=hashes):
+        elif candidate.is_hash_allowed(hashes=hashes):
             match_count += 1
         else:
             non_matches.append(candidate)
@@ -423,6 +454,7 @@ class CandidateEvaluator:
             prefer_binary=prefer_binary,
             allow_all_prereleases=allow_all_prereleases,
             hashes=hashes,
+            tag_priorities=target_python.get_tag_priorities(),
         )
 
     def __init__(
@@ -433,10 +465,13 @@ class CandidateEvaluator:
         prefer_binary: bool = False,
         allow_all_prereleases: bool = False,
         hashes: Optional[Hashes] = None,
+        tag_priorities: Optional[Dict[Tag, int]] = None,
     ) -> None:
         """
         :param supported_tags: The PEP 425 tags supported by the target
             Python in order of preference (most preferred first).
+        :param tag_priorities: A precomputed map from each of supported_tags
+            to its priority, e.g. from TargetPython.get_tag_priorities().
         """
         self._allow_all_prereleases = allow_all_prereleases
         self._hashes = hashes
@@ -447,9 +482,11 @@ class CandidateEvaluator:
         # Since the index of the tag in the _supported_tags list is used
         # as a priority, precompute a map from tag to index/priority to be
         # used in wheel.find_most_preferred_tag.
-        self._wheel_tag_preferences = {
-            tag: idx for idx, tag in enumerate(supported_tags)
-        }
+        if tag_priorities is None:
+            tag_priorities = {}
+            for idx, tag in enumerate(supported_tags):
+                tag_priorities.setdefault(tag, idx)
+        self._wheel_tag_preferences = tag_priorities
 
     def get_applicable_candidates(
         self,
@@ -461,23 +498,24 @@ class CandidateEvaluator:
         # Using None infers from the specifier instead.
         allow_prereleases = self._allow_all_prereleases or None
         specifier = self._specifier
+        # Filter each distinct version once. Candidate versions are parsed by
+        # pip's own packaging, the same as the specifier, so they can be
+        # passed as they are without being parsed again. They are told apart
+        # by their string form, since "===" distinguishes versions that
+        # compare equal, such as 1.0 and 1.0.0.
+        version_strings = [str(c.version) for c in candidates]
+        distinct_versions = dict(zip(version_strings, (c.version for c in candidates)))
         versions = {
             str(v)
             for v in specifier.filter(
-                # We turn the version object into a str here because otherwise
-                # when we're debundled but setuptools isn't, Python will see
-                # packaging.version.Version and
-                # pkg_resources._vendor.packaging.version.Version as different
-                # types. This way we'll use a str as a common data interchange
-                # format. If we stop using the pkg_resources provided specifier
-                # and start using our own, we can drop the cast to str().
-                (str(c.version) for c in candidates),
+                distinct_versions.values(),
                 prereleases=allow_prereleases,
             )
         }
 
-        # Again, converting version to str to deal with debundling.
-        applicable_candidates = [c for c in candidates if str(c.version) in versions]
+        applicable_candidates = [
+            c for c, v in zip(candidates, version_strings) if v in versions
+        ]
 
         filtered_applicable_candidates = filter_unallowed_hashes(
             candidates=applicable_candidates,
@@ -521,10 +559,9 @@ class CandidateEvaluator:
         support_num = len(valid_tags)
         build_tag: BuildTag = ()
         binary_preference = 0
-        link = candidate.link
-        if link.is_wheel:
+        if candidate.is_wheel:
             # can raise InvalidWheelFilename
-            wheel = Wheel(link.filename)
+            wheel = Wheel(candidate.filename)
             try:
                 pri = -(
                     wheel.find_most_preferred_tag(
@@ -545,8 +582,8 @@ class CandidateEvaluator:
                 build_tag = (int(build_tag_groups[0]), build_tag_groups[1])
         else:  # sdist
             pri = -(support_num)
-        has_allowed_hash = int(link.is_hash_allowed(self._hashes))
-        yank_value = -1 * int(link.is_yanked)  # -1 for yanked.
+        has_allowed_hash = int(candidate.is_hash_allowed(self._hashes))
+        yank_value = -1 * int(candidate.is_yanked)  # -1 for yanked.
         return (
             has_allowed_hash,
             yank_value,
@@ -627,7 +664,7 @@ class PackageFinder:
         self.format_control = format_control
 
         # These are boring links that have already been logged somehow.
-        self._logged_links: Set[Tuple[Link, LinkType, str]] = set()
+        self._logged_links: Set[Tuple[str, LinkType, str]] = set()
 
     # Don't include an allow_yanked default value to make sure each call
     # site considers whether yanked releases are allowed. This also causes
@@ -685,6 +722,10 @@ class PackageFinder:
     def index_urls(self) -> List[str]:
         return self.search_scope.index_urls
 
+    @property
+    def session(self) -> PipSession:
+        return self._link_collector.session
+
     @property
     def trusted_hosts(self) -> Iterable[str]:
         for host_port in self._link_collector.session.pip_trusted_origins:
@@ -742,7 +783,8 @@ class PackageFinder:
         return no_eggs + eggs
 
     def _log_skipped_link(self, link: Link, result: LinkType, detail: str) -> None:
-        entry = (link, result, detail)
+        # Keep the URL rather than the link, so that skipped links can be freed.
+        entry = (link.url, result, detail)
         if entry not in self._logged_links:
             # Put the link at the end so the reason is more visible and because
             # the link string is usually very long.
@@ -792,7 +834,12 @@ class PackageFinder:
         if index_response is None:
             return []
 
-        page_links = list(parse_links(index_response))
+        # Files rejected by the cheap filter are never evaluated, so their
+        # "Skipping link" reasons would be missing from debug output.
+        file_filter: Optional[FileFilter] = None
+        if not logger.isEnabledFor(logging.DEBUG):
+            file_filter = link_evaluator.may_be_candidate
+        page_links = list(parse_links(index_response, file_filter))
 
         with indent_log():
             package_links = self.evaluate_links(
@@ -855,6 +902,18 @@ class PackageFinder:
         # This is an intentional priority ordering
         return file_candidates + page_candidates
 
+    def prefetch_candidates(self, project_names: Iterable[str]) -> None:
+        """Start fetching the index pages of the given projects in the
+        background, ahead of find_all_candidates() being called for them.
+
+        This does nothing unless index page prefetching is enabled.
+        """
+        self._link_collector.prefetch(project_names)
+
+    def cancel_prefetch(self) -> None:
+        """Cancel index page fetches started by prefetch_candidates()."""
+        self._link_collector.cancel_prefetch()
+
     def make_candidate_evaluator(
         self,
         project_name: str,
@@ -0,0 +1,198 @@
+"""An index of the distributions installed in a directory.
+
+Listing what is installed means parsing the metadata of every distribution,
+which dominates the run time of ``pip list``, ``pip freeze`` and ``pip check``
+in large environments. The index keeps what those commands need in a file next
+to the distributions. An entry is only used while the inode and modification
+time of its metadata directory are unchanged, so distributions installed,
+removed or modified by other tools are read again.
+"""
+
+import json
+import logging
+import os
+from typing import Container, Dict, List, NamedTuple, Optional, Tuple
+
+from pip._internal.exceptions import NoneMetadataError
+from pip._internal.metadata.base import BaseDistribution
+from pip._internal.models.direct_url import DIRECT_URL_METADATA_NAME
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+
+logger = logging.getLogger(__name__)
+
+# Created by ``pip install --installed-index``.
+INSTALLED_INDEX_FILE_NAME = ".pip-installed-index.json"
+
+_INDEX_VERSION = 1
+
+# Files of the metadata directory that are kept verbatim in the index.
+_INDEXED_FILES = ("INSTALLER", "REQUESTED", DIRECT_URL_METADATA_NAME)
+
+_StatKey = Tuple[int, int]
+
+
+class IndexEntry(NamedTuple):
+    name: str
+    version: str
+    requires: List[str]
+    extras: List[str]
+    # Contents of the indexed files, None for those that do not exist.
+    files: Dict[str, Optional[str]]
+
+
+def _get_stat_key(path: str) -> Optional[_StatKey]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def _make_entry(dist: BaseDistribution) -> Optional[IndexEntry]:
+    """Collect what the index keeps about a distribution.
+
+    Returns None if the metadata cannot be read in full. Such distributions
+    are left out of the index, and read every time as before.
+    """
+    files: Dict[str, Optional[str]] = {}
+    try:
+        metadata = dist.metadata
+        for filename in _INDEXED_FILES:
+            try:
+                files[filename] = dist.read_text(filename)
+            except FileNotFoundError:
+                files[filename] = None
+    except (OSError, ValueError, NoneMetadataError):
+        return None
+    name = metadata.get("Name")
+    version = metadata.get("Version")
+    if not name or not version:
+        return None
+    return IndexEntry(
+        name=str(name),
+        version=str(version),
+        requires=[str(req) for req in metadata.get_all("Requires-Dist", [])],
+        extras=[str(extra) for extra in metadata.get_all("Provides-Extra", [])],
+        files=files,
+    )
+
+
+class InstalledIndex:
+    """The index of the distributions installed in a directory.
+
+    Entries are keyed by the name of their metadata directory. Changes are
+    only written by ``save()``, and only to an index that already exists
+    unless asked to create it. Only installs and uninstalls write the index;
+    listing distributions merely reads it.
+    """
+
+    def __init__(self, location: str) -> None:
+        self.location = location
+        self._path = os.path.join(location, INSTALLED_INDEX_FILE_NAME)
+        self._entries: Dict[str, Tuple[_StatKey, IndexEntry]] = {}
+        self._changed = False
+        self.exists = False
+
+    @classmethod
+    def load(cls, location: str) -> "InstalledIndex":
+        index = cls(location)
+        try:
+            with open(index._path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, NotADirectoryError):
+            return index
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring installed index %s: %s", index._path, e)
+            index.exists = True
+            return index
+        index.exists = True
+        try:
+            if data["version"] != _INDEX_VERSION:
+                return index
+            for key, value in data["distributions"].items():
+                ino, mtime_ns = value.pop("stat")
+                index._entries[key] = ((ino, mtime_ns), IndexEntry(**value))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.debug("Ignoring installed index %s: %s", index._path, e)
+            index._entries.clear()
+        return index
+
+    def get(self, info_location: str) -> Optional[IndexEntry]:
+        """Get the entry of a distribution, if it is still up to date."""
+        try:
+            stat_key, entry = self._entries[os.path.basename(info_location)]
+        except KeyError:
+            return None
+        if _get_stat_key(info_location) != stat_key:
+            return None
+        return entry
+
+    def add(self, dist: BaseDistribution) -> Optional[IndexEntry]:
+        """Read a distribution's metadata into the index."""
+        info_location = dist.info_location
+        if info_location is None:
+            return None
+        # Stat before reading, so a change made meanwhile invalidates the entry.
+        stat_key = _get_stat_key(info_location)
+        if stat_key is None:
+            return None
+        entry = _make_entry(dist)
+        if entry is None:
+            return None
+        self._entries[os.path.basename(info_location)] = (stat_key, entry)
+        self._changed = True
+        return entry
+
+    def discard(self, info_location: str) -> None:
+        if self._entries.pop(os.path.basename(info_location), None) is not None:
+            self._changed = True
+
+    def retain(self, keys: Container[str]) -> None:
+        """Drop the entries of metadata directories not in ``keys``."""
+        for key in [key for key in self._entries if key not in keys]:
+            del self._entries[key]
+            self._changed = True
+
+    def update(self) -> None:
+        """Index every .dist-info directory in the location that is missing or
+        out of date, and drop the entries of those that are gone.
+        """
+        # Avoid a circular import: the backends use the index themselves.
+        from pip._internal.metadata import get_directory_distribution
+
+        try:
+            names = [
+                entry.name
+                for entry in os.scandir(self.location)
+                if entry.name.endswith(".dist-info") and entry.is_dir()
+            ]
+        except OSError as e:
+            logger.debug("Could not update installed index %s: %s", self._path, e)
+            return
+        for name in names:
+            info_location = os.path.join(self.location, name)
+            if self.get(info_location) is None:
+                self.add(get_directory_distribution(info_location))
+        self.retain(set(names))
+
+    def save(self, create: bool = False) -> None:
+        if not self._changed or not (self.exists or create):
+            return
+        data = {
+            "version": _INDEX_VERSION,
+            "distributions": {
+                key: {"stat": list(stat_key), **entry._asdict()}
+                for key, (stat_key, entry) in self._entries.items()
+            },
+        }
+        try:
+            with adjacent_tmp_file(self._path) as f:
+                f.write(json.dumps(data).encode("utf-8"))
+            replace(f.name, self._path)
+        except OSError as e:
+            # The index is only an optimization; read-only installations
+            # simply go without it.
+            logger.debug("Could not write installed index %s: %s", self._path, e)
+            return
+        self._changed = False
+        self.exists = True
@@ -22,7 +22,6 @@ from typing import (
     Union,
 )
 
-from pip._vendor.packaging.requirements import Requirement
 from pip._vendor.packaging.specifiers import InvalidSpecifier, SpecifierSet
 from pip._vendor.packaging.utils import NormalizedName
 from pip._vendor.packaging.version import LegacyVersion, Version
@@ -44,6 +43,8 @@ from ._json import msg_to_json
 
 if TYPE_CHECKING:
     from typing import Protocol
+
+    from pip._vendor.packaging.requirements import Requirement
 else:
     Protocol = object
 
@@ -447,7 +448,9 @@ class BaseDistribution(Protocol):
             return SpecifierSet()
         return spec
 
-    def iter_dependencies(self, extras: Collection[str] = ()) -> Iterable[Requirement]:
+    def iter_dependencies(
+        self, extras: Collection[str] = ()
+    ) -> Iterable["Requirement"]:
         """Dependencies of this distribution.
 
         For modern .dist-info distributions, this is the collection of
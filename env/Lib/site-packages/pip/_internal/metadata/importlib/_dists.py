@@ -4,6 +4,7 @@ import os
 import pathlib
 import zipfile
 from typing import (
+    TYPE_CHECKING,
     Collection,
     Dict,
     Iterable,
@@ -14,11 +15,11 @@ from typing import (
     cast,
 )
 
-from pip._vendor.packaging.requirements import Requirement
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 from pip._vendor.packaging.version import parse as parse_version
 
 from pip._internal.exceptions import InvalidWheel, UnsupportedWheel
+from pip._internal.metadata._index import IndexEntry
 from pip._internal.metadata.base import (
     BaseDistribution,
     BaseEntryPoint,
@@ -33,6 +34,9 @@ from pip._internal.utils.wheel import parse_wheel, read_wheel_metadata_file
 
 from ._compat import BasePath, get_dist_name
 
+if TYPE_CHECKING:
+    from pip._vendor.packaging.requirements import Requirement
+
 
 class WheelDistribution(importlib.metadata.Distribution):
     """An ``importlib.metadata.Distribution`` read from a wheel.
@@ -212,9 +216,16 @@ class Distribution(BaseDistribution):
             safe_extra(extra) for extra in self.metadata.get_all("Provides-Extra", [])
         )
 
-    def iter_dependencies(self, extras: Collection[str] = ()) -> Iterable[Requirement]:
+    def _iter_requires_dist(self) -> Iterable[str]:
+        return self.metadata.get_all("Requires-Dist", [])
+
+    def iter_dependencies(
+        self, extras: Collection[str] = ()
+    ) -> Iterable["Requirement"]:
+        from pip._vendor.packaging.requirements import Requirement
+
         contexts: Sequence[Dict[str, str]] = [{"extra": safe_extra(e)} for e in extras]
-        for req_string in self.metadata.get_all("Requires-Dist", []):
+        for req_string in self._iter_requires_dist():
             req = Requirement(req_string)
             if not req.marker:
                 yield req
@@ -222,3 +233,50 @@ class Distribution(BaseDistribution):
                 yield req
             elif any(req.marker.evaluate(context) for context in contexts):
                 yield req
+
+
+class IndexedDistribution(Distribution):
+    """An installed distribution found in an up-to-date installed index.
+
+    What the index entry holds is served from it without reading the metadata
+    directory. Everything else is read from the directory as usual.
+    """
+
+    def __init__(
+        self,
+        dist: importlib.metadata.Distribution,
+        info_location: Optional[BasePath],
+        installed_location: Optional[BasePath],
+        entry: IndexEntry,
+    ) -> None:
+        super().__init__(dist, info_location, installed_location)
+        self._entry = entry
+
+    @property
+    def raw_name(self) -> str:
+        return self._entry.name
+
+    @property
+    def version(self) -> DistributionVersion:
+        return parse_version(self._entry.version)
+
+    def is_file(self, path: InfoPath) -> bool:
+        try:
+            return self._entry.files[str(path)] is not None
+        except KeyError:
+            return super().is_file(path)
+
+    def read_text(self, path: InfoPath) -> str:
+        try:
+            content = self._entry.files[str(path)]
+        except KeyError:
+            return super().read_text(path)
+        if content is None:
+            raise FileNotFoundError(path)
+        return content
+
+    def iter_provided_extras(self) -> Iterable[str]:
+        return (safe_extra(extra) for extra in self._entry.extras)
+
+    def _iter_requires_dist(self) -> Iterable[str]:
+        return self._entry.requires
@@ -10,13 +10,14 @@ from typing import Iterator, List, Optional, Sequence, Set, Tuple
 
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 
+from pip._internal.metadata._index import IndexEntry, InstalledIndex
 from pip._internal.metadata.base import BaseDistribution, BaseEnvironment
 from pip._internal.models.wheel import Wheel
 from pip._internal.utils.deprecation import deprecated
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
 
 from ._compat import BadMetadata, BasePath, get_dist_name, get_info_location
-from ._dists import Distribution
+from ._dists import Distribution, IndexedDistribution
 
 logger = logging.getLogger(__name__)
 
@@ -44,13 +45,21 @@ class _DistributionFinder:
     installations as well. It's useful feature, after all.
     """
 
-    FoundResult = Tuple[importlib.metadata.Distribution, Optional[BasePath]]
+    FoundResult = Tuple[
+        importlib.metadata.Distribution, Optional[BasePath], Optional[IndexEntry]
+    ]
 
     def __init__(self) -> None:
         self._found_names: Set[NormalizedName] = set()
 
-    def _find_impl(self, location: str) -> Iterator[FoundResult]:
-        """Find distributions in a location."""
+    def _find_impl(
+        self, location: str, index: Optional[InstalledIndex] = None
+    ) -> Iterator[FoundResult]:
+        """Find distributions in a location.
+
+        If an index is given, the names of distributions with an up-to-date
+        entry are taken from it instead of their metadata.
+        """
         # Skip looking inside a wheel. Since a package inside a wheel is not
         # always valid (due to .data directories etc.), its .dist-info entry
         # should not be considered an installed distribution.
@@ -60,28 +69,42 @@ class _DistributionFinder:
         # paths one by one, instead of dumping the list to importlib.metadata.
         for dist in importlib.metadata.distributions(path=[location]):
             info_location = get_info_location(dist)
-            try:
-                raw_name = get_dist_name(dist)
-            except BadMetadata as e:
-                logger.warning("Skipping %s due to %s", info_location, e.reason)
-                continue
+            entry = None
+            if index is not None and info_location is not None:
+                entry = index.get(str(info_location))
+            if entry is not None:
+                raw_name = entry.name
+            else:
+                try:
+                    raw_name = get_dist_name(dist)
+                except BadMetadata as e:
+                    logger.warning("Skipping %s due to %s", info_location, e.reason)
+                    continue
             normalized_name = canonicalize_name(raw_name)
             if normalized_name in self._found_names:
                 continue
             self._found_names.add(normalized_name)
-            yield dist, info_location
+            yield dist, info_location, entry
 
     def find(self, location: str) -> Iterator[BaseDistribution]:
         """Find distributions in a location.
 
-        The path can be either a directory, or a ZIP archive.
+        The path can be either a directory, or a ZIP archive. If the location
+        has an installed index, distributions with an up-to-date entry are
+        served from it. The index is never written here.
         """
-        for dist, info_location in self._find_impl(location):
+        index = InstalledIndex.load(location)
+        for dist, info_location, entry in self._find_impl(location, index):
             if info_location is None:
                 installed_location: Optional[BasePath] = None
             else:
                 installed_location = info_location.parent
-            yield Distribution(dist, info_location, installed_location)
+            if entry is not None:
+                yield IndexedDistribution(
+                    dist, info_location, installed_location, entry
+                )
+            else:
+                yield Distribution(dist, info_location, installed_location)
 
     def find_linked(self, location: str) -> Iterator[BaseDistribution]:
         """Read location in egg-link files and return distributions in there.
@@ -104,20 +127,22 @@ class _DistributionFinder:
             if not target_rel:
                 continue
             target_location = str(path.joinpath(target_rel))
-            for dist, info_location in self._find_impl(target_location):
+            for dist, info_location, _ in self._find_impl(target_location):
                 yield Distribution(dist, info_location, path)
 
     def _find_eggs_in_dir(self, location: str) -> Iterator[BaseDistribution]:
+        with os.scandir(location) as it:
+            egg_paths = [entry.path for entry in it if entry.name.endswith(".egg")]
+        if not egg_paths:
+            return
+
         from pip._vendor.pkg_resources import find_distributions
 
         from pip._internal.metadata import pkg_resources as legacy
 
-        with os.scandir(location) as it:
-            for entry in it:
-                if not entry.name.endswith(".egg"):
-                    continue
-                for dist in find_distributions(entry.path):
-                    yield legacy.Distribution(dist)
+        for egg_path in egg_paths:
+            for dist in find_distributions(egg_path):
+                yield legacy.Distribution(dist)
 
     def _find_eggs_in_zip(self, location: str) -> Iterator[BaseDistribution]:
         from pip._vendor.pkg_resources import find_eggs_in_zip
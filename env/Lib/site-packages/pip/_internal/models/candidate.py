@@ -1,24 +1,94 @@
-from pip._vendor.packaging.version import parse as parse_version
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 
-from pip._internal.models.link import Link
+from pip._internal.models.link import Link, MetadataFile
+from pip._internal.utils.filetypes import WHEEL_EXTENSION
+from pip._internal.utils.hashes import Hashes
+from pip._internal.utils.misc import splitext
 from pip._internal.utils.models import KeyBasedCompareMixin
+from pip._internal.utils.packaging import get_version
+
+if TYPE_CHECKING:
+    from pip._internal.index.collector import IndexContent
 
 
 class InstallationCandidate(KeyBasedCompareMixin):
-    """Represents a potential "candidate" for installation."""
+    """Represents a potential "candidate" for installation.
+
+    Candidates are kept for every file of every version of a project, so they
+    do not hold on to the Link they were found at. What is needed to evaluate
+    and sort them is kept in plain attributes, and the Link is only made again
+    when it is asked for, usually for the candidates that end up being used.
+    """
 
-    __slots__ = ["name", "version", "link"]
+    __slots__ = [
+        "name",
+        "version",
+        "url",
+        "filename",
+        "yanked_reason",
+        "_hashes",
+        "_comes_from",
+        "_requires_python",
+        "_metadata_file_data",
+        "_cache_link_parsing",
+        "_link",
+    ]
 
     def __init__(self, name: str, version: str, link: Link) -> None:
         self.name = name
-        self.version = parse_version(version)
-        self.link = link
+        self.version = get_version(version)
+        self.url = link.url
+        self.filename = link.filename
+        self.yanked_reason = link.yanked_reason
+        # Usually a single hash; a tuple of items is much smaller than a dict.
+        self._hashes: Tuple[Tuple[str, str], ...] = tuple(link._hashes.items())
+        self._comes_from: Optional[Union[str, "IndexContent"]] = link.comes_from
+        self._requires_python = link.requires_python
+        self._metadata_file_data: Optional[MetadataFile] = link.metadata_file_data
+        self._cache_link_parsing = link.cache_link_parsing
+        self._link: Optional[Link] = None
 
+        # Links compare by their URL, so comparing the URL is equivalent.
         super().__init__(
-            key=(self.name, self.version, self.link),
+            key=(self.name, self.version, self.url),
             defining_class=InstallationCandidate,
         )
 
+    @property
+    def link(self) -> Link:
+        if self._link is None:
+            self._link = Link(
+                self.url,
+                comes_from=self._comes_from,
+                requires_python=self._requires_python,
+                yanked_reason=self.yanked_reason,
+                metadata_file_data=self._metadata_file_data,
+                cache_link_parsing=self._cache_link_parsing,
+                hashes=dict(self._hashes),
+            )
+        return self._link
+
+    @property
+    def is_wheel(self) -> bool:
+        return splitext(self.filename)[1] == WHEEL_EXTENSION
+
+    @property
+    def is_yanked(self) -> bool:
+        return self.yanked_reason is not None
+
+    @property
+    def has_hash(self) -> bool:
+        return bool(self._hashes)
+
+    def is_hash_allowed(self, hashes: Optional[Hashes]) -> bool:
+        """
+        Return True if the candidate's file has a hash and it is allowed by
+        `hashes`.
+        """
+        if hashes is None:
+            return False
+        return any(hashes.is_hash_allowed(k, v) for k, v in self._hashes)
+
     def __repr__(self) -> str:
         return "<InstallationCandidate({!r}, {!r}, {!r})>".format(
             self.name,
@@ -362,6 +362,22 @@ class Link(KeyBasedCompareMixin):
             metadata_file_data=metadata_file_data,
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Convert this Link into a file of a pypi json document, such that
+        from_json() creates an equal Link from it.
+        """
+        file_data: Dict[str, Any] = {"url": self._url, "hashes": dict(self._hashes)}
+        if self.requires_python is not None:
+            file_data["requires-python"] = self.requires_python
+        if self.yanked_reason:
+            file_data["yanked"] = self.yanked_reason
+        elif self.yanked_reason is not None:
+            file_data["yanked"] = True
+        if self.metadata_file_data is not None:
+            file_data["core-metadata"] = self.metadata_file_data.hashes or True
+        return file_data
+
     def __str__(self) -> str:
         if self.requires_python:
             rp = f" (requires-python:{self.requires_python})"
@@ -1,5 +1,5 @@
 import sys
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pip._vendor.packaging.tags import Tag
 
@@ -22,6 +22,7 @@ class TargetPython:
         "py_version",
         "py_version_info",
         "_valid_tags",
+        "_tag_priorities",
     ]
 
     def __init__(
@@ -63,6 +64,8 @@ class TargetPython:
 
         # This is used to cache the return value of get_tags().
         self._valid_tags: Optional[List[Tag]] = None
+        # This is used to cache the return value of get_tag_priorities().
+        self._tag_priorities: Optional[Dict[Tag, int]] = None
 
     def format_given(self) -> str:
         """
@@ -108,3 +111,18 @@ class TargetPython:
             self._valid_tags = tags
 
         return self._valid_tags
+
+    def get_tag_priorities(self) -> Dict[Tag, int]:
+        """
+        Return a mapping from each supported tag to its index in get_tags().
+
+        Lower values are more preferred. Looking tags up in this mapping is
+        much cheaper than scanning the list of tags, which can be long.
+        """
+        if self._tag_priorities is None:
+            priorities: Dict[Tag, int] = {}
+            for index, tag in enumerate(self.get_tags()):
+                priorities.setdefault(tag, index)
+            self._tag_priorities = priorities
+
+        return self._tag_priorities
@@ -1,14 +1,30 @@
 """Represents a wheel file and provides access to the various parts of the
 name that have meaning.
 """
+import functools
 import re
-from typing import Dict, Iterable, List
+from typing import Dict, FrozenSet, Iterable, List
 
 from pip._vendor.packaging.tags import Tag
 
 from pip._internal.exceptions import InvalidWheelFilename
 
 
+@functools.lru_cache(maxsize=None)
+def _get_file_tags(pyversions: str, abis: str, plats: str) -> FrozenSet[Tag]:
+    """Get all the tag combinations of a wheel's compressed tag set.
+
+    Many wheels of a project share their tags, and the same filenames are
+    parsed over and over, so the tags are only made once.
+    """
+    return frozenset(
+        Tag(x, y, z)
+        for x in pyversions.split(".")
+        for y in abis.split(".")
+        for z in plats.split(".")
+    )
+
+
 class Wheel:
     """A wheel file"""
 
@@ -37,9 +53,9 @@ class Wheel:
         self.plats = wheel_info.group("plat").split(".")
 
         # All the tag combinations from this file
-        self.file_tags = {
-            Tag(x, y, z) for x in self.pyversions for y in self.abis for z in self.plats
-        }
+        self.file_tags = _get_file_tags(
+            wheel_info.group("pyver"), wheel_info.group("abi"), wheel_info.group("plat")
+        )
 
     def get_formatted_file_tags(self) -> List[str]:
         """Return the wheel's tags as a sorted list of strings."""
@@ -87,6 +103,10 @@ class Wheel:
     def supported(self, tags: Iterable[Tag]) -> bool:
         """Return whether the wheel is compatible with one of the given tags.
 
-        :param tags: the PEP 425 tags to check the wheel against.
+        :param tags: the PEP 425 tags to check the wheel against. A set or a
+            mapping (e.g. ``TargetPython.get_tag_priorities()``) is checked in
+            time proportional to the wheel's own tags only.
         """
+        if isinstance(tags, (set, frozenset, dict)):
+            return any(tag in tags for tag in self.file_tags)
         return not self.file_tags.isdisjoint(tags)
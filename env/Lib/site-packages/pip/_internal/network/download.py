@@ -4,17 +4,25 @@ import email.message
 import logging
 import mimetypes
 import os
-from typing import Iterable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Mapping, Optional, Tuple
 
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
 
-from pip._internal.cli.progress_bars import get_download_progress_renderer
-from pip._internal.exceptions import NetworkConnectionError
+from pip._internal.cache import ArtifactCache
+from pip._internal.cli.progress_bars import (
+    BatchDownloadProgressRenderer,
+    get_batch_download_progress_renderer,
+    get_download_progress_renderer,
+)
+from pip._internal.exceptions import HashError, NetworkConnectionError
 from pip._internal.models.index import PyPI
 from pip._internal.models.link import Link
 from pip._internal.network.cache import is_from_cache
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
+from pip._internal.utils.filesystem import link_or_copy
+from pip._internal.utils.hashes import FAVORITE_HASH, Hashes
 from pip._internal.utils.misc import format_size, redact_auth_from_url, splitext
 
 logger = logging.getLogger(__name__)
@@ -27,13 +35,7 @@ def _get_http_response_size(resp: Response) -> Optional[int]:
         return None
 
 
-def _prepare_download(
-    resp: Response,
-    link: Link,
-    progress_bar: str,
-) -> Iterable[bytes]:
-    total_length = _get_http_response_size(resp)
-
+def _get_logged_url(link: Link, total_length: Optional[int]) -> str:
     if link.netloc == PyPI.file_storage_domain:
         url = link.show_url
     else:
@@ -43,6 +45,16 @@ def _prepare_download(
 
     if total_length:
         logged_url = "{} ({})".format(logged_url, format_size(total_length))
+    return logged_url
+
+
+def _prepare_download(
+    resp: Response,
+    link: Link,
+    progress_bar: str,
+) -> Iterable[bytes]:
+    total_length = _get_http_response_size(resp)
+    logged_url = _get_logged_url(link, total_length)
 
     if is_from_cache(resp):
         logger.info("Using cached %s", logged_url)
@@ -69,6 +81,58 @@ def _prepare_download(
     return renderer(chunks)
 
 
+def _save_chunks(
+    chunks: Iterable[bytes],
+    filepath: str,
+    hashes: Optional[Hashes],
+    artifact_cache: Optional[ArtifactCache],
+) -> None:
+    """Write downloaded chunks to filepath, checking them against hashes.
+
+    The chunks are hashed as they are written, so the file is verified as soon
+    as it is complete, without reading it again. Raise HashMismatch if none of
+    the hashes match. Verified files are kept in the artifact cache.
+    """
+    gots = hashes.new_hashers() if hashes else {}
+    with open(filepath, "wb") as content_file:
+        for chunk in chunks:
+            content_file.write(chunk)
+            for got in gots.values():
+                got.update(chunk)
+    if hashes:
+        hashes.check_against_hashers(gots)
+        if artifact_cache is not None and FAVORITE_HASH in gots:
+            artifact_cache.save(filepath, gots[FAVORITE_HASH].hexdigest())
+
+
+def _get_cached_artifact(
+    link: Link,
+    location: str,
+    hashes: Optional[Hashes],
+    artifact_cache: Optional[ArtifactCache],
+) -> Optional[str]:
+    """Put the stored copy of the file given by link into location, if any.
+
+    The copy is a hard link where possible. It is checked against hashes like
+    a download would be, since a linked file may have been changed in place.
+    """
+    if artifact_cache is None or not hashes:
+        return None
+    cached_path = artifact_cache.get(hashes)
+    if cached_path is None:
+        return None
+    filepath = os.path.join(location, link.filename)
+    try:
+        link_or_copy(cached_path, filepath)
+        hashes.check_against_path(filepath)
+    except (OSError, HashError) as e:
+        logger.debug("Ignoring artifact cache entry %s: %s", cached_path, e)
+        if isinstance(e, HashError):
+            artifact_cache.remove(cached_path)
+        return None
+    return filepath
+
+
 def sanitize_content_filename(filename: str) -> str:
     """
     Sanitize the "filename" value from a Content-Disposition header.
@@ -124,12 +188,26 @@ class Downloader:
         self,
         session: PipSession,
         progress_bar: str,
+        artifact_cache: Optional[ArtifactCache] = None,
     ) -> None:
         self._session = session
         self._progress_bar = progress_bar
+        self._artifact_cache = artifact_cache
+
+    def __call__(
+        self, link: Link, location: str, hashes: Optional[Hashes] = None
+    ) -> Tuple[str, str]:
+        """Download the file given by link into location.
+
+        If hashes are given, the file is checked against them while it is
+        downloaded, and HashMismatch is raised if none of them match. A file
+        matching them in the artifact cache is used instead of downloading.
+        """
+        filepath = _get_cached_artifact(link, location, hashes, self._artifact_cache)
+        if filepath is not None:
+            logger.info("Using cached %s", link.filename)
+            return filepath, mimetypes.guess_type(filepath)[0] or ""
 
-    def __call__(self, link: Link, location: str) -> Tuple[str, str]:
-        """Download the file given by link into location."""
         try:
             resp = _http_get_download(self._session, link)
         except NetworkConnectionError as e:
@@ -143,9 +221,7 @@ class Downloader:
         filepath = os.path.join(location, filename)
 
         chunks = _prepare_download(resp, link, self._progress_bar)
-        with open(filepath, "wb") as content_file:
-            for chunk in chunks:
-                content_file.write(chunk)
+        _save_chunks(chunks, filepath, hashes, self._artifact_cache)
         content_type = resp.headers.get("Content-Type", "")
         return filepath, content_type
 
@@ -155,15 +231,43 @@ class BatchDownloader:
         self,
         session: PipSession,
         progress_bar: str,
+        workers: int = 1,
+        artifact_cache: Optional[ArtifactCache] = None,
     ) -> None:
         self._session = session
         self._progress_bar = progress_bar
+        self._workers = workers
+        self._artifact_cache = artifact_cache
 
     def __call__(
-        self, links: Iterable[Link], location: str
+        self,
+        links: Iterable[Link],
+        location: str,
+        hashes: Optional[Mapping[Link, Hashes]] = None,
     ) -> Iterable[Tuple[Link, Tuple[str, str]]]:
-        """Download the files given by links into location."""
+        """Download the files given by links into location.
+
+        Results are yielded in the order of links, regardless of how many
+        downloads run concurrently. Files are checked against their entry in
+        hashes, if any, while they are downloaded.
+        """
+        links = list(links)
+        if hashes is None:
+            hashes = {}
+        if self._workers > 1 and len(links) > 1:
+            yield from self._download_concurrently(links, location, hashes)
+            return
+
         for link in links:
+            link_hashes = hashes.get(link)
+            filepath = _get_cached_artifact(
+                link, location, link_hashes, self._artifact_cache
+            )
+            if filepath is not None:
+                logger.info("Using cached %s", link.filename)
+                yield link, (filepath, mimetypes.guess_type(filepath)[0] or "")
+                continue
+
             try:
                 resp = _http_get_download(self._session, link)
             except NetworkConnectionError as e:
@@ -179,8 +283,77 @@ class BatchDownloader:
             filepath = os.path.join(location, filename)
 
             chunks = _prepare_download(resp, link, self._progress_bar)
-            with open(filepath, "wb") as content_file:
-                for chunk in chunks:
-                    content_file.write(chunk)
+            _save_chunks(chunks, filepath, link_hashes, self._artifact_cache)
             content_type = resp.headers.get("Content-Type", "")
             yield link, (filepath, content_type)
+
+    def _download_concurrently(
+        self, links: List[Link], location: str, hashes: Mapping[Link, Hashes]
+    ) -> Iterable[Tuple[Link, Tuple[str, str]]]:
+        # The progress display and worker threads must not interleave with
+        # regular log output, so every file is fetched before anything is
+        # logged or yielded.
+        if logger.getEffectiveLevel() > logging.INFO:
+            bar_type = "off"
+        else:
+            bar_type = self._progress_bar
+        workers = min(self._workers, len(links))
+        logger.info("Downloading %d files (%d in parallel)", len(links), workers)
+
+        progress = get_batch_download_progress_renderer(
+            bar_type=bar_type, count=len(links)
+        )
+        with progress as renderer, ThreadPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(
+                    self._download_one, link, location, hashes.get(link), renderer
+                )
+                for link in links
+            ]
+            try:
+                results = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        for link, (logged_url, filepath, content_type) in zip(links, results):
+            logger.info("Saved %s", logged_url)
+            yield link, (filepath, content_type)
+
+    def _download_one(
+        self,
+        link: Link,
+        location: str,
+        hashes: Optional[Hashes],
+        renderer: BatchDownloadProgressRenderer,
+    ) -> Tuple[str, str, str]:
+        filepath = _get_cached_artifact(link, location, hashes, self._artifact_cache)
+        if filepath is not None:
+            content_type = mimetypes.guess_type(filepath)[0] or ""
+            return f"{link.filename} (cached)", filepath, content_type
+
+        try:
+            resp = _http_get_download(self._session, link)
+        except NetworkConnectionError as e:
+            assert e.response is not None
+            logger.critical(
+                "HTTP error %s while getting %s",
+                e.response.status_code,
+                link,
+            )
+            raise
+
+        filename = _get_http_response_filename(resp, link)
+        filepath = os.path.join(location, filename)
+
+        total_length = _get_http_response_size(resp)
+        logged_url = _get_logged_url(link, total_length)
+        chunks: Iterable[bytes] = response_chunks(resp, CONTENT_CHUNK_SIZE)
+        if is_from_cache(resp):
+            logged_url = f"{logged_url} (cached)"
+        else:
+            chunks = renderer(chunks, total_length)
+        _save_chunks(chunks, filepath, hashes, self._artifact_cache)
+        content_type = resp.headers.get("Content-Type", "")
+        return logged_url, filepath, content_type
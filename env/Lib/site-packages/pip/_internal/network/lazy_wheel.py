@@ -2,6 +2,8 @@
 
 __all__ = ["HTTPRangeRequestUnsupported", "dist_from_wheel_url"]
 
+import re
+import struct
 from bisect import bisect_left, bisect_right
 from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
@@ -11,9 +13,21 @@ from zipfile import BadZipFile, ZipFile
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
 
+from pip._internal.exceptions import UnsupportedWheel
 from pip._internal.metadata import BaseDistribution, MemoryWheel, get_wheel_distribution
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
+from pip._internal.utils.wheel import wheel_dist_info_dir
+
+
+# How many bytes to fetch from the end of a wheel first. This is usually
+# enough for the central directory, and often for the .dist-info directory.
+TAIL_SIZE = 64 * 1024
+
+# The "end of central directory" record of a ZIP file, without its comment.
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_STRUCT = struct.Struct("<4s4H2LH")
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
 
 
 class HTTPRangeRequestUnsupported(Exception):
@@ -29,6 +43,8 @@ def dist_from_wheel_url(name: str, url: str, session: PipSession) -> BaseDistrib
     is raised.
     """
     with LazyZipOverHTTP(url, session) as zf:
+        # All of the .dist-info directory is read below, fetch it at once.
+        zf.prefetch_dist_info(name)
         # For read-only ZIP files, ZipFile only needs methods read,
         # seek, seekable and tell, not the whole IO protocol.
         wheel = MemoryWheel(zf.name, zf)  # type: ignore
@@ -44,22 +60,20 @@ class LazyZipOverHTTP:
     which is supposed to be fed to ZipFile.  If such requests are not
     supported by the server, raise HTTPRangeRequestUnsupported
     during initialization.
+
+    The first request fetches the tail of the file, which tells its length
+    and usually holds its central directory, so that no HEAD request or
+    probing for the start of the central directory is needed.
     """
 
     def __init__(
         self, url: str, session: PipSession, chunk_size: int = CONTENT_CHUNK_SIZE
     ) -> None:
-        head = session.head(url, headers=HEADERS)
-        raise_for_status(head)
-        assert head.status_code == 200
         self._session, self._url, self._chunk_size = session, url, chunk_size
-        self._length = int(head.headers["Content-Length"])
         self._file = NamedTemporaryFile()
-        self.truncate(self._length)
         self._left: List[int] = []
         self._right: List[int] = []
-        if "bytes" not in head.headers.get("Accept-Ranges", "none"):
-            raise HTTPRangeRequestUnsupported("range request is not supported")
+        self._download_tail()
         self._check_zip()
 
     @property
@@ -95,8 +109,12 @@ class LazyZipOverHTTP:
         download_size = max(size, self._chunk_size)
         start, length = self.tell(), self._length
         stop = length if size < 0 else min(start + download_size, length)
-        start = max(0, stop - download_size)
-        self._download(start, stop - 1)
+        # Only fetch more than asked for if something is missing, or reads
+        # of prefetched files would fetch the files around them as well.
+        needed_stop = stop if size < 0 else min(start + size, length)
+        if not self._is_downloaded(start, needed_stop - 1):
+            start = max(0, stop - download_size)
+            self._download(start, stop - 1)
         return self._file.read(size)
 
     def readable(self) -> bool:
@@ -150,8 +168,63 @@ class LazyZipOverHTTP:
         finally:
             self.seek(pos)
 
+    def _download_tail(self) -> None:
+        """Download the last TAIL_SIZE bytes, and learn the file's length."""
+        response = self._stream_response_suffix(TAIL_SIZE)
+        raise_for_status(response)
+        match = _CONTENT_RANGE_RE.fullmatch(
+            response.headers.get("Content-Range", "").strip()
+        )
+        if response.status_code != 206 or match is None:
+            # The server sent the whole file, don't download it here.
+            response.close()
+            raise HTTPRangeRequestUnsupported("range request is not supported")
+        start, end, self._length = map(int, match.groups())
+        self.truncate(self._length)
+        with self._stay():
+            self.seek(start)
+            for chunk in response_chunks(response, self._chunk_size):
+                self._file.write(chunk)
+        self._left, self._right = [start], [end]
+
+    def _find_central_directory(self) -> Optional[int]:
+        """Find the offset of the central directory from the downloaded tail.
+
+        Return None if the end of central directory record cannot be read
+        from the tail, e.g. because the file is a ZIP64 file.
+        """
+        tail_start = self._left[-1]
+        with self._stay():
+            self.seek(tail_start)
+            tail = self._file.read()
+        eocd_start = tail.rfind(_EOCD_SIGNATURE)
+        if eocd_start < 0 or len(tail) - eocd_start < _EOCD_STRUCT.size:
+            return None
+        *_, entries, size, offset, comment_length = _EOCD_STRUCT.unpack_from(
+            tail, eocd_start
+        )
+        if eocd_start + _EOCD_STRUCT.size + comment_length != len(tail):
+            return None
+        if entries == 0xFFFF or offset == 0xFFFFFFFF:
+            return None
+        if offset + size != tail_start + eocd_start:
+            return None
+        return offset
+
     def _check_zip(self) -> None:
         """Check and download until the file is a valid ZIP."""
+        offset = self._find_central_directory()
+        if offset is not None:
+            # Download the rest of the central directory in one request.
+            self._download(offset, self._length - 1)
+            with self._stay():
+                try:
+                    ZipFile(self)  # type: ignore
+                except BadZipFile:
+                    pass
+                else:
+                    return
+
         end = self._length - 1
         for start in reversed(range(0, end, self._chunk_size)):
             self._download(start, end)
@@ -165,12 +238,60 @@ class LazyZipOverHTTP:
                 else:
                     break
 
+    def prefetch_dist_info(self, name: str) -> None:
+        """Download the .dist-info directory of the wheel of project name.
+
+        This covers the local headers and data of all of its files, which
+        would otherwise be fetched with a request for each of them. Files
+        that are stored next to each other are fetched in one request, but
+        the files of other directories between them are never fetched.
+        """
+        with self._stay():
+            # This only reads the central directory, which is downloaded.
+            zf = ZipFile(self)  # type: ignore
+        try:
+            info_dir = wheel_dist_info_dir(zf, name)
+        except UnsupportedWheel:
+            # Reading the metadata will report the problem.
+            return
+        infolist = zf.infolist()
+        offsets = sorted({info.header_offset for info in infolist})
+        ranges = []
+        for info in infolist:
+            if info.filename.split("/", 1)[0] != info_dir:
+                continue
+            # A file's local header and data end where the next file begins.
+            index = bisect_right(offsets, info.header_offset)
+            if index < len(offsets):
+                next_offset = offsets[index]
+            else:
+                next_offset = self._length
+            ranges.append((info.header_offset, next_offset - 1))
+        ranges.sort()
+        merged: List[List[int]] = []
+        for start, end in ranges:
+            if merged and merged[-1][1] + 1 >= start:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            self._download(start, end)
+
     def _stream_response(
         self, start: int, end: int, base_headers: Dict[str, str] = HEADERS
     ) -> Response:
         """Return HTTP response to a range request from start to end."""
+        return self._stream_range(f"bytes={start}-{end}", base_headers)
+
+    def _stream_response_suffix(
+        self, length: int, base_headers: Dict[str, str] = HEADERS
+    ) -> Response:
+        """Return HTTP response to a range request for the last length bytes."""
+        return self._stream_range(f"bytes=-{length}", base_headers)
+
+    def _stream_range(self, byte_range: str, base_headers: Dict[str, str]) -> Response:
         headers = base_headers.copy()
-        headers["Range"] = f"bytes={start}-{end}"
+        headers["Range"] = byte_range
         # TODO: Get range requests to be correctly cached
         headers["Cache-Control"] = "no-cache"
         return self._session.get(self._url, headers=headers, stream=True)
@@ -197,6 +318,19 @@ class LazyZipOverHTTP:
             yield i, end
         self._left[left:right], self._right[left:right] = [start], [end]
 
+    def _is_downloaded(self, start: int, end: int) -> bool:
+        """Return whether bytes from start to end inclusively are downloaded."""
+        index = bisect_right(self._left, start) - 1
+        while index >= 0 and index < len(self._left):
+            if self._left[index] > start:
+                return False
+            if self._right[index] >= end:
+                return True
+            # Downloaded intervals may be adjacent without being merged.
+            start = self._right[index] + 1
+            index += 1
+        return False
+
     def _download(self, start: int, end: int) -> None:
         """Download bytes from start to end inclusively."""
         with self._stay():
@@ -2,10 +2,11 @@
 """
 
 import logging
-from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
+from pip._vendor.packaging.markers import Marker, default_environment
 from pip._vendor.packaging.requirements import Requirement
-from pip._vendor.packaging.specifiers import LegacySpecifier
+from pip._vendor.packaging.specifiers import LegacySpecifier, SpecifierSet
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 from pip._vendor.packaging.version import LegacyVersion
 
@@ -51,6 +52,108 @@ def create_package_set_from_installed() -> Tuple[PackageSet, bool]:
     return package_set, problems
 
 
+class DependencyChecker:
+    """Check the dependencies of packages in a package set.
+
+    Every distinct marker is evaluated once against the environment, and every
+    distinct specifier once per version it is checked against. The checker
+    also keeps track of which packages depend on which, so that changing a
+    few packages only requires checking those and their dependents.
+    """
+
+    def __init__(self, package_set: PackageSet) -> None:
+        self.package_set = package_set
+        self._environment = default_environment()
+        self._environment["extra"] = ""
+        self._marker_results: Dict[str, bool] = {}
+        self._contains_results: Dict[Tuple[str, str], bool] = {}
+        self._dependents: Dict[NormalizedName, Set[NormalizedName]] = {}
+        for package_name, package_detail in package_set.items():
+            self._add_dependents(package_name, package_detail)
+
+    def _add_dependents(
+        self, package_name: NormalizedName, package_detail: PackageDetails
+    ) -> None:
+        for req in package_detail.dependencies:
+            name = canonicalize_name(req.name)
+            self._dependents.setdefault(name, set()).add(package_name)
+
+    def _evaluate_marker(self, marker: Marker) -> bool:
+        key = str(marker)
+        try:
+            return self._marker_results[key]
+        except KeyError:
+            pass
+        result = self._marker_results[key] = marker.evaluate(self._environment)
+        return result
+
+    def _contains(
+        self, specifier: SpecifierSet, version: DistributionVersion
+    ) -> bool:
+        key = (str(specifier), str(version))
+        try:
+            return self._contains_results[key]
+        except KeyError:
+            pass
+        result = specifier.contains(version, prereleases=True)
+        self._contains_results[key] = result
+        return result
+
+    def update(self, package_name: NormalizedName, details: PackageDetails) -> None:
+        """Add or replace a package, as installing it would."""
+        self.package_set[package_name] = details
+        self._add_dependents(package_name, details)
+
+    def get_dependents(self, names: Iterable[NormalizedName]) -> Set[NormalizedName]:
+        """Get the packages that depend on any of ``names``."""
+        dependents: Set[NormalizedName] = set()
+        for name in names:
+            for package_name in self._dependents.get(name, ()):
+                package_detail = self.package_set[package_name]
+                # The index can be stale for packages that have been replaced.
+                if any(
+                    canonicalize_name(req.name) == name
+                    for req in package_detail.dependencies
+                ):
+                    dependents.add(package_name)
+        return dependents
+
+    def check(self, package_names: Iterable[NormalizedName]) -> CheckResult:
+        """Check the dependencies of the given packages."""
+        package_set = self.package_set
+        missing = {}
+        conflicting = {}
+
+        for package_name in package_names:
+            # Info about dependencies of package_name
+            missing_deps: Set[Missing] = set()
+            conflicting_deps: Set[Conflicting] = set()
+
+            for req in package_set[package_name].dependencies:
+                name = canonicalize_name(req.name)
+
+                # Check if it's missing
+                if name not in package_set:
+                    missed = True
+                    if req.marker is not None:
+                        missed = self._evaluate_marker(req.marker)
+                    if missed:
+                        missing_deps.add((name, req))
+                    continue
+
+                # Check if there's a conflict
+                version = package_set[name].version
+                if not self._contains(req.specifier, version):
+                    conflicting_deps.add((name, version, req))
+
+            if missing_deps:
+                missing[package_name] = sorted(missing_deps, key=str)
+            if conflicting_deps:
+                conflicting[package_name] = sorted(conflicting_deps, key=str)
+
+        return missing, conflicting
+
+
 def check_package_set(
     package_set: PackageSet, should_ignore: Optional[Callable[[str], bool]] = None
 ) -> CheckResult:
@@ -62,40 +165,12 @@ def check_package_set(
 
     warn_legacy_versions_and_specifiers(package_set)
 
-    missing = {}
-    conflicting = {}
-
-    for package_name, package_detail in package_set.items():
-        # Info about dependencies of package_name
-        missing_deps: Set[Missing] = set()
-        conflicting_deps: Set[Conflicting] = set()
-
-        if should_ignore and should_ignore(package_name):
-            continue
-
-        for req in package_detail.dependencies:
-            name = canonicalize_name(req.name)
-
-            # Check if it's missing
-            if name not in package_set:
-                missed = True
-                if req.marker is not None:
-                    missed = req.marker.evaluate({"extra": ""})
-                if missed:
-                    missing_deps.add((name, req))
-                continue
-
-            # Check if there's a conflict
-            version = package_set[name].version
-            if not req.specifier.contains(version, prereleases=True):
-                conflicting_deps.add((name, version, req))
-
-        if missing_deps:
-            missing[package_name] = sorted(missing_deps, key=str)
-        if conflicting_deps:
-            conflicting[package_name] = sorted(conflicting_deps, key=str)
-
-    return missing, conflicting
+    checker = DependencyChecker(package_set)
+    return checker.check(
+        package_name
+        for package_name in package_set
+        if not (should_ignore and should_ignore(package_name))
+    )
 
 
 def check_install_conflicts(to_install: List[InstallRequirement]) -> ConflictDetails:
@@ -104,22 +179,24 @@ def check_install_conflicts(to_install: List[InstallRequirement]) -> ConflictDet
     """
     # Start from the current state
     package_set, _ = create_package_set_from_installed()
+    checker = DependencyChecker(package_set)
     # Install packages
-    would_be_installed = _simulate_installation_of(to_install, package_set)
+    would_be_installed = _simulate_installation_of(to_install, checker)
 
     # Only warn about directly-dependent packages; create a whitelist of them
-    whitelist = _create_whitelist(would_be_installed, package_set)
+    whitelist = would_be_installed | checker.get_dependents(would_be_installed)
 
+    warn_legacy_versions_and_specifiers(package_set)
     return (
         package_set,
-        check_package_set(
-            package_set, should_ignore=lambda name: name not in whitelist
+        checker.check(
+            package_name for package_name in package_set if package_name in whitelist
         ),
     )
 
 
 def _simulate_installation_of(
-    to_install: List[InstallRequirement], package_set: PackageSet
+    to_install: List[InstallRequirement], checker: DependencyChecker
 ) -> Set[NormalizedName]:
     """Computes the version of packages after installing to_install."""
     # Keep track of packages that were installed
@@ -130,30 +207,14 @@ def _simulate_installation_of(
         abstract_dist = make_distribution_for_install_requirement(inst_req)
         dist = abstract_dist.get_metadata_distribution()
         name = dist.canonical_name
-        package_set[name] = PackageDetails(dist.version, list(dist.iter_dependencies()))
+        details = PackageDetails(dist.version, list(dist.iter_dependencies()))
+        checker.update(name, details)
 
         installed.add(name)
 
     return installed
 
 
-def _create_whitelist(
-    would_be_installed: Set[NormalizedName], package_set: PackageSet
-) -> Set[NormalizedName]:
-    packages_affected = set(would_be_installed)
-
-    for package_name in package_set:
-        if package_name in packages_affected:
-            continue
-
-        for req in package_set[package_name].dependencies:
-            if canonicalize_name(req.name) in packages_affected:
-                packages_affected.add(package_name)
-                break
-
-    return packages_affected
-
-
 def warn_legacy_versions_and_specifiers(package_set: PackageSet) -> None:
     for project_name, package_details in package_set.items():
         if isinstance(package_details.version, LegacyVersion):
@@ -10,9 +10,13 @@ import logging
 import os.path
 import re
 import shutil
+import struct
 import sys
+import threading
 import warnings
+import zlib
 from base64 import urlsafe_b64encode
+from concurrent.futures import Executor
 from email.message import Message
 from itertools import chain, filterfalse, starmap
 from typing import (
@@ -34,7 +38,7 @@ from typing import (
     Union,
     cast,
 )
-from zipfile import ZipFile, ZipInfo
+from zipfile import ZIP_STORED, BadZipFile, ZipFile, ZipInfo
 
 from pip._vendor.distlib.scripts import ScriptMaker
 from pip._vendor.distlib.util import get_export_entry
@@ -47,6 +51,7 @@ from pip._internal.metadata import (
     FilesystemWheel,
     get_wheel_distribution,
 )
+from pip._internal.metadata._index import InstalledIndex
 from pip._internal.models.direct_url import DIRECT_URL_METADATA_NAME, DirectUrl
 from pip._internal.models.scheme import SCHEME_KEYS, Scheme
 from pip._internal.utils.filesystem import adjacent_tmp_file, replace
@@ -353,6 +358,73 @@ def get_console_script_specs(console: Dict[str, str]) -> List[str]:
     return scripts_to_generate
 
 
+# Members stored without compression and at least this large are copied out
+# of the wheel by the kernel, where it can copy between files.
+_SENDFILE_MIN_SIZE = 1 << 20
+
+# The signature and the name and extra field lengths of a local file header.
+_LOCAL_FILE_HEADER = struct.Struct("<4s22xHH")
+
+
+def _sendfile_member(zip_file: ZipFile, zipinfo: ZipInfo, dest: BinaryIO) -> bool:
+    """Copy a large stored member of zip_file to dest with os.sendfile().
+
+    The data is written without passing through Python. Its CRC is then
+    computed from the source range, which the copy has just brought into the
+    page cache, and a mismatch raises BadZipFile like ZipFile.open() would.
+
+    Return False, having written nothing, if the member is not suitable or the
+    platform cannot copy it this way.
+    """
+    if (
+        not hasattr(os, "sendfile")
+        or zipinfo.compress_type != ZIP_STORED
+        or zipinfo.file_size < _SENDFILE_MIN_SIZE
+        or zipinfo.flag_bits & 0x1  # Encrypted.
+    ):
+        return False
+    try:
+        src_fd = zip_file.fp.fileno()  # type: ignore[union-attr]
+    except (AttributeError, OSError, ValueError):
+        return False
+
+    # The lengths in the local header may differ from the central directory.
+    header = os.pread(src_fd, _LOCAL_FILE_HEADER.size, zipinfo.header_offset)
+    if len(header) != _LOCAL_FILE_HEADER.size:
+        return False
+    signature, name_length, extra_length = _LOCAL_FILE_HEADER.unpack(header)
+    if signature != b"PK\x03\x04":
+        return False
+    offset = zipinfo.header_offset + _LOCAL_FILE_HEADER.size
+    offset += name_length + extra_length
+
+    start = offset
+    remaining = zipinfo.file_size
+    while remaining:
+        try:
+            sent = os.sendfile(dest.fileno(), src_fd, offset, remaining)
+        except OSError:
+            if remaining == zipinfo.file_size:
+                # Some platforms can only send to sockets.
+                return False
+            raise
+        if not sent:
+            raise InstallationError(f"Truncated member {zipinfo.filename!r} in wheel")
+        offset += sent
+        remaining -= sent
+
+    crc = 0
+    while start < offset:
+        chunk = os.pread(src_fd, min(_SENDFILE_MIN_SIZE, offset - start), start)
+        if not chunk:
+            raise InstallationError(f"Truncated member {zipinfo.filename!r} in wheel")
+        crc = zlib.crc32(chunk, crc)
+        start += len(chunk)
+    if crc != zipinfo.CRC:
+        raise BadZipFile(f"Bad CRC-32 for file {zipinfo.filename!r}")
+    return True
+
+
 class ZipBackedFile:
     def __init__(
         self, src_record_path: RecordPath, dest_path: str, zip_file: ZipFile
@@ -385,9 +457,10 @@ class ZipBackedFile:
 
         zipinfo = self._getinfo()
 
-        with self._zip_file.open(zipinfo) as f:
-            with open(self.dest_path, "wb") as dest:
-                shutil.copyfileobj(f, dest)
+        with open(self.dest_path, "wb") as dest:
+            if not _sendfile_member(self._zip_file, zipinfo, dest):
+                with self._zip_file.open(zipinfo) as f:
+                    shutil.copyfileobj(f, dest)
 
         if zip_item_is_executable(zipinfo):
             set_extracted_file_to_default_mode_plus_executable(self.dest_path)
@@ -421,6 +494,31 @@ def _raise_for_invalid_entrypoint(specification: str) -> None:
         raise MissingCallableSuffix(str(entry))
 
 
+# Number of files sent to a pycompile_executor worker at a time, to amortize
+# the cost of inter-process communication over several small files.
+PYCOMPILE_CHUNKSIZE = 8
+
+# Capturing stdout and silencing warnings swaps process-wide state, so wheels
+# installed from several threads must take turns compiling.
+_compile_lock = threading.Lock()
+
+# Wheels installed concurrently into the same directory share its index.
+_installed_index_lock = threading.Lock()
+
+
+def _compile_file(path: str) -> Tuple[bool, str]:
+    """Byte-compile a single file, returning whether it succeeded and what
+    compileall printed while doing so.
+
+    This is a module-level function so that it can be run in a worker process.
+    """
+    with _compile_lock, captured_stdout() as stdout:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            success = compileall.compile_file(path, force=True, quiet=True)
+    return bool(success), stdout.getvalue()
+
+
 class PipScriptMaker(ScriptMaker):
     def make(
         self, specification: str, options: Optional[Dict[str, Any]] = None
@@ -438,6 +536,8 @@ def _install_wheel(
     warn_script_location: bool = True,
     direct_url: Optional[DirectUrl] = None,
     requested: bool = False,
+    pycompile_executor: Optional[Executor] = None,
+    create_installed_index: bool = False,
 ) -> None:
     """Install a wheel.
 
@@ -447,8 +547,13 @@ def _install_wheel(
     :param req_description: String used in place of the requirement, for
         logging
     :param pycompile: Whether to byte-compile installed Python files
+    :param pycompile_executor: If given, byte-compile the installed Python
+        files on this executor (typically a process pool) instead of in-process
     :param warn_script_location: Whether to check that scripts are installed
         into a directory on PATH
+    :param create_installed_index: Whether to create the index of installed
+        distributions in lib_dir if it does not exist (an existing one is
+        always updated)
     :raises UnsupportedWheel:
         * when the directory holds an unpacked wheel with incompatible
           Wheel-Version
@@ -610,19 +715,25 @@ def _install_wheel(
 
     # Compile all of the pyc files for the installed files
     if pycompile:
-        with captured_stdout() as stdout:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore")
-                for path in pyc_source_file_paths():
-                    success = compileall.compile_file(path, force=True, quiet=True)
-                    if success:
-                        pyc_path = pyc_output_path(path)
-                        assert os.path.exists(pyc_path)
-                        pyc_record_path = cast(
-                            "RecordPath", pyc_path.replace(os.path.sep, "/")
-                        )
-                        record_installed(pyc_record_path, pyc_path)
-        logger.debug(stdout.getvalue())
+        source_paths = list(pyc_source_file_paths())
+        results: Iterable[Tuple[bool, str]]
+        if pycompile_executor is not None and len(source_paths) > 1:
+            results = pycompile_executor.map(
+                _compile_file, source_paths, chunksize=PYCOMPILE_CHUNKSIZE
+            )
+        else:
+            results = map(_compile_file, source_paths)
+        compile_output = []
+        # Results come back in the order of source_paths, which keeps the
+        # generated RECORD identical to a serial compilation.
+        for path, (success, output) in zip(source_paths, results):
+            compile_output.append(output)
+            if success:
+                pyc_path = pyc_output_path(path)
+                assert os.path.exists(pyc_path)
+                pyc_record_path = cast("RecordPath", pyc_path.replace(os.path.sep, "/"))
+                record_installed(pyc_record_path, pyc_path)
+        logger.debug("".join(compile_output))
 
     maker = PipScriptMaker(None, scheme.scripts)
 
@@ -706,6 +817,13 @@ def _install_wheel(
         writer = csv.writer(cast("IO[str]", record_file))
         writer.writerows(_normalized_outrows(rows))
 
+    # Bring the index of the installation directory, if any, up to date
+    with _installed_index_lock:
+        index = InstalledIndex.load(lib_dir)
+        if index.exists or create_installed_index:
+            index.update()
+            index.save(create=create_installed_index)
+
 
 @contextlib.contextmanager
 def req_error_context(req_description: str) -> Generator[None, None, None]:
@@ -725,6 +843,8 @@ def install_wheel(
     warn_script_location: bool = True,
     direct_url: Optional[DirectUrl] = None,
     requested: bool = False,
+    pycompile_executor: Optional[Executor] = None,
+    create_installed_index: bool = False,
 ) -> None:
     with ZipFile(wheel_path, allowZip64=True) as z:
         with req_error_context(req_description):
@@ -737,4 +857,6 @@ def install_wheel(
                 warn_script_location=warn_script_location,
                 direct_url=direct_url,
                 requested=requested,
+                pycompile_executor=pycompile_executor,
+                create_installed_index=create_installed_index,
             )
@@ -7,11 +7,11 @@
 import logging
 import mimetypes
 import os
-import shutil
 from typing import Dict, Iterable, List, Optional
 
 from pip._vendor.packaging.utils import canonicalize_name
 
+from pip._internal.cache import ArtifactCache, MetadataCache
 from pip._internal.distributions import make_distribution_for_install_requirement
 from pip._internal.distributions.installed import InstalledDistribution
 from pip._internal.exceptions import (
@@ -41,6 +41,7 @@ from pip._internal.utils.direct_url_helpers import (
     direct_url_for_editable,
     direct_url_from_link,
 )
+from pip._internal.utils.filesystem import link_or_copy
 from pip._internal.utils.hashes import Hashes, MissingHashes
 from pip._internal.utils.logging import indent_log
 from pip._internal.utils.misc import (
@@ -62,12 +63,13 @@ def _get_prepared_distribution(
     finder: PackageFinder,
     build_isolation: bool,
     check_build_deps: bool,
+    build_env_cache_dir: Optional[str],
 ) -> BaseDistribution:
     """Prepare a distribution for installation."""
     abstract_dist = make_distribution_for_install_requirement(req)
     with build_tracker.track(req):
         abstract_dist.prepare_distribution_metadata(
-            finder, build_isolation, check_build_deps
+            finder, build_isolation, check_build_deps, build_env_cache_dir
         )
     return abstract_dist.get_metadata_distribution()
 
@@ -103,10 +105,8 @@ def get_http_url(
         from_path = already_downloaded_path
         content_type = None
     else:
-        # let's download to a tmp dir
-        from_path, content_type = download(link, temp_dir.path)
-        if hashes:
-            hashes.check_against_path(from_path)
+        # let's download to a tmp dir, checking hashes as it arrives
+        from_path, content_type = download(link, temp_dir.path, hashes)
 
     return File(from_path, content_type)
 
@@ -218,9 +218,13 @@ class RequirementPreparer:
         src_dir: str,
         build_isolation: bool,
         check_build_deps: bool,
+        build_env_cache_dir: Optional[str],
+        metadata_cache: MetadataCache,
+        artifact_cache: ArtifactCache,
         build_tracker: BuildTracker,
         session: PipSession,
         progress_bar: str,
+        download_workers: int,
         finder: PackageFinder,
         require_hashes: bool,
         use_user_site: bool,
@@ -234,9 +238,17 @@ class RequirementPreparer:
         self.build_dir = build_dir
         self.build_tracker = build_tracker
         self._session = session
-        self._download = Downloader(session, progress_bar)
-        self._batch_download = BatchDownloader(session, progress_bar)
+        self._download = Downloader(
+            session, progress_bar, artifact_cache=artifact_cache
+        )
+        self._batch_download = BatchDownloader(
+            session,
+            progress_bar,
+            workers=download_workers,
+            artifact_cache=artifact_cache,
+        )
         self.finder = finder
+        self._metadata_cache = metadata_cache
 
         # Where still-packed archives should be written to. If None, they are
         # not saved, and are deleted immediately after unpacking.
@@ -248,6 +260,9 @@ class RequirementPreparer:
         # Should check build dependencies?
         self.check_build_deps = check_build_deps
 
+        # Where to share isolated build environments, if anywhere?
+        self.build_env_cache_dir = build_env_cache_dir
+
         # Should hash-checking be required?
         self.require_hashes = require_hashes
 
@@ -263,7 +278,8 @@ class RequirementPreparer:
         # Are we using the legacy resolver?
         self.legacy_resolver = legacy_resolver
 
-        # Memoized downloaded files, as mapping of url: path.
+        # Memoized downloaded files, as mapping of url: path. Files are only
+        # recorded once they were checked against their hashes.
         self._downloaded: Dict[str, str] = {}
 
         # Previous "header" printed for a link-based InstallRequirement
@@ -379,10 +395,51 @@ class RequirementPreparer:
                 "Metadata-only fetching is not used as hash checking is required",
             )
             return None
-        # Try PEP 658 metadata first, then fall back to lazy wheel if unavailable.
-        return self._fetch_metadata_using_link_data_attr(
-            req
-        ) or self._fetch_metadata_using_lazy_wheel(req.link)
+        # Try the metadata cache first, then PEP 658 metadata, then fall back to
+        # lazy wheel if unavailable.
+        return (
+            self._fetch_metadata_using_cache(req)
+            or self._fetch_metadata_using_link_data_attr(req)
+            or self._fetch_metadata_using_lazy_wheel(req.link)
+        )
+
+    def _fetch_metadata_using_cache(
+        self,
+        req: InstallRequirement,
+    ) -> Optional[BaseDistribution]:
+        """Fetch metadata stored in the cache by a previous run, if possible."""
+        # The name is needed to check the metadata against.
+        if req.req is None:
+            return None
+        metadata_contents = self._metadata_cache.get(req.link)
+        if metadata_contents is None:
+            return None
+        logger.info("Using cached dependency information for %s", req.req)
+        return self._get_metadata_distribution(req, metadata_contents)
+
+    def _get_metadata_distribution(
+        self,
+        req: InstallRequirement,
+        metadata_contents: bytes,
+    ) -> BaseDistribution:
+        """Generate a dist for req just from the contents of its METADATA file."""
+        assert req.req is not None
+        metadata_dist = get_metadata_distribution(
+            metadata_contents,
+            req.link.filename,
+            req.req.name,
+        )
+        # Ensure the Name: field from the METADATA file matches the name from the
+        # install requirement.
+        #
+        # NB: raw_name will fall back to the name from the install requirement if
+        # the Name: field is not present, but it's noted in the raw_name docstring
+        # that that should NEVER happen anyway.
+        if canonicalize_name(metadata_dist.raw_name) != canonicalize_name(req.req.name):
+            raise MetadataInconsistent(
+                req, "Name", req.req.name, metadata_dist.raw_name
+            )
+        return metadata_dist
 
     def _fetch_metadata_using_link_data_attr(
         self,
@@ -407,22 +464,10 @@ class RequirementPreparer:
         )
         with open(metadata_file.path, "rb") as f:
             metadata_contents = f.read()
-        # (3) Generate a dist just from those file contents.
-        metadata_dist = get_metadata_distribution(
-            metadata_contents,
-            req.link.filename,
-            req.req.name,
-        )
-        # (4) Ensure the Name: field from the METADATA file matches the name from the
-        #     install requirement.
-        #
-        #     NB: raw_name will fall back to the name from the install requirement if
-        #     the Name: field is not present, but it's noted in the raw_name docstring
-        #     that that should NEVER happen anyway.
-        if canonicalize_name(metadata_dist.raw_name) != canonicalize_name(req.req.name):
-            raise MetadataInconsistent(
-                req, "Name", req.req.name, metadata_dist.raw_name
-            )
+        # (3) Generate a dist just from those file contents, checking its name.
+        metadata_dist = self._get_metadata_distribution(req, metadata_contents)
+        # (4) Keep the contents for future runs.
+        self._metadata_cache.save(req.link, metadata_contents)
         return metadata_dist
 
     def _fetch_metadata_using_lazy_wheel(
@@ -449,10 +494,19 @@ class RequirementPreparer:
         )
         url = link.url.split("#", 1)[0]
         try:
-            return dist_from_wheel_url(name, url, self._session)
+            dist = dist_from_wheel_url(name, url, self._session)
         except HTTPRangeRequestUnsupported:
             logger.debug("%s does not support range requests", url)
             return None
+        self._save_wheel_metadata(link, dist)
+        return dist
+
+    def _save_wheel_metadata(self, link: Link, dist: BaseDistribution) -> None:
+        """Keep the metadata of a wheel in the cache for future runs."""
+        if self._metadata_cache.get_path_for_link(link) is None:
+            return
+        metadata_contents = dist.read_text("METADATA").encode("utf-8")
+        self._metadata_cache.save(link, metadata_contents)
 
     def _complete_partial_requirements(
         self,
@@ -468,13 +522,16 @@ class RequirementPreparer:
         # `req.local_file_path` on the appropriate requirement after passing
         # all the links at once into BatchDownloader.
         links_to_fully_download: Dict[Link, InstallRequirement] = {}
+        hashes_by_link: Dict[Link, Hashes] = {}
         for req in partially_downloaded_reqs:
             assert req.link
             links_to_fully_download[req.link] = req
+            hashes_by_link[req.link] = self._get_linked_req_hashes(req)
 
         batch_download = self._batch_download(
             links_to_fully_download.keys(),
             temp_dir,
+            hashes_by_link,
         )
         for link, (filepath, _) in batch_download:
             logger.debug("Downloading link %s to %s", link, filepath)
@@ -621,8 +678,6 @@ class RequirementPreparer:
                 )
         else:
             file_path = self._downloaded[link.url]
-            if hashes:
-                hashes.check_against_path(file_path)
             local_file = File(file_path, content_type=None)
 
         # If download_info is set, we got it from the wheel cache.
@@ -656,7 +711,10 @@ class RequirementPreparer:
             self.finder,
             self.build_isolation,
             self.check_build_deps,
+            self.build_env_cache_dir,
         )
+        if link.is_wheel:
+            self._save_wheel_metadata(link, dist)
         return dist
 
     def save_linked_requirement(self, req: InstallRequirement) -> None:
@@ -681,7 +739,7 @@ class RequirementPreparer:
 
         download_location = os.path.join(self.download_dir, link.filename)
         if not os.path.exists(download_location):
-            shutil.copy(req.local_file_path, download_location)
+            link_or_copy(req.local_file_path, download_location)
             download_path = display_path(download_location)
             logger.info("Saved %s", download_path)
 
@@ -712,6 +770,7 @@ class RequirementPreparer:
                 self.finder,
                 self.build_isolation,
                 self.check_build_deps,
+                self.build_env_cache_dir,
             )
 
             req.check_if_exists(self.use_user_site)
@@ -1,12 +1,29 @@
 import collections
+import contextlib
 import logging
-from typing import Generator, List, Optional, Sequence, Tuple
+import os
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
-from pip._internal.utils.logging import indent_log
+from pip._vendor.packaging.utils import canonicalize_name
+
+from pip._internal.utils.logging import get_indentation, indent_log
+from pip._internal.utils.unpacking import current_umask
 
 from .req_file import parse_requirements
 from .req_install import InstallRequirement
 from .req_set import RequirementSet
+from .req_uninstall import UninstallPathSet
 
 __all__ = [
     "RequirementSet",
@@ -34,6 +51,157 @@ def _validate_requirements(
         yield req.name, req
 
 
+@contextlib.contextmanager
+def _pycompile_executor(
+    pycompile: bool, compile_workers: int
+) -> Generator[Optional[Executor], None, None]:
+    if not pycompile or compile_workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(compile_workers) as executor:
+        yield executor
+
+
+def _script_destination(path: str) -> str:
+    """Key a script by the entry point name it is, or could have been,
+    generated for, so that a script shipped in a wheel and one generated for
+    an entry point conflict whenever either could overwrite the other (e.g.
+    "foo" and "foo.exe" on Windows).
+    """
+    path = os.path.normcase(path)
+    for suffix in (".exe", "-script.pyw", "-script.py", ".pya"):
+        if path.lower().endswith(suffix):
+            path = path[: -len(suffix)]
+            break
+    return f"scripts:{path}"
+
+
+def _wheel_destinations(req: InstallRequirement) -> Set[str]:
+    """Approximate the files a wheel writes, relative to its install scheme.
+
+    Files in the root of the wheel and in its purelib and platlib data
+    directories are all considered to go to the same library directory.
+    Scripts in its scripts data directory and those generated for its
+    console_scripts and gui_scripts entry points share another.
+    """
+    # Script generation pulls in distlib, which few commands need.
+    from pip._internal.metadata import FilesystemWheel, get_wheel_distribution
+    from pip._internal.operations.install.wheel import (
+        get_console_script_specs,
+        get_entrypoints,
+    )
+
+    assert req.name
+    assert req.local_file_path
+    with zipfile.ZipFile(req.local_file_path, allowZip64=True) as wheel_zip:
+        names = wheel_zip.namelist()
+
+    destinations = set()
+    for name in names:
+        if name.endswith("/"):
+            continue
+        parts = name.split("/", 2)
+        if len(parts) == 3 and parts[0].endswith(".data"):
+            scheme_key, subpath = parts[1], parts[2]
+            if scheme_key in ("purelib", "platlib"):
+                name = subpath
+            elif scheme_key == "scripts":
+                name = _script_destination(subpath)
+            else:
+                name = f"{scheme_key}:{subpath}"
+        destinations.add(name)
+
+    # Read the entry points the same way the installer does.
+    distribution = get_wheel_distribution(
+        FilesystemWheel(req.local_file_path), canonicalize_name(req.name)
+    )
+    console, gui = get_entrypoints(distribution)
+    for spec in get_console_script_specs(console):
+        destinations.add(_script_destination(spec.split("=", 1)[0].strip()))
+    destinations.update(map(_script_destination, gui))
+    return destinations
+
+
+def _split_conflicting(
+    group: Sequence[InstallRequirement],
+) -> List[List[InstallRequirement]]:
+    """Split a group of requirements into batches which do not write to the
+    same files, so that each batch can be installed concurrently.
+    """
+    # Each batch is paired with the files its wheels write, or None if the
+    # batch holds a non-wheel requirement, which is always installed alone.
+    batches: List[Tuple[Optional[Set[str]], List[InstallRequirement]]] = []
+    for req in group:
+        if not req.is_wheel:
+            batches.append((None, [req]))
+            continue
+        destinations = _wheel_destinations(req)
+        for batch_destinations, batch in batches:
+            if batch_destinations is None:
+                continue
+            if batch_destinations.isdisjoint(destinations):
+                batch_destinations.update(destinations)
+                batch.append(req)
+                break
+        else:
+            batches.append((destinations, [req]))
+    return [batch for _, batch in batches]
+
+
+def _install_concurrently(
+    batch: Sequence[InstallRequirement],
+    install: Callable[[InstallRequirement], None],
+    install_workers: int,
+) -> None:
+    """Install a batch of independent requirements on a thread pool.
+
+    Previous installations are uninstalled up front, one at a time. Once every
+    install has finished, each uninstallation is committed or rolled back
+    depending on whether its own requirement was installed, exactly as in a
+    serial installation; the first error is then re-raised.
+    """
+    uninstalled_pathsets: Dict[str, Optional[UninstallPathSet]] = {}
+    for requirement in batch:
+        assert requirement.name
+        if requirement.should_reinstall:
+            logger.info("Attempting uninstall: %s", requirement.name)
+            with indent_log():
+                uninstalled_pathset = requirement.uninstall(auto_confirm=True)
+        else:
+            uninstalled_pathset = None
+        uninstalled_pathsets[requirement.name] = uninstalled_pathset
+
+    # Logging indentation is thread-local, so carry it over to the workers.
+    indentation = get_indentation()
+
+    def install_with_indentation(requirement: InstallRequirement) -> None:
+        with indent_log(indentation):
+            install(requirement)
+
+    workers = min(install_workers, len(batch))
+    with ThreadPoolExecutor(workers, thread_name_prefix="pip-install") as executor:
+        futures = [
+            executor.submit(install_with_indentation, requirement)
+            for requirement in batch
+        ]
+        errors = [future.exception() for future in futures]
+
+    first_error: Optional[BaseException] = None
+    for requirement, error in zip(batch, errors):
+        assert requirement.name
+        uninstalled_pathset = uninstalled_pathsets[requirement.name]
+        if error is not None:
+            # if install did not succeed, rollback previous uninstall
+            if uninstalled_pathset and not requirement.install_succeeded:
+                uninstalled_pathset.rollback()
+            if first_error is None:
+                first_error = error
+        elif uninstalled_pathset and requirement.install_succeeded:
+            uninstalled_pathset.commit()
+    if first_error is not None:
+        raise first_error
+
+
 def install_given_reqs(
     requirements: List[InstallRequirement],
     global_options: Sequence[str],
@@ -43,11 +211,27 @@ def install_given_reqs(
     warn_script_location: bool,
     use_user_site: bool,
     pycompile: bool,
+    compile_workers: int = 1,
+    install_groups: Optional[Sequence[Sequence[InstallRequirement]]] = None,
+    install_workers: int = 1,
+    create_installed_index: bool = False,
 ) -> List[InstallationResult]:
     """
     Install everything in the given list.
 
     (to be called after having downloaded and unpacked the packages)
+
+    If compile_workers is greater than one, bytecode compilation of the
+    installed files is spread over a pool of that many processes, which is
+    shared by all of the requirements.
+
+    If install_groups is given (see BaseResolver.get_installation_groups())
+    and install_workers is greater than one, the requirements of each group
+    that do not write to the same files are installed concurrently, one
+    group after the other.
+
+    If create_installed_index is true, an index of the installed distributions
+    is created in installation directories that do not have one yet.
     """
     to_install = collections.OrderedDict(_validate_requirements(requirements))
 
@@ -59,7 +243,33 @@ def install_given_reqs(
 
     installed = []
 
-    with indent_log():
+    def install(requirement: InstallRequirement) -> None:
+        requirement.install(
+            global_options,
+            root=root,
+            home=home,
+            prefix=prefix,
+            warn_script_location=warn_script_location,
+            use_user_site=use_user_site,
+            pycompile=pycompile,
+            pycompile_executor=pycompile_executor,
+            create_installed_index=create_installed_index,
+        )
+
+    with indent_log(), _pycompile_executor(
+        pycompile, compile_workers
+    ) as pycompile_executor:
+        if install_groups is not None and install_workers > 1:
+            # Prime the cached umask before any thread starts creating files.
+            current_umask()
+            for group in install_groups:
+                for batch in _split_conflicting(group):
+                    _install_concurrently(batch, install, install_workers)
+                    for requirement in batch:
+                        assert requirement.name
+                        installed.append(InstallationResult(requirement.name))
+            return installed
+
         for req_name, requirement in to_install.items():
             if requirement.should_reinstall:
                 logger.info("Attempting uninstall: %s", req_name)
@@ -69,15 +279,7 @@ def install_given_reqs(
                 uninstalled_pathset = None
 
             try:
-                requirement.install(
-                    global_options,
-                    root=root,
-                    home=home,
-                    prefix=prefix,
-                    warn_script_location=warn_script_location,
-                    use_user_site=use_user_site,
-                    pycompile=pycompile,
-                )
+                install(requirement)
             except Exception:
                 # if install did not succeed, rollback previous uninstall
                 if uninstalled_pathset and not requirement.install_succeeded:
@@ -8,6 +8,7 @@ import shutil
 import sys
 import uuid
 import zipfile
+from concurrent.futures import Executor
 from optparse import Values
 from typing import Any, Collection, Dict, Iterable, List, Optional, Sequence, Union
 
@@ -39,7 +40,6 @@ from pip._internal.operations.build.metadata_legacy import (
 from pip._internal.operations.install.editable_legacy import (
     install_editable as install_editable_legacy,
 )
-from pip._internal.operations.install.wheel import install_wheel
 from pip._internal.pyproject import load_pyproject_toml, make_pyproject_path
 from pip._internal.req.req_uninstall import UninstallPathSet
 from pip._internal.utils.deprecation import deprecated
@@ -776,6 +776,8 @@ class InstallRequirement:
         warn_script_location: bool = True,
         use_user_site: bool = False,
         pycompile: bool = True,
+        pycompile_executor: Optional[Executor] = None,
+        create_installed_index: bool = False,
     ) -> None:
         scheme = get_scheme(
             self.name,
@@ -804,6 +806,9 @@ class InstallRequirement:
         assert self.is_wheel
         assert self.local_file_path
 
+        # Script generation pulls in distlib, which few commands need.
+        from pip._internal.operations.install.wheel import install_wheel
+
         install_wheel(
             self.name,
             self.local_file_path,
@@ -813,6 +818,8 @@ class InstallRequirement:
             warn_script_location=warn_script_location,
             direct_url=self.download_info if self.is_direct else None,
             requested=self.user_supplied,
+            pycompile_executor=pycompile_executor,
+            create_installed_index=create_installed_index,
         )
         self.install_succeeded = True
 
@@ -2,12 +2,25 @@ import functools
 import os
 import sys
 import sysconfig
+import time
 from importlib.util import cache_from_source
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from pip._internal.exceptions import UninstallationError
 from pip._internal.locations import get_bin_prefix, get_bin_user
 from pip._internal.metadata import BaseDistribution
+from pip._internal.metadata._index import InstalledIndex
 from pip._internal.utils.compat import WINDOWS
 from pip._internal.utils.egg_link import egg_link_path_from_location
 from pip._internal.utils.logging import getLogger, indent_log
@@ -102,18 +115,35 @@ def compact(paths: Iterable[str]) -> Set[str]:
     shorter path."""
 
     sep = os.path.sep
+
+    def prefix(path: str) -> str:
+        return path.rstrip("*").rstrip(sep) + sep
+
+    # Sorted by prefix, the paths a path contains come right after it, so
+    # each path only has to be checked against the last one kept.
     short_paths: Set[str] = set()
-    for path in sorted(paths, key=len):
-        should_skip = any(
-            path.startswith(shortpath.rstrip("*"))
-            and path[len(shortpath.rstrip("*").rstrip(sep))] == sep
-            for shortpath in short_paths
-        )
-        if not should_skip:
-            short_paths.add(path)
+    shortest_prefix: Optional[str] = None
+    for key, _, path in sorted((prefix(p), len(p), p) for p in paths):
+        if shortest_prefix is not None and key.startswith(shortest_prefix):
+            # Paths with the same prefix, like /a/path and /a/path*, are
+            # contained only if they go on with a separator.
+            if key != shortest_prefix or path.startswith(shortest_prefix):
+                continue
+        short_paths.add(path)
+        shortest_prefix = key
     return short_paths
 
 
+def _is_within(path: str, directories: Container[str]) -> bool:
+    """Whether path is one of directories, or anywhere below one of them."""
+    head, old_head = path, None
+    while head != old_head:
+        if head in directories:
+            return True
+        head, old_head = os.path.dirname(head), head
+    return False
+
+
 def compress_for_rename(paths: Iterable[str]) -> Set[str]:
     """Returns a set containing the paths that need to be renamed.
 
@@ -123,31 +153,56 @@ def compress_for_rename(paths: Iterable[str]) -> Set[str]:
     case_map = {os.path.normcase(p): p for p in paths}
     remaining = set(case_map)
     unchecked = sorted({os.path.split(p)[0] for p in case_map.values()}, key=len)
-    wildcards: Set[str] = set()
 
-    def norm_join(*a: str) -> str:
-        return os.path.normcase(os.path.join(*a))
+    # Walk each tree once, bottom up, finding the files of each directory
+    # and whether all the files below it are to be removed.
+    dir_files: Dict[str, List[str]] = {}
+    complete: Dict[str, bool] = {}
+
+    def scan(top: str) -> None:
+        for dirname, subdirs, files in os.walk(top, topdown=False):
+            dirname = os.path.normcase(dirname)
+            dir_files[dirname] = [
+                os.path.normcase(os.path.join(dirname, f)) for f in files
+            ]
+            complete[dirname] = all(
+                f in remaining for f in dir_files[dirname]
+            ) and all(
+                complete.get(os.path.normcase(os.path.join(dirname, d)), True)
+                for d in subdirs
+            )
 
+    for top in compact(unchecked):
+        scan(top)
     for root in unchecked:
-        if any(os.path.normcase(root).startswith(w) for w in wildcards):
+        # Directories the walks did not get to, like those behind symlinks.
+        if os.path.normcase(root) not in complete:
+            scan(root)
+
+    # Replace the files of the outermost complete directories by a wildcard.
+    complete_roots: Set[str] = set()
+    wildcards: Set[str] = set()
+    for root in unchecked:
+        normed_root = os.path.normcase(root)
+        if _is_within(normed_root, complete_roots):
             # This directory has already been handled.
             continue
-
-        all_files: Set[str] = set()
-        all_subdirs: Set[str] = set()
-        for dirname, subdirs, files in os.walk(root):
-            all_subdirs.update(norm_join(root, dirname, d) for d in subdirs)
-            all_files.update(norm_join(root, dirname, f) for f in files)
-        # If all the files we found are in our remaining set of files to
-        # remove, then remove them from the latter set and add a wildcard
-        # for the directory.
-        if not (all_files - remaining):
-            remaining.difference_update(all_files)
+        if complete.get(normed_root, True):
+            complete_roots.add(normed_root)
             wildcards.add(root + os.sep)
 
+    for dirname, files in dir_files.items():
+        if _is_within(dirname, complete_roots):
+            remaining.difference_update(files)
+
     return set(map(case_map.__getitem__, remaining)) | wildcards
 
 
+def _stash_order(path: str) -> Tuple[int, str]:
+    """Sort key stashing the paths closest to the root first."""
+    return path.rstrip(os.path.sep).count(os.path.sep), path
+
+
 def compress_for_output_listing(paths: Iterable[str]) -> Tuple[Set[str], Set[str]]:
     """Returns a tuple of 2 sets of which paths to display to user
 
@@ -210,26 +265,15 @@ class StashedUninstallPathSet:
         # to be undone.
         self._moves: List[Tuple[str, str]] = []
 
-    def _get_directory_stash(self, path: str) -> str:
-        """Stashes a directory.
+    def _get_stash(self, path: str) -> str:
+        """Finds the location to stash a file or directory at.
 
-        Directories are stashed adjacent to their original location if
-        possible, or else moved/copied into the user's temp dir."""
-
-        try:
-            save_dir: TempDirectory = AdjacentTempDirectory(path)
-        except OSError:
-            save_dir = TempDirectory(kind="uninstall")
-        self._save_dirs[os.path.normcase(path)] = save_dir
-
-        return save_dir.path
-
-    def _get_file_stash(self, path: str) -> str:
-        """Stashes a file.
-
-        If no root has been provided, one will be created for the directory
-        in the user's temp directory."""
-        path = os.path.normcase(path)
+        Everything stashed from a directory and its subdirectories goes into
+        a single temp dir. That temp dir is created in the directory if
+        possible, so that stashing only renames paths on the same filesystem.
+        Otherwise it is created in the user's temp dir.
+        """
+        path = os.path.normcase(path).rstrip("/\\")
         head, old_head = os.path.dirname(path), None
         save_dir = None
 
@@ -243,32 +287,23 @@ class StashedUninstallPathSet:
         else:
             # Did not find any suitable root
             head = os.path.dirname(path)
-            save_dir = TempDirectory(kind="uninstall")
+            try:
+                save_dir = AdjacentTempDirectory(os.path.join(head, "pip-uninstall"))
+            except OSError:
+                save_dir = TempDirectory(kind="uninstall")
             self._save_dirs[head] = save_dir
 
-        relpath = os.path.relpath(path, head)
-        if relpath and relpath != os.path.curdir:
-            return os.path.join(save_dir.path, relpath)
-        return save_dir.path
+        return os.path.join(save_dir.path, os.path.relpath(path, head))
 
     def stash(self, path: str) -> str:
         """Stashes the directory or file and returns its new location.
         Handle symlinks as files to avoid modifying the symlink targets.
-        """
-        path_is_dir = os.path.isdir(path) and not os.path.islink(path)
-        if path_is_dir:
-            new_path = self._get_directory_stash(path)
-        else:
-            new_path = self._get_file_stash(path)
 
+        Directories are moved as a whole, so stashing the shallowest paths
+        first lets deeper ones share the temp dirs created for them.
+        """
+        new_path = self._get_stash(path)
         self._moves.append((path, new_path))
-        if path_is_dir and os.path.isdir(new_path):
-            # If we're moving a directory, we need to
-            # remove the destination first or else it will be
-            # moved to inside the existing directory.
-            # We just created new_path ourselves, so it will
-            # be removable.
-            os.rmdir(new_path)
         renames(path, new_path)
         return new_path
 
@@ -375,11 +410,24 @@ class UninstallPathSet:
             if auto_confirm or self._allowed_to_proceed(verbose):
                 moved = self._moved_paths
 
+                start = time.perf_counter()
                 for_rename = compress_for_rename(self._paths)
+                to_stash = sorted(compact(for_rename), key=_stash_order)
+                logger.debug(
+                    "Planned %d renames in %.3fs",
+                    len(to_stash),
+                    time.perf_counter() - start,
+                )
 
-                for path in sorted(compact(for_rename)):
+                start = time.perf_counter()
+                for path in to_stash:
                     moved.stash(path)
                     logger.verbose("Removing file or directory %s", path)
+                logger.debug(
+                    "Stashed %d paths in %.3fs",
+                    len(to_stash),
+                    time.perf_counter() - start,
+                )
 
                 for pth in self._pth.values():
                     pth.remove()
@@ -423,13 +471,27 @@ class UninstallPathSet:
             )
             return
         logger.info("Rolling back uninstall of %s", self._dist.raw_name)
+        start = time.perf_counter()
         self._moved_paths.rollback()
         for pth in self._pth.values():
             pth.rollback()
+        logger.debug("Rolled back in %.3fs", time.perf_counter() - start)
 
     def commit(self) -> None:
         """Remove temporary save dir: rollback will no longer be possible."""
+        start = time.perf_counter()
         self._moved_paths.commit()
+        logger.debug(
+            "Removed stashed files of %s in %.3fs",
+            self._dist.raw_name,
+            time.perf_counter() - start,
+        )
+
+        info_location = self._dist.info_location
+        if info_location is not None and not os.path.exists(info_location):
+            index = InstalledIndex.load(os.path.dirname(info_location))
+            index.discard(info_location)
+            index.save()
 
     @classmethod
     def from_dist(cls, dist: BaseDistribution) -> "UninstallPathSet":
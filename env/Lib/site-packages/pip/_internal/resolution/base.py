@@ -18,3 +18,14 @@ class BaseResolver:
         self, req_set: RequirementSet
     ) -> List[InstallRequirement]:
         raise NotImplementedError()
+
+    def get_installation_groups(
+        self, req_set: RequirementSet
+    ) -> List[List[InstallRequirement]]:
+        """Get groups of requirements that may be installed concurrently.
+
+        The groups follow the installation order, and no requirement in a
+        group depends on another requirement of the same group. By default,
+        every requirement is in a group of its own.
+        """
+        return [[req] for req in self.get_installation_order(req_set)]
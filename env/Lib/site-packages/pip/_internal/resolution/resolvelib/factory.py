@@ -3,6 +3,7 @@ import functools
 import logging
 from typing import (
     TYPE_CHECKING,
+    ContextManager,
     Dict,
     FrozenSet,
     Iterable,
@@ -35,6 +36,7 @@ from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import BaseDistribution, get_default_environment
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
+from pip._internal.network.session import PipSession
 from pip._internal.operations.prepare import RequirementPreparer
 from pip._internal.req.constructors import install_req_from_link_and_ireq
 from pip._internal.req.req_install import (
@@ -58,6 +60,7 @@ from .candidates import (
     as_base_candidate,
 )
 from .found_candidates import FoundCandidates, IndexCandidateInfo
+from .reporter import PipProfilingReporter
 from .requirements import (
     ExplicitRequirement,
     RequiresPythonRequirement,
@@ -114,6 +117,8 @@ class Factory:
         self._extras_candidate_cache: Dict[
             Tuple[int, FrozenSet[str]], ExtrasCandidate
         ] = {}
+        # Set by the resolver to record where the time of a resolution goes.
+        self.profiler: Optional[PipProfilingReporter] = None
 
         if not ignore_installed:
             env = get_default_environment()
@@ -128,6 +133,10 @@ class Factory:
     def force_reinstall(self) -> bool:
         return self._force_reinstall
 
+    @property
+    def session(self) -> PipSession:
+        return self._finder.session
+
     def _fail_if_link_is_unsupported_wheel(self, link: Link) -> None:
         if not link.is_wheel:
             return
@@ -163,6 +172,11 @@ class Factory:
             return base
         return self._make_extras_candidate(base, extras)
 
+    def _profile_metadata(self, link: Link) -> ContextManager[None]:
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.span("prepare_metadata", "factory", url=link.url)
+
     def _make_candidate_from_link(
         self,
         link: Link,
@@ -182,13 +196,14 @@ class Factory:
         if template.editable:
             if link not in self._editable_candidate_cache:
                 try:
-                    self._editable_candidate_cache[link] = EditableCandidate(
-                        link,
-                        template,
-                        factory=self,
-                        name=name,
-                        version=version,
-                    )
+                    with self._profile_metadata(link):
+                        self._editable_candidate_cache[link] = EditableCandidate(
+                            link,
+                            template,
+                            factory=self,
+                            name=name,
+                            version=version,
+                        )
                 except MetadataInconsistent as e:
                     logger.info(
                         "Discarding [blue underline]%s[/]: [yellow]%s[reset]",
@@ -203,13 +218,14 @@ class Factory:
         else:
             if link not in self._link_candidate_cache:
                 try:
-                    self._link_candidate_cache[link] = LinkCandidate(
-                        link,
-                        template,
-                        factory=self,
-                        name=name,
-                        version=version,
-                    )
+                    with self._profile_metadata(link):
+                        self._link_candidate_cache[link] = LinkCandidate(
+                            link,
+                            template,
+                            factory=self,
+                            name=name,
+                            version=version,
+                        )
                 except MetadataInconsistent as e:
                     logger.info(
                         "Discarding [blue underline]%s[/]: [yellow]%s[reset]",
@@ -286,7 +302,7 @@ class Factory:
             # PEP 592: Yanked releases are ignored unless the specifier
             # explicitly pins a version (via '==' or '===') that can be
             # solely satisfied by a yanked release.
-            all_yanked = all(ican.link.is_yanked for ican in icans)
+            all_yanked = all(ican.is_yanked for ican in icans)
 
             def is_pinned(specifier: SpecifierSet) -> bool:
                 for sp in specifier:
@@ -303,7 +319,7 @@ class Factory:
 
             # PackageFinder returns earlier versions first, so we reverse.
             for ican in reversed(icans):
-                if not (all_yanked and pinned) and ican.link.is_yanked:
+                if not (all_yanked and pinned) and ican.is_yanked:
                     continue
                 func = functools.partial(
                     self._make_candidate_from_link,
@@ -437,6 +453,20 @@ class Factory:
             and all(req.is_satisfied_by(c) for req in requirements[identifier])
         )
 
+    def prefetch_candidates(self, requirements: Iterable[Requirement]) -> None:
+        """Let the finder fetch index pages for requirements in the background.
+
+        Only requirements that are looked up on the index are considered.
+        """
+        self._finder.prefetch_candidates(
+            req.project_name
+            for req in requirements
+            if isinstance(req, SpecifierRequirement)
+        )
+
+    def cancel_prefetch(self) -> None:
+        self._finder.cancel_prefetch()
+
     def _make_requirement_from_install_req(
         self, ireq: InstallRequirement, requested_extras: Iterable[str]
     ) -> Optional[Requirement]:
@@ -2,6 +2,7 @@ import collections
 import math
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Iterable,
     Iterator,
@@ -16,6 +17,7 @@ from pip._vendor.resolvelib.providers import AbstractProvider
 from .base import Candidate, Constraint, Requirement
 from .candidates import REQUIRES_PYTHON_IDENTIFIER
 from .factory import Factory
+from .reporter import PipProfilingReporter
 
 if TYPE_CHECKING:
     from pip._vendor.resolvelib.providers import Preference
@@ -241,7 +243,11 @@ class PipProvider(_ProviderBase):
 
     def get_dependencies(self, candidate: Candidate) -> Sequence[Requirement]:
         with_requires = not self._ignore_dependencies
-        return [r for r in candidate.iter_dependencies(with_requires) if r is not None]
+        dependencies = [
+            r for r in candidate.iter_dependencies(with_requires) if r is not None
+        ]
+        self._factory.prefetch_candidates(dependencies)
+        return dependencies
 
     @staticmethod
     def is_backtrack_cause(
@@ -253,3 +259,98 @@ class PipProvider(_ProviderBase):
             if backtrack_cause.parent and identifier == backtrack_cause.parent.name:
                 return True
         return False
+
+
+class _ProfiledCandidates(Sequence[Candidate]):
+    """Time the work done while the resolver goes through found candidates.
+
+    ``find_matches()`` returns a lazy sequence, and index pages are fetched
+    and candidates built only when it is iterated. This wraps the sequence so
+    that work is recorded, while keeping it a sequence so the resolver still
+    treats it lazily.
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[Candidate],
+        identifier: str,
+        profiler: PipProfilingReporter,
+    ) -> None:
+        self._candidates = candidates
+        self._identifier = identifier
+        self._profiler = profiler
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._candidates[index]
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __bool__(self) -> bool:
+        with self._profiler.span("find_matches", "provider", project=self._identifier):
+            return bool(self._candidates)
+
+    def __iter__(self) -> Iterator[Candidate]:
+        iterator = iter(self._candidates)
+        while True:
+            with self._profiler.span(
+                "find_matches", "provider", project=self._identifier
+            ):
+                try:
+                    candidate = next(iterator)
+                except StopIteration:
+                    return
+            yield candidate
+
+
+class ProfilingProvider(_ProviderBase):
+    """A provider that records the time spent in another provider.
+
+    The time taken to find candidates and to get their dependencies (which
+    includes preparing metadata) is recorded with ``profiler``.
+    """
+
+    def __init__(self, provider: _ProviderBase, profiler: PipProfilingReporter):
+        self._provider = provider
+        self._profiler = profiler
+
+    def identify(self, requirement_or_candidate: Union[Requirement, Candidate]) -> str:
+        return self._provider.identify(requirement_or_candidate)
+
+    def get_preference(
+        self,
+        identifier: str,
+        resolutions: Mapping[str, Candidate],
+        candidates: Mapping[str, Iterator[Candidate]],
+        information: Mapping[str, Iterable["PreferenceInformation"]],
+        backtrack_causes: Sequence["PreferenceInformation"],
+    ) -> "Preference":
+        return self._provider.get_preference(
+            identifier, resolutions, candidates, information, backtrack_causes
+        )
+
+    def find_matches(
+        self,
+        identifier: str,
+        requirements: Mapping[str, Iterator[Requirement]],
+        incompatibilities: Mapping[str, Iterator[Candidate]],
+    ) -> Iterable[Candidate]:
+        with self._profiler.span("find_matches", "provider", project=identifier):
+            matches = self._provider.find_matches(
+                identifier, requirements, incompatibilities
+            )
+        if isinstance(matches, Sequence):
+            return _ProfiledCandidates(matches, identifier, self._profiler)
+        return matches
+
+    def is_satisfied_by(self, requirement: Requirement, candidate: Candidate) -> bool:
+        return self._provider.is_satisfied_by(requirement, candidate)
+
+    def get_dependencies(self, candidate: Candidate) -> Sequence[Requirement]:
+        with self._profiler.span(
+            "get_dependencies",
+            "provider",
+            project=candidate.name,
+            version=str(candidate.version),
+        ):
+            return self._provider.get_dependencies(candidate)
@@ -1,9 +1,22 @@
+import contextlib
+import json
+import os
+import threading
+import time
+import urllib.parse
 from collections import defaultdict
 from logging import getLogger
-from typing import Any, DefaultDict
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional
 
+from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.requests.models import Response
 from pip._vendor.resolvelib.reporters import BaseReporter
 
+from pip._internal.exceptions import InvalidWheelFilename
+from pip._internal.models.wheel import Wheel
+from pip._internal.utils.filetypes import WHEEL_EXTENSION
+from pip._internal.utils.misc import splitext
+
 from .base import Candidate, Requirement
 
 logger = getLogger(__name__)
@@ -78,3 +91,183 @@ class PipDebuggingReporter(BaseReporter):
 
     def pinning(self, candidate: Candidate) -> None:
         logger.info("Reporter.pinning(%r)", candidate)
+
+
+def _project_from_url(url: str) -> str:
+    """Guess the project a URL fetched by the resolver belongs to."""
+    path = urllib.parse.urlsplit(url).path.rstrip("/")
+    if path.endswith("/index.html"):
+        # A file:// index, with a directory for each project.
+        path = path[: -len("/index.html")]
+    filename = urllib.parse.unquote(path.rsplit("/", 1)[-1])
+    if filename.endswith(".metadata"):
+        filename = filename[: -len(".metadata")]
+    base, ext = splitext(filename)
+    if ext == WHEEL_EXTENSION:
+        try:
+            return canonicalize_name(Wheel(filename).name)
+        except InvalidWheelFilename:
+            return filename
+    if not ext:
+        # An index page, named after the project.
+        return canonicalize_name(filename)
+    return canonicalize_name(base.rsplit("-", 1)[0])
+
+
+class PipProfilingReporter(PipReporter):
+    """A reporter that records where the time of a resolution goes.
+
+    Events are kept in the Chrome trace event format, so the file written by
+    ``write()`` can be opened in ``chrome://tracing`` or Perfetto. A summary
+    of the resolution (rounds, backtracks, network use per project and HTTP
+    cache hits) is included as the trace's ``otherData``.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._span_totals: DefaultDict[str, float] = defaultdict(float)
+        self._span_counts: DefaultDict[str, int] = defaultdict(int)
+        self._round_starts: Dict[int, float] = {}
+        self._resolve_start = 0.0
+        self.rounds = 0
+        self.backtracks = 0
+        self._network: DefaultDict[str, Dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "bytes": 0, "cache_hits": 0}
+        )
+
+    def _now(self) -> float:
+        """Microseconds since the reporter was created."""
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _add_event(self, event: Dict[str, Any], args: Dict[str, Any]) -> None:
+        if args:
+            event["args"] = args
+        event["pid"] = self._pid
+        event["tid"] = threading.get_ident()
+        with self._lock:
+            self._events.append(event)
+
+    def _add_complete(
+        self, name: str, cat: str, start: float, args: Dict[str, Any]
+    ) -> None:
+        duration = self._now() - start
+        self._add_event(
+            {"name": name, "cat": cat, "ph": "X", "ts": start, "dur": duration},
+            args,
+        )
+        with self._lock:
+            self._span_totals[name] += duration
+            self._span_counts[name] += 1
+
+    def _add_instant(self, name: str, cat: str, args: Dict[str, Any]) -> None:
+        self._add_event(
+            {"name": name, "cat": cat, "ph": "i", "s": "t", "ts": self._now()},
+            args,
+        )
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[None]:
+        """Record the time spent in the body as an event called ``name``."""
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._add_complete(name, cat, start, args)
+
+    def starting(self) -> None:
+        self._resolve_start = self._now()
+
+    def ending(self, state: Any) -> None:
+        self._add_complete("resolve", "resolver", self._resolve_start, {})
+
+    def starting_round(self, index: int) -> None:
+        self._round_starts[index] = self._now()
+
+    def ending_round(self, index: int, state: Any) -> None:
+        self.rounds = index + 1
+        start = self._round_starts.pop(index, None)
+        if start is not None:
+            self._add_complete("round", "resolver", start, {"index": index})
+
+    def resolving_conflicts(self, causes: Any) -> None:
+        self.backtracks += 1
+        names = sorted({cause.requirement.name for cause in causes})
+        self._add_instant("backtrack", "resolver", {"causes": names})
+
+    def rejecting_candidate(self, criterion: Any, candidate: Candidate) -> None:
+        super().rejecting_candidate(criterion, candidate)
+        self._add_instant(
+            "reject",
+            "resolver",
+            {"name": candidate.name, "version": str(candidate.version)},
+        )
+
+    def pinning(self, candidate: Candidate) -> None:
+        self._add_instant(
+            "pin",
+            "resolver",
+            {"name": candidate.name, "version": str(candidate.version)},
+        )
+
+    def record_response(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        """Account for an HTTP response, as a requests response hook."""
+        project = _project_from_url(response.url)
+        from_cache = getattr(response, "from_cache", False)
+        with self._lock:
+            stats = self._network[project]
+            stats["requests"] += 1
+            if from_cache:
+                stats["cache_hits"] += 1
+            else:
+                try:
+                    stats["bytes"] += int(response.headers["Content-Length"])
+                except (KeyError, ValueError):
+                    pass
+        self._add_instant(
+            "http",
+            "network",
+            {
+                "url": response.url,
+                "status": response.status_code,
+                "from_cache": from_cache,
+            },
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            network = {k: dict(v) for k, v in sorted(self._network.items())}
+            spans = {
+                name: {
+                    "count": self._span_counts[name],
+                    "total_ms": round(total / 1000, 3),
+                }
+                for name, total in sorted(self._span_totals.items())
+            }
+        requests = sum(stats["requests"] for stats in network.values())
+        cache_hits = sum(stats["cache_hits"] for stats in network.values())
+        cache_hit_rate: Optional[float] = None
+        if requests:
+            cache_hit_rate = round(cache_hits / requests, 4)
+        return {
+            "rounds": self.rounds,
+            "backtracks": self.backtracks,
+            "rejections": dict(sorted(self.reject_count_by_package.items())),
+            "spans": spans,
+            "network": network,
+            "http_requests": requests,
+            "http_cache_hit_rate": cache_hit_rate,
+        }
+
+    def write(self) -> None:
+        data = {
+            "traceEvents": self._events,
+            "displayTimeUnit": "ms",
+            "otherData": self.summary(),
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
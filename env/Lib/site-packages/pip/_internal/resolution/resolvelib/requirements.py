@@ -2,6 +2,7 @@ from pip._vendor.packaging.specifiers import SpecifierSet
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 
 from pip._internal.req.req_install import InstallRequirement
+from pip._internal.utils.packaging import specifier_contains
 
 from .base import Candidate, CandidateLookup, Requirement, format_name
 
@@ -89,7 +90,7 @@ class SpecifierRequirement(Requirement):
         # prerelease candidates if the user does not expect them.
         assert self._ireq.req, "Specifier-backed ireq is always PEP 508"
         spec = self._ireq.req.specifier
-        return spec.contains(candidate.version, prereleases=True)
+        return specifier_contains(spec, candidate.version)
 
 
 class RequiresPythonRequirement(Requirement):
@@ -120,7 +121,7 @@ class RequiresPythonRequirement(Requirement):
         return str(self)
 
     def get_candidate_lookup(self) -> CandidateLookup:
-        if self.specifier.contains(self._candidate.version, prereleases=True):
+        if specifier_contains(self.specifier, self._candidate.version):
             return self._candidate, None
         return None, None
 
@@ -129,7 +130,7 @@ class RequiresPythonRequirement(Requirement):
         # We can safely always allow prereleases here since PackageFinder
         # already implements the prerelease logic, and would have filtered out
         # prerelease candidates if the user does not expect them.
-        return self.specifier.contains(candidate.version, prereleases=True)
+        return specifier_contains(self.specifier, candidate.version)
 
 
 class UnsatisfiableRequirement(Requirement):
@@ -1,4 +1,5 @@
 import functools
+import itertools
 import logging
 import os
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, cast
@@ -14,9 +15,13 @@ from pip._internal.operations.prepare import RequirementPreparer
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.req.req_set import RequirementSet
 from pip._internal.resolution.base import BaseResolver, InstallRequirementProvider
-from pip._internal.resolution.resolvelib.provider import PipProvider
+from pip._internal.resolution.resolvelib.provider import (
+    PipProvider,
+    ProfilingProvider,
+)
 from pip._internal.resolution.resolvelib.reporter import (
     PipDebuggingReporter,
+    PipProfilingReporter,
     PipReporter,
 )
 
@@ -24,6 +29,7 @@ from .base import Candidate, Requirement
 from .factory import Factory
 
 if TYPE_CHECKING:
+    from pip._vendor.resolvelib.providers import AbstractProvider
     from pip._vendor.resolvelib.resolvers import Result as RLResult
 
     Result = RLResult[Requirement, Candidate, str]
@@ -67,26 +73,48 @@ class Resolver(BaseResolver):
         self.upgrade_strategy = upgrade_strategy
         self._result: Optional[Result] = None
 
+    def _write_profile(self, profiler: PipProfilingReporter) -> None:
+        self.factory.profiler = None
+        hooks = self.factory.session.hooks["response"]
+        if profiler.record_response in hooks:
+            hooks.remove(profiler.record_response)
+        try:
+            profiler.write()
+        except OSError as e:
+            logger.warning("Could not write resolver profile %s: %s", profiler.path, e)
+        else:
+            logger.info("Resolver profile written to %s", profiler.path)
+
     def resolve(
         self, root_reqs: List[InstallRequirement], check_supported_wheels: bool
     ) -> RequirementSet:
         collected = self.factory.collect_root_requirements(root_reqs)
-        provider = PipProvider(
+        provider: "AbstractProvider[Requirement, Candidate, str]" = PipProvider(
             factory=self.factory,
             constraints=collected.constraints,
             ignore_dependencies=self.ignore_dependencies,
             upgrade_strategy=self.upgrade_strategy,
             user_requested=collected.user_requested,
         )
+        profiler: Optional[PipProfilingReporter] = None
         if "PIP_RESOLVER_DEBUG" in os.environ:
             reporter: BaseReporter = PipDebuggingReporter()
+        elif os.environ.get("PIP_RESOLVER_PROFILE"):
+            reporter = profiler = PipProfilingReporter(
+                os.environ["PIP_RESOLVER_PROFILE"]
+            )
         else:
             reporter = PipReporter()
+        if profiler is not None:
+            self.factory.profiler = profiler
+            self.factory.session.hooks["response"].append(profiler.record_response)
+            provider = ProfilingProvider(provider, profiler)
         resolver: RLResolver[Requirement, Candidate, str] = RLResolver(
             provider,
             reporter,
         )
 
+        self.factory.prefetch_candidates(collected.requirements)
         try:
             limit_how_complex_resolution_can_be = 200000
             result = self._result = resolver.resolve(
@@ -99,6 +127,10 @@ class Resolver(BaseResolver):
                 collected.constraints,
             )
             raise error from e
+        finally:
+            self.factory.cancel_prefetch()
+            if profiler is not None:
+                self._write_profile(profiler)
 
         req_set = RequirementSet(check_supported_wheels=check_supported_wheels)
         for candidate in result.mapping.values():
@@ -179,13 +211,28 @@ class Resolver(BaseResolver):
         arbitrary points. We make no guarantees about where the cycle
         would be broken, other than it *would* be broken.
         """
+        return [
+            ireq for group in self.get_installation_groups(req_set) for ireq in group
+        ]
+
+    def get_installation_groups(
+        self, req_set: RequirementSet
+    ) -> List[List[InstallRequirement]]:
+        """Get groups of requirements that may be installed concurrently.
+
+        Requirements are ordered as in get_installation_order(), and grouped
+        by topological weight: two requirements with the same weight cannot
+        depend on each other, unless they are part of a dependency cycle.
+        """
         assert self._result is not None, "must call resolve() first"
 
         if not req_set.requirements:
             # Nothing is left to install, so we do not need an order.
             return []
 
-        graph = self._result.graph
+        # get_topological_weights() prunes the graph it is given, so work on
+        # a copy to keep the result usable for further calls.
+        graph = self._result.graph.copy()
         weights = get_topological_weights(graph, set(req_set.requirements.keys()))
 
         sorted_items = sorted(
@@ -193,7 +240,12 @@ class Resolver(BaseResolver):
             key=functools.partial(_req_set_item_sorter, weights=weights),
             reverse=True,
         )
-        return [ireq for _, ireq in sorted_items]
+        groups: List[List[InstallRequirement]] = []
+        for _, items in itertools.groupby(
+            sorted_items, key=lambda item: weights[canonicalize_name(item[0])]
+        ):
+            groups.append([ireq for _, ireq in items])
+        return groups
 
 
 def get_topological_weights(
@@ -5,21 +5,19 @@ import json
 import logging
 import optparse
 import os.path
+import subprocess
 import sys
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from pip._vendor.packaging.version import parse as parse_version
 from pip._vendor.rich.console import Group
 from pip._vendor.rich.markup import escape
 from pip._vendor.rich.text import Text
 
-from pip._internal.index.collector import LinkCollector
-from pip._internal.index.package_finder import PackageFinder
+from pip import __file__ as pip_location
 from pip._internal.metadata import get_default_environment
 from pip._internal.metadata.base import DistributionVersion
-from pip._internal.models.selection_prefs import SelectionPreferences
-from pip._internal.network.session import PipSession
 from pip._internal.utils.compat import WINDOWS
 from pip._internal.utils.entrypoints import (
     get_best_invocation_for_this_pip,
@@ -28,8 +26,24 @@ from pip._internal.utils.entrypoints import (
 from pip._internal.utils.filesystem import adjacent_tmp_file, check_path_owner, replace
 from pip._internal.utils.misc import ensure_dir
 
+if TYPE_CHECKING:
+    from pip._internal.network.session import PipSession
+
 _DATE_FMT = "%Y-%m-%dT%H:%M:%SZ"
 
+# How long to wait for a background refresh before starting another one, in
+# case the last one failed.
+_REFRESH_RETRY_SECONDS = 60 * 60
+
+# Run in a detached interpreter to refresh the state file. It is given the
+# directory to import pip from, and the command's options on stdin.
+_REFRESH_SCRIPT = """\
+import sys
+sys.path.insert(0, sys.argv[1])
+from pip._internal.self_outdated_check import refresh_remote_version
+refresh_remote_version()
+"""
+
 
 logger = logging.getLogger(__name__)
 
@@ -84,26 +98,53 @@ class SelfCheckState:
         return self._state["pypi_version"]
 
     def set(self, pypi_version: str, current_time: datetime.datetime) -> None:
+        state = {
+            # Include the key so it's easy to tell which pip wrote the
+            # file.
+            "key": self.key,
+            "last_check": current_time.strftime(_DATE_FMT),
+            "pypi_version": pypi_version,
+        }
+        self._save(state)
+
+    def start_refresh(self, current_time: datetime.datetime) -> bool:
+        """Record that the remote version is being refreshed in the background.
+
+        Returns False if the state cannot be saved, or if another refresh
+        started recently and may still be running.
+        """
+        if not self._statefile_path:
+            return False
+
+        refresh_started = self._state.get("refresh_started")
+        if refresh_started is not None:
+            try:
+                started = datetime.datetime.strptime(refresh_started, _DATE_FMT)
+            except (TypeError, ValueError):
+                pass
+            else:
+                seconds_since_start = (current_time - started).total_seconds()
+                if 0 <= seconds_since_start < _REFRESH_RETRY_SECONDS:
+                    return False
+
+        state = dict(self._state)
+        state["key"] = self.key
+        state["refresh_started"] = current_time.strftime(_DATE_FMT)
+        return self._save(state)
+
+    def _save(self, state: Dict[str, Any]) -> bool:
         # If we do not have a path to cache in, don't bother saving.
         if not self._statefile_path:
-            return
+            return False
 
         # Check to make sure that we own the directory
         if not check_path_owner(os.path.dirname(self._statefile_path)):
-            return
+            return False
 
         # Now that we've ensured the directory is owned by this user, we'll go
         # ahead and make sure that all our directories are created.
         ensure_dir(os.path.dirname(self._statefile_path))
 
-        state = {
-            # Include the key so it's easy to tell which pip wrote the
-            # file.
-            "key": self.key,
-            "last_check": current_time.strftime(_DATE_FMT),
-            "pypi_version": pypi_version,
-        }
-
         text = json.dumps(state, sort_keys=True, separators=(",", ":"))
 
         with adjacent_tmp_file(self._statefile_path) as f:
@@ -115,7 +156,9 @@ class SelfCheckState:
             replace(f.name, self._statefile_path)
         except OSError:
             # Best effort.
-            pass
+            return False
+        self._state = state
+        return True
 
 
 @dataclass
@@ -154,8 +197,12 @@ def was_installed_by_pip(pkg: str) -> bool:
 
 
 def _get_current_remote_pip_version(
-    session: PipSession, options: optparse.Values
+    session: "PipSession", options: optparse.Values
 ) -> Optional[str]:
+    from pip._internal.index.collector import LinkCollector
+    from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.models.selection_prefs import SelectionPreferences
+
     # Lets use PackageFinder to see what the latest pip version is
     link_collector = LinkCollector.create(
         session,
@@ -181,6 +228,74 @@ def _get_current_remote_pip_version(
     return str(best_candidate.version)
 
 
+def _start_refresh(
+    state: SelfCheckState, options: optparse.Values, current_time: datetime.datetime
+) -> None:
+    """Refresh the remote version in a detached process.
+
+    The command does not wait for it, and the refreshed version is used by
+    the commands run after it.
+    """
+    if not state.start_refresh(current_time):
+        logger.debug("Not refreshing the remote version of pip")
+        return
+
+    # Options that cannot be serialized are not needed to find pip.
+    options_json = json.dumps(vars(options), default=lambda _: None)
+    kwargs: Dict[str, Any] = {}
+    if WINDOWS:
+        kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS  # type: ignore[attr-defined]
+            | subprocess.CREATE_NEW_PROCESS_GROUP  # type: ignore[attr-defined]
+        )
+    else:
+        kwargs["start_new_session"] = True
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            _REFRESH_SCRIPT,
+            os.path.dirname(os.path.dirname(pip_location)),
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs,
+    )
+    # The options go through stdin to keep credentials in index URLs off the
+    # command line.
+    assert process.stdin is not None
+    try:
+        with process.stdin:
+            process.stdin.write(options_json.encode())
+    except OSError:
+        pass
+    logger.debug("Refreshing the remote version of pip in process %d", process.pid)
+
+
+def refresh_remote_version() -> None:
+    """Find the latest version of pip and save it in the state file.
+
+    This is what the detached process started by a command runs, with the
+    command's options on stdin.
+    """
+    from pip._internal.cli.req_command import SessionCommandMixin
+
+    options = optparse.Values(json.load(sys.stdin))
+    session = SessionCommandMixin()._build_session(
+        options,
+        retries=0,
+        # This is set to ensure the function does not fail when truststore is
+        # specified in use-feature but cannot be loaded.
+        fallback_to_certifi=True,
+    )
+    with session:
+        remote_version = _get_current_remote_pip_version(session, options)
+    if remote_version is not None:
+        state = SelfCheckState(cache_dir=options.cache_dir)
+        state.set(remote_version, datetime.datetime.utcnow())
+
+
 def _self_version_check_logic(
     *,
     state: SelfCheckState,
@@ -215,24 +330,29 @@ def _self_version_check_logic(
     return None
 
 
-def pip_self_version_check(session: PipSession, options: optparse.Values) -> None:
+def pip_self_version_check(options: optparse.Values) -> None:
     """Check for an update for pip.
 
     Limit the frequency of checks to once per week. State is stored either in
     the active virtualenv or in the user's USER_CACHE_DIR keyed off the prefix
     of the pip script path.
+
+    The command never waits for the index: when the state is out of date, it
+    is refreshed in the background, for the commands run after this one.
     """
     installed_dist = get_default_environment().get_distribution("pip")
     if not installed_dist:
         return
 
     try:
+        state = SelfCheckState(cache_dir=options.cache_dir)
+        current_time = datetime.datetime.utcnow()
         upgrade_prompt = _self_version_check_logic(
-            state=SelfCheckState(cache_dir=options.cache_dir),
-            current_time=datetime.datetime.utcnow(),
+            state=state,
+            current_time=current_time,
             local_version=installed_dist.version,
             get_remote_version=functools.partial(
-                _get_current_remote_pip_version, session, options
+                _start_refresh, state, options, current_time
             ),
         )
         if upgrade_prompt is not None:
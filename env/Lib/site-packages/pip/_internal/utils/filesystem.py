@@ -1,13 +1,13 @@
 import fnmatch
+import functools
 import os
 import os.path
 import random
+import shutil
 import sys
 from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
-from typing import Any, BinaryIO, Generator, List, Union, cast
-
-from pip._vendor.tenacity import retry, stop_after_delay, wait_fixed
+from typing import Any, BinaryIO, Callable, Generator, List, Union, cast
 
 from pip._internal.utils.compat import get_path_uid
 from pip._internal.utils.misc import format_size
@@ -65,10 +65,34 @@ def adjacent_tmp_file(path: str, **kwargs: Any) -> Generator[BinaryIO, None, Non
             os.fsync(result.fileno())
 
 
-# Tenacity raises RetryError by default, explicitly raise the original exception
-_replace_retry = retry(reraise=True, stop=stop_after_delay(1), wait=wait_fixed(0.25))
+def replace(src: str, dest: str) -> None:
+    _get_retrying_replace()(src, dest)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_retrying_replace() -> Callable[[str, str], None]:
+    # Tenacity is only imported once something is actually replaced.
+    from pip._vendor.tenacity import retry, stop_after_delay, wait_fixed
+
+    # Tenacity raises RetryError by default, explicitly raise the original exception
+    return retry(reraise=True, stop=stop_after_delay(1), wait=wait_fixed(0.25))(
+        os.replace
+    )
 
-replace = _replace_retry(os.replace)
+
+def link_or_copy(src: str, dest: str) -> None:
+    """Hard link src to dest, or copy it if a link cannot be made.
+
+    Links cannot be made across file systems, or on file systems that do not
+    support them. An existing dest is replaced.
+    """
+    try:
+        os.link(src, dest)
+    except FileExistsError:
+        os.unlink(dest)
+        link_or_copy(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
 
 
 # test_writable_dir and _test_writable_dir_win are copied from Flit,
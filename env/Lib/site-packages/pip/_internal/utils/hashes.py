@@ -63,16 +63,18 @@ class Hashes:
     def digest_count(self) -> int:
         return sum(len(digests) for digests in self._allowed.values())
 
+    def digests(self, hash_name: str) -> List[str]:
+        """Return the allowed hex digests for the given algorithm."""
+        return self._allowed.get(hash_name, [])
+
     def is_hash_allowed(self, hash_name: str, hex_digest: str) -> bool:
         """Return whether the given hex digest is allowed."""
         return hex_digest in self._allowed.get(hash_name, [])
 
-    def check_against_chunks(self, chunks: Iterable[bytes]) -> None:
-        """Check good hashes against ones built from iterable of chunks of
-        data.
-
-        Raise HashMismatch if none match.
+    def new_hashers(self) -> Dict[str, "_Hash"]:
+        """Make a hash object for each algorithm I know good hashes for.
 
+        Feed them data, then pass them to ``check_against_hashers()``.
         """
         gots = {}
         for hash_name in self._allowed.keys():
@@ -80,16 +82,34 @@ class Hashes:
                 gots[hash_name] = hashlib.new(hash_name)
             except (ValueError, TypeError):
                 raise InstallationError(f"Unknown hash name: {hash_name}")
+        return gots
 
-        for chunk in chunks:
-            for hash in gots.values():
-                hash.update(chunk)
+    def check_against_hashers(self, gots: Dict[str, "_Hash"]) -> None:
+        """Check good hashes against hash objects from ``new_hashers()``.
+
+        Raise HashMismatch if none match.
 
+        """
         for hash_name, got in gots.items():
             if got.hexdigest() in self._allowed[hash_name]:
                 return
         self._raise(gots)
 
+    def check_against_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Check good hashes against ones built from iterable of chunks of
+        data.
+
+        Raise HashMismatch if none match.
+
+        """
+        gots = self.new_hashers()
+
+        for chunk in chunks:
+            for hash in gots.values():
+                hash.update(chunk)
+
+        self.check_against_hashers(gots)
+
     def _raise(self, gots: Dict[str, "_Hash"]) -> "NoReturn":
         raise HashMismatch(self._allowed, gots)
 
@@ -8,7 +8,7 @@ import threading
 from dataclasses import dataclass
 from io import TextIOWrapper
 from logging import Filter
-from typing import Any, ClassVar, Generator, List, Optional, TextIO, Type
+from typing import Any, ClassVar, Generator, Iterable, List, Optional, TextIO, Type
 
 from pip._vendor.rich.console import (
     Console,
@@ -70,6 +70,33 @@ def get_indentation() -> int:
     return getattr(_log_state, "indentation", 0)
 
 
+@contextlib.contextmanager
+def capture_logs(records: List[logging.LogRecord]) -> Generator[None, None, None]:
+    """
+    A context manager which will cause the log records emitted by the current
+    thread inside it to be appended to records, instead of being output.
+
+    The records can be output later on with emit_captured_logs(). This keeps
+    the output of work running concurrently in other threads in one piece.
+    """
+    previous = getattr(_log_state, "captured", None)
+    _log_state.captured = records
+    try:
+        yield
+    finally:
+        _log_state.captured = previous
+
+
+def is_capturing_logs() -> bool:
+    return getattr(_log_state, "captured", None) is not None
+
+
+def emit_captured_logs(records: Iterable[logging.LogRecord]) -> None:
+    """Output log records previously collected by capture_logs()."""
+    for record in records:
+        logging.getLogger(record.name).handle(record)
+
+
 class IndentingFormatter(logging.Formatter):
     default_time_format = "%Y-%m-%dT%H:%M:%S"
 
@@ -203,6 +230,22 @@ class BetterRotatingFileHandler(logging.handlers.RotatingFileHandler):
         return super()._open()
 
 
+class CaptureFilter(Filter):
+    """
+    A logging Filter that diverts records emitted inside capture_logs() to
+    the list of captured records.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        captured = getattr(_log_state, "captured", None)
+        if captured is None:
+            return True
+        # Every handler sees the same record, so only keep it once.
+        if not captured or captured[-1] is not record:
+            captured.append(record)
+        return False
+
+
 class MaxLevelFilter(Filter):
     def __init__(self, level: int) -> None:
         self.level = level
@@ -277,6 +320,9 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
             "version": 1,
             "disable_existing_loggers": False,
             "filters": {
+                "capture": {
+                    "()": "pip._internal.utils.logging.CaptureFilter",
+                },
                 "exclude_warnings": {
                     "()": "pip._internal.utils.logging.MaxLevelFilter",
                     "level": logging.WARNING,
@@ -307,7 +353,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "class": handler_classes["stream"],
                     "no_color": no_color,
                     "stream": log_streams["stdout"],
-                    "filters": ["exclude_subprocess", "exclude_warnings"],
+                    "filters": ["capture", "exclude_subprocess", "exclude_warnings"],
                     "formatter": "indent",
                 },
                 "console_errors": {
@@ -315,7 +361,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "class": handler_classes["stream"],
                     "no_color": no_color,
                     "stream": log_streams["stderr"],
-                    "filters": ["exclude_subprocess"],
+                    "filters": ["capture", "exclude_subprocess"],
                     "formatter": "indent",
                 },
                 # A handler responsible for logging to the console messages
@@ -325,7 +371,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "class": handler_classes["stream"],
                     "stream": log_streams["stderr"],
                     "no_color": no_color,
-                    "filters": ["restrict_to_subprocess"],
+                    "filters": ["capture", "restrict_to_subprocess"],
                     "formatter": "indent",
                 },
                 "user_log": {
@@ -334,6 +380,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: Optional[str])
                     "filename": additional_log_file,
                     "encoding": "utf-8",
                     "delay": True,
+                    "filters": ["capture"],
                     "formatter": "indent_with_timestamp",
                 },
             },
@@ -1,5 +1,6 @@
 import contextlib
 import errno
+import functools
 import getpass
 import hashlib
 import io
@@ -34,7 +35,6 @@ from typing import (
 )
 
 from pip._vendor.pyproject_hooks import BuildBackendHookCaller
-from pip._vendor.tenacity import retry, stop_after_delay, wait_fixed
 
 from pip import __version__
 from pip._internal.exceptions import CommandError, ExternallyManagedEnvironment
@@ -120,10 +120,23 @@ def get_prog() -> str:
     return "pip"
 
 
-# Retry every half second for up to 3 seconds
-# Tenacity raises RetryError by default, explicitly raise the original exception
-@retry(reraise=True, stop=stop_after_delay(3), wait=wait_fixed(0.5))
 def rmtree(dir: str, ignore_errors: bool = False) -> None:
+    _get_retrying_rmtree()(dir, ignore_errors)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_retrying_rmtree() -> Callable[[str, bool], None]:
+    # Tenacity is only imported once something is actually removed.
+    from pip._vendor.tenacity import retry, stop_after_delay, wait_fixed
+
+    # Retry every half second for up to 3 seconds
+    # Tenacity raises RetryError by default, explicitly raise the original exception
+    return retry(reraise=True, stop=stop_after_delay(3), wait=wait_fixed(0.5))(
+        _rmtree
+    )
+
+
+def _rmtree(dir: str, ignore_errors: bool) -> None:
     if sys.version_info >= (3, 12):
         shutil.rmtree(dir, ignore_errors=ignore_errors, onexc=rmtree_errorhandler)
     else:
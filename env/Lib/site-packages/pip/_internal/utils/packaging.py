@@ -1,16 +1,21 @@
 import functools
 import logging
 import re
-from typing import NewType, Optional, Tuple, cast
+from typing import TYPE_CHECKING, NewType, Optional, Tuple, Union, cast
 
 from pip._vendor.packaging import specifiers, version
-from pip._vendor.packaging.requirements import Requirement
+
+if TYPE_CHECKING:
+    from pip._vendor.packaging.requirements import Requirement
 
 NormalizedExtra = NewType("NormalizedExtra", str)
 
+ParsedVersion = Union[version.LegacyVersion, version.Version]
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
 def check_requires_python(
     requires_python: Optional[str], version_info: Tuple[int, ...]
 ) -> bool:
@@ -28,15 +33,61 @@ def check_requires_python(
     if requires_python is None:
         # The package provides no information
         return True
-    requires_python_specifier = specifiers.SpecifierSet(requires_python)
+    requires_python_specifier = get_specifier(requires_python)
 
-    python_version = version.parse(".".join(map(str, version_info)))
+    python_version = get_version(".".join(map(str, version_info)))
     return python_version in requires_python_specifier
 
 
 @functools.lru_cache(maxsize=512)
-def get_requirement(req_string: str) -> Requirement:
+def get_version(version_string: str) -> ParsedVersion:
+    """Parse a version string, sharing the object between recent calls with
+    equal strings.
+
+    Versions are immutable, so the objects can be shared freely. Besides
+    saving the parse, this avoids keeping many copies of versions that are
+    seen over and over, e.g. those of candidates across many index pages.
+    """
+    return version.parse(version_string)
+
+
+@functools.lru_cache(maxsize=512)
+def get_specifier(specifier_string: str) -> specifiers.SpecifierSet:
+    """Construct a SpecifierSet, sharing the object between recent calls with
+    equal strings.
+
+    The returned object is shared, and must not be modified.
+    """
+    return specifiers.SpecifierSet(specifier_string)
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _specifier_contains(specifier_string: str, candidate: ParsedVersion) -> bool:
+    return get_specifier(specifier_string).contains(candidate, prereleases=True)
+
+
+def specifier_contains(
+    specifier: specifiers.SpecifierSet, candidate: ParsedVersion
+) -> bool:
+    """Whether a version is in a specifier set, always allowing pre-releases.
+
+    The same specifiers are checked against the same versions many times
+    during resolution, so the results are cached. Specifier sets are keyed by
+    their string form, since hashing them is about as costly as the check.
+    Versions are keyed by value, which "===" does not go by (1.0 and 1.0.0 are
+    equal, yet only one of them is "===1.0"), so such sets are not cached.
+    """
+    specifier_string = str(specifier)
+    if "===" in specifier_string:
+        return specifier.contains(candidate, prereleases=True)
+    return _specifier_contains(specifier_string, candidate)
+
+
+@functools.lru_cache(maxsize=512)
+def get_requirement(req_string: str) -> "Requirement":
     """Construct a packaging.Requirement object with caching"""
+    from pip._vendor.packaging.requirements import Requirement
+
     # Parsing requirement strings is expensive, and is also expected to happen
     # with a low diversity of different arguments (at least relative the number
     # constructed). This method adds a cache to requirement object creation to
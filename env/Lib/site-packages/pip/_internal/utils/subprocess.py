@@ -1,11 +1,14 @@
+import contextlib
 import logging
 import os
 import shlex
 import subprocess
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Generator,
     Iterable,
     List,
     Mapping,
@@ -28,6 +31,8 @@ if TYPE_CHECKING:
 
 CommandArgs = List[Union[str, HiddenText]]
 
+_environ_state = threading.local()
+
 
 def make_command(*args: Union[str, HiddenText, CommandArgs]) -> CommandArgs:
     """
@@ -68,6 +73,24 @@ def reveal_command_args(args: Union[List[str], CommandArgs]) -> List[str]:
     return [arg.secret if isinstance(arg, HiddenText) else arg for arg in args]
 
 
+@contextlib.contextmanager
+def subprocess_environ(environ: Mapping[str, str]) -> Generator[None, None, None]:
+    """
+    A context manager which will cause subprocesses started by the current
+    thread through call_subprocess() to see the given environment variables,
+    on top of os.environ.
+
+    Unlike modifying os.environ, this is safe while other threads also start
+    subprocesses.
+    """
+    previous = getattr(_environ_state, "environ", {})
+    _environ_state.environ = {**previous, **environ}
+    try:
+        yield
+    finally:
+        _environ_state.environ = previous
+
+
 def call_subprocess(
     cmd: Union[List[str], CommandArgs],
     show_stdout: bool = False,
@@ -133,6 +156,7 @@ def call_subprocess(
 
     log_subprocess("Running command %s", command_desc)
     env = os.environ.copy()
+    env.update(getattr(_environ_state, "environ", {}))
     if extra_environ:
         env.update(extra_environ)
     for name in unset_environ:
@@ -1,6 +1,7 @@
 """Utilities related archives.
 """
 
+import functools
 import logging
 import os
 import shutil
@@ -40,8 +41,13 @@ except ImportError:
     logger.debug("lzma module is not available")
 
 
+@functools.lru_cache(maxsize=None)
 def current_umask() -> int:
-    """Get the current umask which involves having to set it temporarily."""
+    """Get the current umask which involves having to set it temporarily.
+
+    The result is cached: pip never changes the umask, and setting it
+    temporarily is unsafe while other threads may be creating files.
+    """
     mask = os.umask(0)
     os.umask(mask)
     return mask
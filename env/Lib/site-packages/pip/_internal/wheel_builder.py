@@ -5,7 +5,8 @@ import logging
 import os.path
 import re
 import shutil
-from typing import Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import ContextManager, Iterable, Iterator, List, Optional, Tuple
 
 from pip._vendor.packaging.utils import canonicalize_name, canonicalize_version
 from pip._vendor.packaging.version import InvalidVersion, Version
@@ -19,10 +20,14 @@ from pip._internal.operations.build.wheel import build_wheel_pep517
 from pip._internal.operations.build.wheel_editable import build_wheel_editable
 from pip._internal.operations.build.wheel_legacy import build_wheel_legacy
 from pip._internal.req.req_install import InstallRequirement
-from pip._internal.utils.logging import indent_log
+from pip._internal.utils.logging import (
+    capture_logs,
+    emit_captured_logs,
+    indent_log,
+)
 from pip._internal.utils.misc import ensure_dir, hash_file
 from pip._internal.utils.setuptools_build import make_setuptools_clean_args
-from pip._internal.utils.subprocess import call_subprocess
+from pip._internal.utils.subprocess import call_subprocess, subprocess_environ
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.utils.urls import path_to_url
 from pip._internal.vcs import vcs
@@ -32,6 +37,9 @@ logger = logging.getLogger(__name__)
 _egg_info_re = re.compile(r"([a-z0-9_.]+)-([a-z0-9_.!+-]+)", re.IGNORECASE)
 
 BuildResult = Tuple[List[InstallRequirement], List[InstallRequirement]]
+# A requirement, the directory its wheel was built into, and the path of the
+# built wheel (None if the build failed).
+BuiltWheel = Tuple[InstallRequirement, str, Optional[str]]
 
 
 def _contains_egg_info(s: str) -> bool:
@@ -172,9 +180,13 @@ def _build_one(
     build_options: List[str],
     global_options: List[str],
     editable: bool,
+    concurrent: bool = False,
 ) -> Optional[str]:
     """Build one wheel.
 
+    :param concurrent: Whether other builds may be running in other threads.
+        If so, the build environment is only activated for the subprocesses
+        of this build, rather than through os.environ.
     :return: The filename of the built wheel, or None if the build failed.
     """
     artifact = "editable" if editable else "wheel"
@@ -190,7 +202,10 @@ def _build_one(
         return None
 
     # Install build deps into temporary directory (PEP 518)
-    with req.build_env:
+    build_env: ContextManager[None] = req.build_env
+    if concurrent:
+        build_env = subprocess_environ(req.build_env.get_environ())
+    with build_env:
         wheel_path = _build_one_inside_env(
             req, output_dir, build_options, global_options, editable
         )
@@ -291,15 +306,100 @@ def _clean_one_legacy(req: InstallRequirement, global_options: List[str]) -> boo
         return False
 
 
+def _build_one_captured(
+    records: List[logging.LogRecord],
+    req: InstallRequirement,
+    output_dir: str,
+    verify: bool,
+    build_options: List[str],
+    global_options: List[str],
+    editable: bool,
+) -> Optional[str]:
+    with capture_logs(records):
+        return _build_one(
+            req,
+            output_dir,
+            verify,
+            build_options,
+            global_options,
+            editable,
+            concurrent=True,
+        )
+
+
+def _build_serially(
+    requirements: Iterable[InstallRequirement],
+    wheel_cache: WheelCache,
+    verify: bool,
+    build_options: List[str],
+    global_options: List[str],
+) -> Iterator[BuiltWheel]:
+    for req in requirements:
+        assert req.name
+        cache_dir = _get_cache_dir(req, wheel_cache)
+        wheel_file = _build_one(
+            req,
+            cache_dir,
+            verify,
+            build_options,
+            global_options,
+            req.editable and req.permit_editable_wheels,
+        )
+        yield req, cache_dir, wheel_file
+
+
+def _build_concurrently(
+    requirements: List[InstallRequirement],
+    wheel_cache: WheelCache,
+    verify: bool,
+    build_options: List[str],
+    global_options: List[str],
+    build_jobs: int,
+) -> Iterator[BuiltWheel]:
+    """Build wheels on a thread pool, yielding them in the order of
+    requirements.
+
+    The log output of each build is captured, and emitted in one piece when
+    it is that build's turn, so that the output of builds does not interleave.
+    """
+    cache_dirs = [_get_cache_dir(req, wheel_cache) for req in requirements]
+    captured: List[List[logging.LogRecord]] = [[] for _ in requirements]
+    workers = min(build_jobs, len(requirements))
+    with ThreadPoolExecutor(workers, thread_name_prefix="pip-build") as executor:
+        futures = [
+            executor.submit(
+                _build_one_captured,
+                records,
+                req,
+                cache_dir,
+                verify,
+                build_options,
+                global_options,
+                req.editable and req.permit_editable_wheels,
+            )
+            for req, cache_dir, records in zip(requirements, cache_dirs, captured)
+        ]
+        for req, cache_dir, records, future in zip(
+            requirements, cache_dirs, captured, futures
+        ):
+            try:
+                wheel_file = future.result()
+            finally:
+                emit_captured_logs(records)
+            yield req, cache_dir, wheel_file
+
+
 def build(
     requirements: Iterable[InstallRequirement],
     wheel_cache: WheelCache,
     verify: bool,
     build_options: List[str],
     global_options: List[str],
+    build_jobs: int = 1,
 ) -> BuildResult:
     """Build wheels.
 
+    :param build_jobs: The maximum number of wheels to build concurrently.
     :return: The list of InstallRequirement that succeeded to build and
         the list of InstallRequirement that failed to build.
     """
@@ -314,17 +414,21 @@ def build(
 
     with indent_log():
         build_successes, build_failures = [], []
-        for req in requirements:
-            assert req.name
-            cache_dir = _get_cache_dir(req, wheel_cache)
-            wheel_file = _build_one(
-                req,
-                cache_dir,
+        requirements = list(requirements)
+        if build_jobs > 1 and len(requirements) > 1:
+            built = _build_concurrently(
+                requirements,
+                wheel_cache,
                 verify,
                 build_options,
                 global_options,
-                req.editable and req.permit_editable_wheels,
+                build_jobs,
+            )
+        else:
+            built = _build_serially(
+                requirements, wheel_cache, verify, build_options, global_options
             )
+        for req, cache_dir, wheel_file in built:
             if wheel_file:
                 # Record the download origin in the cache
                 if req.download_info is not None: